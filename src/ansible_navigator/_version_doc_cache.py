@@ -5,10 +5,19 @@ Note:
 
     Indicates the version of the schema of the collection doc cache
     this is checked during initialization, if the version of the cache
-    differs from below, the cache will be rebuilt.  This should be
+    differs from below, the cache entries are migrated.  This should be
     incremented when the schema changes and need not correspond to the
     application version, although keeping the major in sync is probably
     not a bad idea to minimize the amount of stale docs in the user's cache
+
+    ``__version_collection_doc_entry__``:
+
+    Indicates the version of the content of each plugin doc in the cache,
+    recorded with every entry as it is extracted. During a migration, only
+    entries with a different version are removed, to be extracted again the
+    next time their collection is cataloged. This should be incremented
+    when the documentation extracted for a plugin changes.
 """
 
-__version_collection_doc_cache__ = "1.1"
+__version_collection_doc_cache__ = "1.2"
+__version_collection_doc_entry__ = "1"
@@ -64,6 +64,7 @@ class ActionRunner(ActionBase):
             color=self._args.display_color,
             colors_initialized=False,
             grammar_dir=GRAMMAR_DIR,
+            max_frame_rate=self._args.max_frame_rate,
             osc4=self._args.osc4,
             terminal_colors_path=TERMINAL_COLORS_PATH,
             theme_path=THEME_PATH,
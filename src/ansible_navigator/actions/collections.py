@@ -13,6 +13,9 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
 
+from ansible_navigator._version_doc_cache import (
+    __version_collection_doc_entry__ as VERSION_CDC_ENTRY,
+)
 from ansible_navigator.action_base import ActionBase
 from ansible_navigator.action_defs import RunStdoutReturn
 from ansible_navigator.content_defs import ContentFormat
@@ -315,7 +318,7 @@ class Action(ActionBase):
 
     def _process_plugin_for_menu(
         self,
-        plugin_checksum: str,
+        plugin_json: str | None,
         details: dict[str, Any],
         selected_collection: dict[str, Any],
         collection_name: str,
@@ -323,7 +326,7 @@ class Action(ActionBase):
         """Process a single plugin entry for the collection content menu.
 
         Args:
-            plugin_checksum: The checksum key for the plugin in the cache
+            plugin_json: The plugin doc from the cache, None if missing from the cache
             details: The plugin details including type information
             selected_collection: The parent collection data
             collection_name: The display column name for the collection
@@ -331,8 +334,11 @@ class Action(ActionBase):
         Returns:
             The processed plugin dict, or None if it could not be loaded
         """
+        if plugin_json is None:
+            self._logger.error("error loading plugin doc %s", details)
+            self._logger.debug("error was plugin doc missing from the cache")
+            return None
         try:
-            plugin_json = self._collection_cache[plugin_checksum]
             loaded = json.loads(plugin_json)
 
             plugin = loaded["plugin"]
@@ -408,9 +414,11 @@ class Action(ActionBase):
         selected_collection = self._collections[self.steps.current.index]
         collection_name = f"__{selected_collection['known_as']}"
         collection_contents = []
-        for plugin_checksum, details in selected_collection["plugin_checksums"].items():
+        plugin_checksums = selected_collection["plugin_checksums"]
+        plugin_docs = self._collection_cache.get_many(plugin_checksums)
+        for plugin_checksum, details in plugin_checksums.items():
             plugin = self._process_plugin_for_menu(
-                plugin_checksum,
+                plugin_docs.get(plugin_checksum),
                 details,
                 selected_collection,
                 collection_name,
@@ -568,6 +576,8 @@ class Action(ActionBase):
             self._adjacent_collection_dir,
             "-c",
             self._collection_cache_path,
+            "-e",
+            VERSION_CDC_ENTRY,
         ]
 
         kwargs["cmdline"] = pass_through_arg
@@ -715,6 +725,13 @@ class Action(ActionBase):
         self._collection_scanned_paths = parsed["collection_scan_paths"].split(":")
         for stat, value in self._stats.items():
             self._logger.debug("%s: %s", stat, value)
+        if self._stats.get("processed"):
+            self._logger.info(
+                "Cached the documentation for %s plugins in %ss, %s plugins/second",
+                self._stats["processed"],
+                self._stats.get("docs_duration"),
+                self._stats.get("plugins_per_second"),
+            )
 
         if not parsed["collections"]:
             env = "execution" if self._args.execution_environment else "local"
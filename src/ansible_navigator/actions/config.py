@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import curses
+import hashlib
+import json
+import os
 import re
 import shlex
 import shutil
+import subprocess
 
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -22,6 +26,7 @@ from ansible_navigator.ui_framework import CursesLines
 from ansible_navigator.ui_framework import Interaction
 from ansible_navigator.ui_framework import nonblocking_notification
 from ansible_navigator.ui_framework import warning_notification
+from ansible_navigator.utils.functions import shlex_join
 from ansible_navigator.utils.serialize import Loader
 from ansible_navigator.utils.serialize import yaml
 
@@ -34,6 +39,25 @@ if TYPE_CHECKING:
     from ansible_navigator.configuration_subsystem.definitions import ApplicationConfiguration
 
 
+parsed_config_cache: dict[str, list[dict[str, Any]]] = {}
+"""The parsed configuration, keyed by a digest of everything ansible-config output depends on"""
+
+
+def file_digest(path: Path) -> str | None:
+    """Compute the digest of a file's content.
+
+    Args:
+        path: The path to the file
+
+    Returns:
+        The digest of the content, or None if the file could not be read
+    """
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
 def color_menu(colno: int, colname: str, entry: dict[str, Any]) -> tuple[int, int]:
     """Provide a color for a collections menu entry in one column.
 
@@ -283,22 +307,24 @@ class Action(ActionBase):
     ) -> None:
         """Run the ansible-config runner in interactive mode.
 
-        Fetches both the list and dump output from ansible-config,
-        logs any errors, and parses/merges the results.
+        Uses the parsed configuration from an earlier request when nothing it
+        depends on has changed. Otherwise fetches both the list and dump output
+        from ansible-config at once, logs any errors, and parses/merges the results.
 
         Args:
             kwargs: The common runner keyword arguments.
         """
+        cache_key = self._cache_key(kwargs)
+        if cache_key is not None and cache_key in parsed_config_cache:
+            self._config = [dict(entry) for entry in parsed_config_cache[cache_key]]
+            self._logger.debug("using the configuration parsed earlier")
+            return
+
         self._runner = AnsibleConfig(**kwargs)
         config_file = self._args.config if isinstance(self._args.config, str) else None
-        list_output, list_output_err = self._runner.fetch_ansible_config(
-            "list",
-            config_file=config_file,
-        )
-        dump_output, dump_output_err = self._runner.fetch_ansible_config(
-            "dump",
-            config_file=config_file,
-        )
+        outputs = self._runner.fetch_ansible_configs(("list", "dump"), config_file=config_file)
+        list_output, list_output_err = outputs["list"]
+        dump_output, dump_output_err = outputs["dump"]
         if list_output_err:
             msg = f"Error occurred while fetching ansible config (list): '{list_output_err}'"
             self._logger.error(msg)
@@ -317,6 +343,86 @@ class Action(ActionBase):
             self._interaction.ui.show_form(warning)
         else:
             self._parse_and_merge(list_output, dump_output)
+            if self._config is not None and cache_key is not None:
+                parsed_config_cache[cache_key] = [dict(entry) for entry in self._config]
+
+    def _cache_key(self, kwargs: dict[str, Any]) -> str | None:
+        """Build the key for the parsed configuration.
+
+        The output of ansible-config depends on the ansible configuration files it may
+        find, the ansible installation or execution environment image, the environment
+        variables and the runner settings.
+
+        Args:
+            kwargs: The common runner keyword arguments.
+
+        Returns:
+            The cache key, or None if the ansible installation could not be identified
+        """
+        installation = self._installation_identity()
+        if installation is None:
+            return None
+
+        cfg_paths = {Path.cwd() / "ansible.cfg"}
+        if isinstance(self._args.internals.ansible_configuration.path, Path):
+            cfg_paths.add(self._args.internals.ansible_configuration.path)
+        if isinstance(self._args.config, str):
+            cfg_paths.add(Path(self._args.config))
+        if "ANSIBLE_CONFIG" in os.environ:
+            cfg_paths.add(Path(os.environ["ANSIBLE_CONFIG"]))
+
+        passed = kwargs["pass_environment_variable"]
+        passed = passed if isinstance(passed, list) else []
+        environment = {
+            name: value
+            for name, value in os.environ.items()
+            if name.startswith("ANSIBLE_") or name in passed
+        }
+        settings = {
+            name: value
+            for name, value in kwargs.items()
+            if name not in ("private_data_dir", "rotate_artifacts", "timeout")
+        }
+        identity = {
+            "ansible_cfg": {str(path): file_digest(path) for path in sorted(cfg_paths)},
+            "config_file": self._args.config,
+            "environment": environment,
+            "installation": installation,
+            "settings": settings,
+        }
+        serialized = json.dumps(identity, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def _installation_identity(self) -> str | None:
+        """Identify the ansible installation ansible-config is run from.
+
+        With an execution environment this is the image ID, otherwise the path and
+        modification time of the local ansible-config executable.
+
+        Returns:
+            The identity of the installation, or None if it could not be determined
+        """
+        if not self._args.execution_environment:
+            exec_path = shutil.which("ansible-config")
+            if exec_path is None:
+                return None
+            return f"{exec_path}:{Path(exec_path).stat().st_mtime_ns}"
+
+        cmd_parts = [
+            str(self._args.container_engine),
+            "image",
+            "inspect",
+            "--format",
+            "{{.Id}}",
+            str(self._args.execution_environment_image),
+        ]
+        self._logger.debug("Command: %s", shlex_join(cmd_parts))
+        try:
+            proc_out = subprocess.run(cmd_parts, check=True, capture_output=True, text=True)
+        except (OSError, subprocess.CalledProcessError) as exc:
+            self._logger.debug("Unable to determine the image ID: %s", str(exc))
+            return None
+        return proc_out.stdout.strip() or None
 
     def _run_runner_stdout(
         self,
@@ -6,8 +6,10 @@ import curses
 import json
 import shlex
 
+from concurrent.futures import Future
 from copy import deepcopy
 from functools import partial
+from threading import Thread
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -16,6 +18,10 @@ from ansible_navigator.action_defs import RunStdoutReturn
 from ansible_navigator.configuration_subsystem import Constants
 from ansible_navigator.content_defs import ContentFormat
 from ansible_navigator.image_manager import inspect_all
+from ansible_navigator.image_manager import introspector
+from ansible_navigator.image_manager.introspection_cache import INTROSPECTION_CACHE_NAME
+from ansible_navigator.image_manager.introspection_cache import IntrospectionCache
+from ansible_navigator.image_manager.introspection_cache import image_identity
 from ansible_navigator.runner import Command
 from ansible_navigator.steps import Step
 from ansible_navigator.ui_framework import CursesLine
@@ -35,6 +41,11 @@ if TYPE_CHECKING:
     from ansible_navigator.configuration_subsystem.definitions import ApplicationConfiguration
 
 
+PREFETCH_TIMEOUT = 300
+"""The time in seconds the primary image may be introspected in the background for, unless the
+ansible-runner timeout is set"""
+
+
 def filter_content_keys(obj: dict[Any, Any]) -> dict[Any, Any]:
     """Filter out some keys when showing image content.
 
@@ -77,6 +88,11 @@ class Action(ActionBase):
             value=[],
             select_func=self._build_image_menu,
         )
+        self._introspection_cache = IntrospectionCache(
+            args.internals.cache_path / INTROSPECTION_CACHE_NAME,
+        )
+        self._prefetched: dict[str, Future[tuple[str, str, int]]] = {}
+        self._prefetch_thread: Thread | None = None
 
     def color_menu(self, colno: int, colname: str, entry: dict[str, Any]) -> tuple[int, int]:
         """Provide a color for a images menu entry in one column.
@@ -252,6 +268,7 @@ class Action(ActionBase):
             self._logger.error(messages[0])
             return None
 
+        self._prefetch_primary()
         self.steps.append(self._images)
 
         while True:
@@ -512,9 +529,7 @@ class Action(ActionBase):
 
         self._images.selected["__introspected"] = True
 
-        output, error, _return_code = self._run_runner(
-            image_name=self._images.selected["__full_name"],
-        )
+        output, error, _return_code = self._introspection_output(self._images.selected)
 
         if error:
             self._logger.error(
@@ -551,6 +566,92 @@ class Action(ActionBase):
             return False
         return True
 
+    def _introspection_output(self, image: dict[str, Any]) -> tuple[str, str, int]:
+        """Get the introspection output of an image, from the cache if it was introspected.
+
+        Args:
+            image: The image from the images list
+
+        Returns:
+            Output, errors and the return code
+        """
+        image_id = image_identity(image)
+        if not self._args.images_refresh:
+            output = self._introspection_cache.get(image_id)
+            if output is not None:
+                self._logger.debug("Using cached introspection for image %s", image_id)
+                return output, "", 0
+        prefetched = self._prefetched.pop(image_id, None)
+        if prefetched is not None:
+            output, error, return_code = prefetched.result()
+            if not error and not return_code:
+                return output, error, return_code
+            self._logger.debug("Introspection in the background failed for image %s", image_id)
+        return self._introspect_and_cache(image_name=image["__full_name"], image_id=image_id)
+
+    def _introspect_and_cache(
+        self,
+        image_name: str,
+        image_id: str,
+        timeout: int | None = None,
+    ) -> tuple[str, str, int]:
+        """Introspect an image and cache the output if it can be parsed.
+
+        Args:
+            image_name: The full image name
+            image_id: The image ID
+            timeout: The time in seconds the introspection may take, None for no limit
+
+        Returns:
+            Output, errors and the return code
+        """
+        output, error, return_code = self._run_runner(image_name=image_name, timeout=timeout)
+        if not error and not return_code and introspector.parse(output)[1]:
+            self._introspection_cache.put(image_id, output)
+        return output, error, return_code
+
+    def _prefetch_primary(self) -> None:
+        """Introspect the primary execution environment image in the background.
+
+        The primary image is the one most often explored, its details are ready or
+        underway by the time it is selected, a selection before then waits for them. The
+        thread is not a daemon, so the introspection container is cleaned up before the
+        application exits, and the run is limited to the ansible-runner timeout or
+        :data:`PREFETCH_TIMEOUT`. Each introspection is run in its own temporary private
+        data directory, so artifact rotation cannot remove those of another run.
+        """
+        primary = next(
+            (
+                image
+                for image in self._images.value
+                if image["__full_name"] == self._args.execution_environment_image
+                and image["execution_environment"]
+            ),
+            None,
+        )
+        if primary is None:
+            return
+        image_id = image_identity(primary)
+        if not self._args.images_refresh and self._introspection_cache.get(image_id) is not None:
+            return
+
+        image_name = primary["__full_name"]
+        timeout = self._args.ansible_runner_timeout
+        if not isinstance(timeout, int):
+            timeout = PREFETCH_TIMEOUT
+        future: Future[tuple[str, str, int]] = Future()
+
+        def introspect() -> None:
+            """Introspect the primary image and resolve the future with the result."""
+            try:
+                future.set_result(self._introspect_and_cache(image_name, image_id, timeout))
+            except Exception as exc:  # noqa: BLE001
+                future.set_exception(exc)
+
+        self._prefetched[image_id] = future
+        self._prefetch_thread = Thread(target=introspect, name="introspect-primary")
+        self._prefetch_thread.start()
+
     def _parse(self, output: str) -> dict[Any, Any] | None:
         """Load and process the ``json`` output from the image introspection process.
 
@@ -586,6 +687,7 @@ class Action(ActionBase):
         self,
         image_name: str,
         sections: list[str] | None = None,
+        timeout: int | None = None,
     ) -> tuple[str, str, int]:
         """Run runner to collect image details.
 
@@ -594,6 +696,7 @@ class Action(ActionBase):
             sections: Optional list of introspection sections to collect.
                 When provided, only the named collectors run inside the
                 container instead of all of them.
+            timeout: The time in seconds the introspection may take, None for no limit
 
         Returns:
             Output, errors and the return code
@@ -617,6 +720,8 @@ class Action(ActionBase):
 
         if isinstance(self._args.container_options, list):
             kwargs.update({"container_options": self._args.container_options})
+        if timeout is not None:
+            kwargs.update({"timeout": timeout})
 
         self._logger.debug(
             "Invoke runner with executable_cmd: %s and kwargs: %s",
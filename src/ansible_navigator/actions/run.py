@@ -15,7 +15,9 @@ import uuid
 from math import floor
 from operator import itemgetter
 from pathlib import Path
+from queue import Empty
 from queue import Queue
+from threading import Event
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -23,8 +25,6 @@ from ansible_navigator.action_base import ActionBase
 from ansible_navigator.action_defs import RunStdoutReturn
 from ansible_navigator.configuration_subsystem import to_effective
 from ansible_navigator.configuration_subsystem import to_sources
-from ansible_navigator.content_defs import ContentView
-from ansible_navigator.content_defs import SerializationFormat
 from ansible_navigator.runner import CommandAsync
 from ansible_navigator.steps import Step
 from ansible_navigator.ui_framework import CursesLine
@@ -42,7 +42,17 @@ from ansible_navigator.utils.functions import is_jinja
 from ansible_navigator.utils.functions import now_iso
 from ansible_navigator.utils.functions import remove_ansi
 from ansible_navigator.utils.functions import round_half_up
-from ansible_navigator.utils.serialize import serialize_write_file
+from ansible_navigator.utils.playbook_artifact import ARTIFACT_VERSION
+from ansible_navigator.utils.playbook_artifact import ArtifactWriter
+from ansible_navigator.utils.playbook_artifact import IndexedArtifact
+from ansible_navigator.utils.playbook_artifact import TaskRow
+from ansible_navigator.utils.playbook_artifact import TaskStore
+from ansible_navigator.utils.playbook_artifact import TaskSummaries
+from ansible_navigator.utils.playbook_artifact import full_tasks
+from ansible_navigator.utils.playbook_artifact import is_streaming_artifact
+from ansible_navigator.utils.playbook_artifact import load_streaming_artifact
+from ansible_navigator.utils.playbook_artifact import open_artifact
+from ansible_navigator.utils.playbook_artifact import write_json_artifact
 
 from . import _actions as actions
 from . import run_action
@@ -57,6 +67,12 @@ if TYPE_CHECKING:
 
 COLUMN_IN_PROGRESS = "__in progress"
 
+TASK_IN_PROGRESS = "In progress"
+"""The result of a task that has started but not finished"""
+
+EVENT_WAIT = 0.1
+"""The time in seconds to wait for runner events before updating again"""
+
 RESULT_TO_COLOR = [
     ("(?i)^failed$", 9),
     ("(?i)^ok$", 10),
@@ -226,6 +242,9 @@ PLAY_COLUMNS = [
     "__progress",
 ]
 
+TASK_INDEX_KEY = ("task_uuid", "host")
+"""The event data keys used to match a task's finish event with its start event"""
+
 TASK_LIST_COLUMNS = [
     "__result",
     "__host",
@@ -259,11 +278,15 @@ class Action(ActionBase):
         self._subaction_type: str
         self._msg_from_plays: tuple[str | None, int | None] = (None, None)
         self._queue: Queue[dict[str, str]] = Queue()
+        #: Set by the runner when it posts an event, cleared as the queue is drained
+        self._events_queued = Event()
         self.runner: CommandAsync
         self._runner_finished: bool
         self._auto_scroll = False
         #: Flag when the first message is received from runner
         self._first_message_received: bool = False
+        #: When the queue was first left with pending events, None if fully drained
+        self._drain_behind_since: float | None = None
 
         self._plays = Step(
             name="plays",
@@ -278,6 +301,16 @@ class Action(ActionBase):
         self._playbook_type: str = check_playbook_type(self._args.playbook)
         self._task_cache: dict[str, str] = {}
         """Task name storage from playbook_on_start using the task uuid as the key"""
+        self._play_index: dict[str, dict[str, Any]] = {}
+        """Play lookup using the play uuid as the key, kept alongside ``self._plays``"""
+        self._task_index: dict[tuple[str, str], TaskRow] = {}
+        """Task lookup using the task uuid and host as the key, kept alongside ``self._plays``"""
+        self._task_store = TaskStore()
+        """The task results, only their menu columns are kept in ``self._plays``"""
+        self._artifact_stream: ArtifactWriter | None = None
+        """The streaming artifact, while the playbook runs"""
+        self._replay_artifact: IndexedArtifact | None = None
+        """The indexed artifact being replayed, its standard output is read when first shown"""
 
     @property
     def mode(self) -> str:
@@ -317,15 +350,17 @@ class Action(ActionBase):
         self._logger = logging.getLogger(f"{__name__}_{self._subaction_type}")
         self._run_runner()
         while True:
+            # the runner posts every event before it finishes, check first to drain them all
+            finished = self.runner.finished
             self._dequeue()
-            if self.runner.finished:
+            if finished:
                 if self._args.playbook_artifact_enable:
                     self.write_artifact()
                 self._logger.debug("runner finished")
                 break
-            # Sleep briefly to prevent 100% CPU utilization
-            # in mode stdout, the delay introduced by the curses key read is not present
-            time.sleep(0.01)
+            # the runner sets the event as it posts events and once it finishes
+            self._wait_for_events(EVENT_WAIT)
+        self._task_store.close()
         return_code = self.runner.ansible_runner_instance.rc
         if return_code != 0:
             return RunStdoutReturn(
@@ -384,7 +419,9 @@ class Action(ActionBase):
             notification = nonblocking_notification(messages=messages)
             interaction.ui.show_form(notification)
             while not self._first_message_received:
+                self._wait_for_events(EVENT_WAIT)
                 self.update()
+            interaction.ui.wake_on(self._pending_update)
 
         while True:
             self.update()
@@ -409,6 +446,18 @@ class Action(ActionBase):
         self._prepare_to_exit(interaction)
         return None
 
+    def _prepare_to_exit(self, interaction: Interaction) -> None:
+        """Prepare for action exit, no longer refreshing the screen for runner events.
+
+        The task store is closed, removing its temporary file.
+
+        Args:
+            interaction: The current interaction from the UI
+        """
+        interaction.ui.wake_on(None)
+        self._task_store.close()
+        super()._prepare_to_exit(interaction)
+
     def _handle_quit(self, interaction: Interaction) -> Interaction | None:
         """Handle quit step logic during the run loop.
 
@@ -559,13 +608,24 @@ class Action(ActionBase):
         if artifact_file is None:
             return False
 
-        try:
-            with Path(artifact_file).open(encoding="utf-8") as fh:
-                data = json.load(fh)
-        except json.JSONDecodeError as exc:
-            self._logger.debug("json decode error: %s", str(exc))
-            self._logger.exception("Unable to parse artifact file")
-            return False
+        data = None
+        if self.mode == "interactive":
+            data = self._index_artifact(Path(artifact_file))
+
+        if data is None:
+            try:
+                if is_streaming_artifact(artifact_file):
+                    data = load_streaming_artifact(
+                        Path(artifact_file),
+                        include_plays=self.mode == "interactive",
+                    )
+                else:
+                    with open_artifact(Path(artifact_file)) as fh:
+                        data = json.load(fh)
+            except (json.JSONDecodeError, EOFError) as exc:
+                self._logger.debug("json decode error: %s", str(exc))
+                self._logger.exception("Unable to parse artifact file")
+                return False
 
         if not self._load_artifact_data(data):
             return False
@@ -574,6 +634,39 @@ class Action(ActionBase):
         self._logger.debug("Completed replay artifact request with mode %s", self.mode)
         return True
 
+    def _index_artifact(self, path: Path) -> dict[str, Any] | None:
+        """Open an artifact for replay using its index, task results are read when shown.
+
+        Args:
+            path: The path to the artifact file
+
+        Returns:
+            The artifact data with task summaries and without standard output, or None
+            if the artifact cannot be indexed
+        """
+        if self._replay_artifact is not None:
+            self._replay_artifact.close()
+            self._replay_artifact = None
+        try:
+            artifact = IndexedArtifact(path)
+        except (OSError, ValueError) as exc:
+            self._logger.debug("Artifact file '%s' not indexed: %s", path, str(exc))
+            return None
+        self._replay_artifact = artifact
+        status, status_color = artifact.status
+        return {
+            "version": artifact.version,
+            "plays": artifact.plays(),
+            "stdout": [],
+            "status": status,
+            "status_color": status_color,
+        }
+
+    def _load_replay_stdout(self) -> None:
+        """Read the standard output of the replayed artifact, if not yet read."""
+        if self._replay_artifact is not None and not self.stdout:
+            self.stdout = self._replay_artifact.stdout()
+
     def _prompt_for_artifact(self, artifact_file: str) -> dict[Any, Any]:
         """Prompt for a valid artifact file.
 
@@ -691,6 +784,7 @@ class Action(ActionBase):
         """Run the current step on the stack."""
         result = None
         if isinstance(self.steps.current, Interaction):
+            self._load_replay_stdout()
             result = run_action(self.steps.current.name, self.app, self.steps.current)
         elif isinstance(self.steps.current, Step):
             result = self._handle_step_display()
@@ -759,27 +853,108 @@ class Action(ActionBase):
             pass_through_arg.extend(self._args.cmdline)
         kwargs.update({"cmdline": pass_through_arg})
 
+        self._open_artifact_stream()
         self.runner = CommandAsync(
             executable_cmd=executable_cmd,
             queue=self._queue,
             write_job_events=self._args.ansible_runner_write_job_events,
+            events_queued=self._events_queued,
             **kwargs,
         )
         self.runner.run()
         self._runner_finished = False
         self._logger.debug("runner requested to start")
 
-    def _dequeue(self) -> None:
-        """Drain the runner queue."""
+    def _dequeue(self, time_budget: float | None = None) -> None:
+        """Drain the runner queue in batches.
+
+        Args:
+            time_budget: The time in seconds to spend draining, None to drain until empty
+        """
+        start = time.monotonic()
         drain_count = 0
-        while not self._queue.empty():
-            if not self._first_message_received:
-                self._first_message_received = True
-            message = self._queue.get()
-            self._handle_message(message)
-            drain_count += 1
+        self._events_queued.clear()
+        while True:
+            batch = self._dequeue_batch()
+            if not batch:
+                break
+            self._first_message_received = True
+            for message in batch:
+                self._handle_message(message)
+            drain_count += len(batch)
+            if time_budget is not None and time.monotonic() - start >= time_budget:
+                break
+
+        if self._queue.empty():
+            self._drain_behind_since = None
+        else:
+            self._events_queued.set()
+            if self._drain_behind_since is None:
+                self._drain_behind_since = start
+
+        if drain_count and self._artifact_stream is not None:
+            self._artifact_stream.flush()
+
         if drain_count:
-            self._logger.debug("Drained %s events", drain_count)
+            self._logger.debug(
+                "Drained %s events, %s pending",
+                drain_count,
+                self._queue.qsize(),
+            )
+
+    def _wait_for_events(self, timeout: float) -> None:
+        """Block until the runner queue has events or the timeout passes.
+
+        Args:
+            timeout: The time in seconds to wait
+        """
+        self._events_queued.wait(timeout)
+
+    def _pending_update(self) -> bool:
+        """Determine if there are runner events or a finished runner not yet handled.
+
+        Returns:
+            True if the user interface should be refreshed
+        """
+        if not hasattr(self, "runner"):
+            return False
+        return self._events_queued.is_set() or (self.runner.finished and not self._runner_finished)
+
+    def _dequeue_batch(self) -> list[dict[str, Any]]:
+        """Take up to the queue batch size of messages from the runner queue without blocking.
+
+        Returns:
+            The messages taken from the queue
+        """
+        batch: list[dict[str, Any]] = []
+        while len(batch) < self._args.run_queue_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except Empty:
+                break
+        return batch
+
+    @property
+    def drain_lag(self) -> float:
+        """Determine how long runner events have been waiting to be drained.
+
+        Returns:
+            The time in seconds since the queue was last fully drained
+        """
+        if self._drain_behind_since is None:
+            return 0.0
+        return time.monotonic() - self._drain_behind_since
+
+    def _drain_status(self) -> str:
+        """Describe the runner queue backlog for the status bar.
+
+        Returns:
+            The queue depth and drain lag, or an empty string when caught up
+        """
+        depth = self._queue.qsize()
+        if not depth:
+            return ""
+        return f"Queue: {depth} Lag: {self.drain_lag:.1f}s"
 
     def _handle_runner_on_start(
         self,
@@ -804,12 +979,15 @@ class Action(ActionBase):
                 "__duration": "Pending",
                 "__host": event_data["host"],
                 "__number": len(play["tasks"]),
-                "__result": "In progress",
+                "__result": TASK_IN_PROGRESS,
                 "__task_action": event_data["task_action"],
                 "__task": previous_name if use_previous else event_data["task"],
             },
         )
-        play["tasks"].append(event_data)
+        self._task_store.add(play["tasks"].play_index, event_data)
+        row = TaskRow(event_data)
+        play["tasks"].append(row)
+        self._task_index[itemgetter(*TASK_INDEX_KEY)(event_data)] = row
 
     def _handle_runner_on_finish(
         self,
@@ -824,14 +1002,13 @@ class Action(ActionBase):
             event_data: The event data from the runner
             runner_event: The runner event type (ok, skipped, failed, etc.)
         """
-        match = ("task_uuid", "host")
         try:
-            task = next(
-                t for t in play["tasks"] if itemgetter(*match)(t) == itemgetter(*match)(event_data)
-            )
-        except StopIteration:
+            row = self._task_index[itemgetter(*TASK_INDEX_KEY)(event_data)]
+        except KeyError:
             self._logger.warning("Task event without parent task")
             return
+        play_index, task_index = play["tasks"].play_index, row["__number"]
+        task = self._task_store.task(play_index, task_index)
 
         # Get the duration
         if isinstance(event_data["duration"], int | float):
@@ -863,6 +1040,10 @@ class Action(ActionBase):
             event_data["__task"] = event_data["task"]
 
         task.update(event_data)
+        self._task_store.replace(play_index, task_index, task)
+        row.update(task)
+        if self._artifact_stream is not None:
+            self._artifact_stream.task(task)
 
     def _handle_message(self, message: dict[str, Any]) -> None:
         """Handle a runner message.
@@ -872,7 +1053,10 @@ class Action(ActionBase):
         """
         # Collect any stdout
         if message.get("stdout"):
-            self.stdout.extend(message["stdout"].splitlines())
+            lines = message["stdout"].splitlines()
+            self.stdout.extend(lines)
+            if self._artifact_stream is not None:
+                self._artifact_stream.stdout(lines)
             if self.mode == "stdout_w_artifact":
                 print(message["stdout"])
 
@@ -897,8 +1081,14 @@ class Action(ActionBase):
 
         if event == "playbook_on_play_start":
             event_data["__play_name"] = event_data["name"]
-            event_data["tasks"] = []
+            event_data["tasks"] = TaskSummaries(
+                artifact=self._task_store,
+                play_index=len(self._plays.value),
+            )
             self._plays.value.append(event_data)
+            self._play_index[event_data["uuid"]] = event_data
+            if self._artifact_stream is not None:
+                self._artifact_stream.play(event_data)
             return
 
         if event == "playbook_on_task_start":
@@ -915,8 +1105,8 @@ class Action(ActionBase):
 
         # Find the parent play of the task
         try:
-            play = next(p for p in self._plays.value if p["uuid"] == event_data["play_uuid"])
-        except StopIteration:
+            play = self._play_index[event_data["play_uuid"]]
+        except KeyError:
             self._logger.warning("Playbook event without parent play")
             return
 
@@ -1002,6 +1192,8 @@ class Action(ActionBase):
             Content which shows a task
         """
         value = self.steps.current.value
+        if isinstance(value, TaskSummaries):
+            value = value.results()
         index = self.steps.current.index
         step = Step(name="task", step_type="content", index=index, value=value)
         return step
@@ -1012,10 +1204,10 @@ class Action(ActionBase):
         self._calling_app.update()
 
         if hasattr(self, "runner"):
-            self._dequeue()
+            self._dequeue(time_budget=self._args.run_queue_time_budget / 1000)
             self._set_status()
 
-            if self.runner.finished and not self._runner_finished:
+            if self.runner.finished and not self._runner_finished and self._queue.empty():
                 self._logger.debug("runner finished")
                 self._logger.info("Playbook complete")
                 self.write_artifact()
@@ -1048,51 +1240,136 @@ class Action(ActionBase):
     def _set_status(self) -> None:
         """Set the UI status."""
         status, status_color = self._get_status()
-        self._interaction.ui.update_status(status, status_color)
+        self._interaction.ui.update_status(status, status_color, self._drain_status())
+
+    def _artifact_filename(self, filename: str, status: str) -> str:
+        """Format and resolve the artifact file name.
+
+        Args:
+            filename: The artifact file name, possibly with placeholders
+            status: The playbook status
+
+        Returns:
+            The resolved artifact file name
+        """
+        playbook = self._args.playbook
+        if self._playbook_type == "fqcn" and len(self._plays.value) > 0:
+            playbook = next(k["playbook"] for k in self._plays.value)
+        filename = filename.format(
+            playbook_dir=Path(playbook).parent,
+            playbook_name=Path(playbook).stem,
+            playbook_status=status,
+            time_stamp=now_iso(self._args.time_zone),
+        )
+        self._logger.debug("Formatted artifact file name set to %s", filename)
+        filename = str(expand_path(filename))
+        self._logger.debug("Resolved artifact file name set to %s", filename)
+        return filename
+
+    def _open_artifact_stream(self) -> None:
+        """Start writing a streaming artifact, if requested, as the playbook runs.
+
+        The artifact is renamed once the playbook completes, since the status and time
+        stamp placeholders are not known until then.
+        """
+        save_as = self._args.playbook_artifact_save_as
+        if self._args.playbook_artifact_enable is not True or not is_streaming_artifact(save_as):
+            return
+        filename = self._artifact_filename(save_as, "running")
+        try:
+            Path(filename).parent.mkdir(parents=True, exist_ok=True)
+            self._artifact_stream = ArtifactWriter(Path(filename))
+        except OSError as exc:
+            error = f"Streaming the artifact file failed, resulted in the following error: {exc!s}"
+            self._logger.exception(error)
+            return
+        self._logger.debug("Streaming artifact to %s", filename)
+
+    def _close_artifact_stream(self, filename: str, trailer: dict[str, Any]) -> None:
+        """Complete the streaming artifact and move it to its final file name.
+
+        Task results are written as tasks finish, so the tasks still in progress are
+        written before the trailer.
+
+        Args:
+            filename: The final artifact file name
+            trailer: The playbook status and settings
+        """
+        if self._artifact_stream is None:
+            return
+        stream, self._artifact_stream = self._artifact_stream, None
+        for play in self._plays.value:
+            tasks = play["tasks"]
+            for row in tasks:
+                if row["__result"] == TASK_IN_PROGRESS:
+                    stream.task(self._task_store.task(tasks.play_index, row["__number"]))
+        stream.close(trailer=trailer)
+        if stream.path != Path(filename):
+            stream.path.replace(filename)
+
+    def _write_artifact_file(self, filename: str, trailer: dict[str, Any]) -> None:
+        """Write the artifact to a temporary file, renamed to the file name once complete.
+
+        A partially written temporary file is removed, any existing artifact is left as is.
+
+        Args:
+            filename: The artifact file name
+            trailer: The playbook status and settings
+        """
+        path = Path(filename)
+        temporary = path.with_name(f".partial-{path.name}")
+        plays = [{**play, "tasks": full_tasks(play["tasks"])} for play in self._plays.value]
+        try:
+            if is_streaming_artifact(filename):
+                writer = ArtifactWriter(temporary)
+                writer.write_all(plays=plays, stdout=self.stdout)
+                writer.close(trailer=trailer)
+            else:
+                artifact = {
+                    "version": ARTIFACT_VERSION,
+                    "plays": plays,
+                    "stdout": self.stdout,
+                    **trailer,
+                }
+                with open_artifact(temporary, mode="w") as fh:
+                    write_json_artifact(fh, artifact)
+        except (OSError, TypeError, ValueError):
+            temporary.unlink(missing_ok=True)
+            raise
+        temporary.replace(path)
 
     def write_artifact(self, filename: str | None = None) -> None:
         """Write the artifact.
 
+        When the artifact is being streamed and no file name is provided, the
+        streaming artifact is completed rather than written again.
+
         Args:
             filename (str): The file to write to
         """
         if filename or self._args.playbook_artifact_enable is True:
             status, status_color = self._get_status()
-            playbook = self._args.playbook
-            if self._playbook_type == "fqcn" and len(self._plays.value) > 0:
-                playbook = next(k["playbook"] for k in self._plays.value)
-            filename = filename or self._args.playbook_artifact_save_as
-            filename = filename.format(
-                playbook_dir=Path(playbook).parent,
-                playbook_name=Path(playbook).stem,
-                playbook_status=status,
-                time_stamp=now_iso(self._args.time_zone),
+            streaming = self._artifact_stream is not None and not filename
+            filename = self._artifact_filename(
+                filename or self._args.playbook_artifact_save_as,
+                status,
             )
-            self._logger.debug("Formatted artifact file name set to %s", filename)
-            filename = str(expand_path(filename))
-            self._logger.debug("Resolved artifact file name set to %s", filename)
 
             try:
                 Path(Path(filename).parent).mkdir(parents=True, exist_ok=True)
-                artifact = {
-                    "version": "2.0.0",
-                    "plays": self._plays.value,
-                    "stdout": self.stdout,
+                trailer = {
                     "status": status,
                     "status_color": status_color,
                     "settings_entries": to_effective(self._args),
                     "settings_sources": to_sources(self._args),
                 }
-                serialize_write_file(
-                    content=artifact,
-                    content_view=ContentView.NORMAL,
-                    file_mode="w",
-                    file=Path(filename),
-                    serialization_format=SerializationFormat.JSON,
-                )
+                if streaming:
+                    self._close_artifact_stream(filename=filename, trailer=trailer)
+                else:
+                    self._write_artifact_file(filename=filename, trailer=trailer)
                 self._logger.info("Saved artifact as %s", filename)
 
-            except OSError as exc:
+            except (OSError, TypeError, ValueError) as exc:
                 error = (
                     f"Saving the artifact file failed, resulted in the following error: f{exc!s}"
                 )
@@ -1108,8 +1385,13 @@ class Action(ActionBase):
             if self.runner.finished:
                 self._plays.value = []
                 self._plays.index = None
+                self._play_index.clear()
+                self._task_index.clear()
+                self._task_store.close()
+                self._task_store = TaskStore()
                 self._msg_from_plays = (None, None)
                 self._queue.queue.clear()
+                self._events_queued.clear()
                 self.stdout = []
                 self._run_runner()
                 self.steps.clear()
@@ -4,6 +4,7 @@ from ansible_navigator.action_base import ActionBase
 from ansible_navigator.app_public import AppPublic
 from ansible_navigator.configuration_subsystem.definitions import ApplicationConfiguration
 from ansible_navigator.content_defs import ContentFormat
+from ansible_navigator.ui_framework import Content
 from ansible_navigator.ui_framework import Interaction
 
 from . import _actions as actions
@@ -44,12 +45,14 @@ class Action(ActionBase):
             new_scroll = len(self._calling_app.stdout)
             if auto_scroll:
                 interaction.ui.scroll(new_scroll)
-            obj = "\n".join(app.stdout)
+            # the lines are shown as they are, only those appended since are converted
             next_interaction: Interaction = interaction.ui.show(
-                obj=obj,
+                obj=app.stdout,
                 content_format=ContentFormat.ANSI,
             )
             if next_interaction.name != "refresh":
+                content = Content(showing="\n".join(app.stdout))
+                next_interaction = next_interaction._replace(content=content)
                 break
 
             if interaction.ui.scroll() < new_scroll and auto_scroll:
@@ -6,7 +6,9 @@ import logging
 import multiprocessing
 import queue
 import subprocess
+import time
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from dataclasses import field
 from typing import TYPE_CHECKING
@@ -26,6 +28,9 @@ _WORKER_TIMEOUT = 30
 
 PROCESSES = (multiprocessing.cpu_count() - 1) or 1
 
+THREADS = 8
+"""The maximum number of commands run at the same time by the thread pool"""
+
 
 @dataclass(frozen=False)
 class Command:
@@ -45,6 +50,8 @@ class Command:
     details: list[Any] | dict[Any, Any] | object = field(default_factory=list)
     errors: str = ""
     messages: list[LogMessage] = field(default_factory=list)
+    #: The wall time in seconds the command took to run
+    duration: float = 0.0
 
     @property
     def stderr_lines(self) -> list[str]:
@@ -71,6 +78,7 @@ def run_command(command: Command) -> None:
     Args:
         command: Command to be run
     """
+    start = time.perf_counter()
     try:
         proc_out = subprocess.run(
             command.command,
@@ -85,6 +93,26 @@ def run_command(command: Command) -> None:
         command.return_code = exc.returncode
         command.stdout = str(exc.stdout)
         command.stderr = str(exc.stderr)
+    command.duration = time.perf_counter() - start
+    logger.debug("Command %s took %.3fs", command.identity, command.duration)
+
+
+def run_and_post_process(command: Command) -> Command:
+    """Run a command and post process it, recording a failed post process as an error.
+
+    Args:
+        command: Command to be run
+
+    Returns:
+        The command run
+    """
+    run_command(command)
+    try:
+        command.post_process(command)
+    except Exception as exc:
+        command.errors = str(exc)
+        logger.exception("post_process failed for command %s", command.identity)
+    return command
 
 
 def worker(
@@ -101,13 +129,7 @@ def worker(
         command = pending_queue.get()
         if command is None:
             break
-        run_command(command)
-        try:
-            command.post_process(command)
-        except Exception as exc:
-            command.errors = str(exc)
-            logger.exception("post_process failed for command %s", command.identity)
-        completed_queue.put(command)
+        completed_queue.put(run_and_post_process(command))
 
 
 class CommandRunner:
@@ -135,6 +157,24 @@ class CommandRunner:
             results.append(command)
         return results
 
+    @staticmethod
+    def run_multi_thread(commands: list[Command]) -> list[Command]:
+        """Run commands with a pool of threads.
+
+        Each command runs in a subprocess, so threads wait for them in parallel without
+        starting worker processes or passing the commands and results between them.
+
+        Args:
+            commands: All commands to be run
+
+        Returns:
+            The results from running all commands, in the order of the commands
+        """
+        if not commands:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(commands), THREADS)) as executor:
+            return list(executor.map(run_and_post_process, commands))
+
     def run_multi_process(self, commands: list[Command]) -> list[Command]:
         """Run commands with multiple processes.
 
@@ -493,6 +493,23 @@ NavigatorConfiguration = ApplicationConfiguration(
             value=SettingsEntryValue(default=["everything"]),
             version_added="v2.0",
         ),
+        SettingsEntry(
+            name="images_refresh",
+            apply_to_subsequent_cli=C.NONE,
+            choices=[True, False],
+            cli_parameters=CliParameters(
+                action="store_true",
+                short="-r",
+                long_override="--refresh",
+            ),
+            settings_file_path_override="images.refresh",
+            short_description=(
+                "Introspect execution environment images again instead of using cached details"
+            ),
+            subcommands=["images"],
+            value=SettingsEntryValue(default=False),
+            version_added="v25.1",
+        ),
         SettingsEntry(
             name="inventory",
             cli_parameters=CliParameters(action="append", nargs="*", short="-i"),
@@ -564,6 +581,16 @@ NavigatorConfiguration = ApplicationConfiguration(
             value=SettingsEntryValue(default="warning"),
             version_added="v1.0",
         ),
+        SettingsEntry(
+            name="max_frame_rate",
+            cli_parameters=CliParameters(short="--mfr"),
+            short_description=(
+                "The maximum number of times per second the screen is refreshed while content"
+                " is updating in mode interactive"
+            ),
+            value=SettingsEntryValue(default=20),
+            version_added="v25.1",
+        ),
         SettingsEntry(
             name="mode",
             change_after_initial=False,
@@ -688,6 +715,28 @@ NavigatorConfiguration = ApplicationConfiguration(
             value=SettingsEntryValue(default="tag"),
             version_added="v1.0",
         ),
+        SettingsEntry(
+            name="run_queue_batch_size",
+            cli_parameters=CliParameters(short="--rqbs"),
+            settings_file_path_override="run-queue.batch-size",
+            short_description=(
+                "The maximum number of playbook events taken from the queue at once"
+                " in mode interactive"
+            ),
+            value=SettingsEntryValue(default=500),
+            version_added="v25.1",
+        ),
+        SettingsEntry(
+            name="run_queue_time_budget",
+            cli_parameters=CliParameters(short="--rqtb"),
+            settings_file_path_override="run-queue.time-budget",
+            short_description=(
+                "The time in milliseconds spent handling queued playbook events per screen update"
+                " in mode interactive"
+            ),
+            value=SettingsEntryValue(default=50),
+            version_added="v25.1",
+        ),
         SettingsEntry(
             name="set_environment_variable",
             cli_parameters=CliParameters(action="append", nargs="+", short="--senv"),
@@ -118,6 +118,33 @@ class NavigatorPostProcessor:
 
         return messages, exit_messages
 
+    @staticmethod
+    def _positive_integer(
+        entry: SettingsEntry,
+        config: ApplicationConfiguration,
+    ) -> PostProcessorReturn:
+        """Post process a positive integer value.
+
+        Args:
+            entry: The current settings entry
+            config: The full application configuration
+
+        Returns:
+            An instance of the standard post process return object
+        """
+        messages: list[LogMessage] = []
+        exit_messages: list[ExitMessage] = []
+        try:
+            entry.value.current = int(entry.value.current)
+        except (TypeError, ValueError) as exc:
+            exit_msg = f"Value should be valid integer. Failed with error {exc!s}"
+            exit_messages.append(ExitMessage(message=exit_msg))
+            return messages, exit_messages
+        if entry.value.current < 1:
+            exit_msg = f"{entry.name} must be at least 1, received {entry.value.current}"
+            exit_messages.append(ExitMessage(message=exit_msg))
+        return messages, exit_messages
+
     @staticmethod
     @_post_processor
     def ansible_runner_artifact_dir(
@@ -628,6 +655,9 @@ class NavigatorPostProcessor:
             messages.append(LogMessage(level=logging.DEBUG, message=message))
         return messages, exit_messages
 
+    # Post process images_refresh
+    images_refresh = _true_or_false
+
     @_post_processor
     def _normalize_path(
         self,
@@ -1247,6 +1277,57 @@ class NavigatorPostProcessor:
             entry.value.current = flatten_list(entry.value.current)
         return messages, exit_messages
 
+    @_post_processor
+    def max_frame_rate(
+        self,
+        entry: SettingsEntry,
+        config: ApplicationConfiguration,
+    ) -> PostProcessorReturn:
+        """Post process max_frame_rate.
+
+        Args:
+            entry: The current settings entry
+            config: The full application configuration
+
+        Returns:
+            An instance of the standard post process return object
+        """
+        return self._positive_integer(entry, config)
+
+    @_post_processor
+    def run_queue_batch_size(
+        self,
+        entry: SettingsEntry,
+        config: ApplicationConfiguration,
+    ) -> PostProcessorReturn:
+        """Post process run_queue_batch_size.
+
+        Args:
+            entry: The current settings entry
+            config: The full application configuration
+
+        Returns:
+            An instance of the standard post process return object
+        """
+        return self._positive_integer(entry, config)
+
+    @_post_processor
+    def run_queue_time_budget(
+        self,
+        entry: SettingsEntry,
+        config: ApplicationConfiguration,
+    ) -> PostProcessorReturn:
+        """Post process run_queue_time_budget.
+
+        Args:
+            entry: The current settings entry
+            config: The full application configuration
+
+        Returns:
+            An instance of the standard post process return object
+        """
+        return self._positive_integer(entry, config)
+
     settings_effective = partialmethod(_forced_stdout, subcommand="settings")
     settings_sample = partialmethod(_forced_stdout, subcommand="settings")
     settings_sources = partialmethod(_forced_stdout, subcommand="settings")
@@ -12,9 +12,12 @@ import os
 import re
 import subprocess
 import sys
+import time
 
 from collections import Counter
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
 from datetime import datetime
 from datetime import timezone
 from json.decoder import JSONDecodeError
@@ -53,6 +56,15 @@ except ImportError:
 
 PROCESSES = (multiprocessing.cpu_count() - 1) or 1
 
+CHUNK_SIZE = 16
+"""The maximum number of plugins sent to a worker process at once"""
+
+DOC_ENTRY_VERSION = "1"
+"""The default version recorded with each cache entry, provided by the caller otherwise"""
+
+CACHE_BATCH_SIZE = 200
+"""The number of plugins written to the cache in one transaction"""
+
 
 class CollectionCatalog:
     """A collection cataloger."""
@@ -481,70 +493,68 @@ class CollectionCatalog:
         self._messages.append(msg)
 
 
-def worker(
-    pending_queue: multiprocessing.Queue[Any],
-    completed_queue: multiprocessing.Queue[Any],
-) -> None:
-    """Extract the documentation from a plugin, place in completed queue.
+def extract_doc(
+    entry: tuple[str, str, Path],
+    entry_version: str = DOC_ENTRY_VERSION,
+) -> tuple[str, tuple[Any, ...]]:
+    """Extract the documentation from a plugin.
 
     Args:
-        pending_queue: A queue with plugins to process
-        completed_queue: The queue in which extracted documentation will
-            be placed
+        entry: The collection name, checksum and path of the plugin
+        entry_version: The version recorded with the extracted documentation
+
+    Returns:
+        A plugin message with the checksum and the extracted documentation,
+        or an error message with the checksum, path and error
     """
     # pylint: disable=import-outside-toplevel
-    # pylint: disable=too-many-locals
 
     # load the fragment_loader _after_ the path is set
     from ansible.plugins.loader import fragment_loader  # noqa: PLC0415
 
-    while True:
-        entry = pending_queue.get()
-        if entry is None:
-            break
-        collection_name, checksum, plugin_path = entry
+    collection_name, checksum, plugin_path = entry
 
-        try:
-            if ansible_version.startswith("2.9"):
-                (doc, examples, returndocs, metadata) = get_docstring(
-                    filename=str(plugin_path),
-                    fragment_loader=fragment_loader,
-                )
-            else:
-                (doc, examples, returndocs, metadata) = get_docstring(
-                    filename=str(plugin_path),
-                    fragment_loader=fragment_loader,
-                    collection_name=collection_name,
-                )
-
-        except Exception:  # noqa: BLE001
-            try:
-                with plugin_path.open(mode="r", encoding="utf-8") as f:
-                    content = f.read()
-                doc, examples, returndocs, metadata = get_doc_withast(content)
-                doc, examples, returndocs, metadata = (
-                    yaml.load(value, Loader=yaml.SafeLoader)
-                    for value in (doc, examples, returndocs, metadata)
-                )
-            except Exception as exc:  # noqa: BLE001
-                err_message = f"{type(exc).__name__} (get_docstring): {exc!s}"
-                completed_queue.put(("error", (checksum, plugin_path, err_message)))
-                continue
+    try:
+        if ansible_version.startswith("2.9"):
+            (doc, examples, returndocs, metadata) = get_docstring(
+                filename=str(plugin_path),
+                fragment_loader=fragment_loader,
+            )
+        else:
+            (doc, examples, returndocs, metadata) = get_docstring(
+                filename=str(plugin_path),
+                fragment_loader=fragment_loader,
+                collection_name=collection_name,
+            )
 
+    except Exception:  # noqa: BLE001
         try:
-            q_message = {
-                "plugin": {
-                    "doc": doc,
-                    "examples": examples,
-                    "returndocs": returndocs,
-                    "metadata": metadata,
-                },
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-            completed_queue.put(("plugin", (checksum, json.dumps(q_message, default=str))))
-        except JSONDecodeError as exc:
-            err_message = f"{type(exc).__name__} (json_decode_doc): {exc!s}"
-            completed_queue.put(("error", (checksum, plugin_path, err_message)))
+            with plugin_path.open(mode="r", encoding="utf-8") as f:
+                content = f.read()
+            doc, examples, returndocs, metadata = get_doc_withast(content)
+            doc, examples, returndocs, metadata = (
+                yaml.load(value, Loader=yaml.SafeLoader)
+                for value in (doc, examples, returndocs, metadata)
+            )
+        except Exception as exc:  # noqa: BLE001
+            err_message = f"{type(exc).__name__} (get_docstring): {exc!s}"
+            return "error", (checksum, plugin_path, err_message)
+
+    try:
+        q_message = {
+            "plugin": {
+                "doc": doc,
+                "examples": examples,
+                "returndocs": returndocs,
+                "metadata": metadata,
+            },
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "version": entry_version,
+        }
+        return "plugin", (checksum, json.dumps(q_message, default=str))
+    except JSONDecodeError as exc:
+        err_message = f"{type(exc).__name__} (json_decode_doc): {exc!s}"
+        return "error", (checksum, plugin_path, err_message)
 
 
 def identify_missing(
@@ -603,6 +613,12 @@ def parse_args() -> tuple[argparse.Namespace, list[Path]]:
         help="path to collection cache",
         required=True,
     )
+    parser.add_argument(
+        "-e",
+        dest="entry_version",
+        help="version recorded with each collection cache entry",
+        default=DOC_ENTRY_VERSION,
+    )
     parsed_args = parser.parse_args()
 
     adjacent = vars(parsed_args).get("adjacent")
@@ -651,47 +667,75 @@ def retrieve_collections_paths() -> dict[Any, Any]:
     return {"error": f"corrupt current collection path: {collections_paths_line}"}
 
 
+def extract_docs(
+    entries: list[tuple[str, str, Path]],
+    entry_version: str = DOC_ENTRY_VERSION,
+) -> list[tuple[str, tuple[Any, ...]]]:
+    """Extract the documentation from a chunk of plugins.
+
+    Args:
+        entries: The collection name, checksum and path of each plugin
+        entry_version: The version recorded with the extracted documentation
+
+    Returns:
+        A plugin or error message for each plugin
+    """
+    return [extract_doc(entry, entry_version) for entry in entries]
+
+
 def retrieve_docs(
     collection_cache: KeyValueStore,
     errors: list[dict[str, str]],
-    missing: list[str],
+    missing: list[Any],
     stats: dict[Any, Any],
+    entry_version: str = DOC_ENTRY_VERSION,
 ) -> None:
-    # pylint: disable=too-many-locals
     """Extract the docs from the plugins.
 
+    Plugins are distributed in chunks to a pool of worker processes, extracted
+    documentation is written to the cache as it arrives and committed in batches. If a
+    worker raises or dies, the plugins of its chunk are recorded as errors and not cached,
+    so they are extracted again the next time.
+
     Args:
         collection_cache: The key value interface to a sqlite database
         errors: Previous errors encountered
         missing: Plugins missing from the collection cache
         stats: Statistics related to the collection cataloging process
+        entry_version: The version recorded with each cache entry
     """
-    pending_queue = multiprocessing.Manager().Queue()
-    completed_queue = multiprocessing.Manager().Queue()
-    processes = []
-    for _proc in range(PROCESSES):
-        proc = multiprocessing.Process(target=worker, args=(pending_queue, completed_queue))
-        processes.append(proc)
-        proc.start()
-
-    for entry in missing:
-        pending_queue.put(entry)
-    for _proc in range(PROCESSES):
-        pending_queue.put(None)
-    for proc in processes:
-        proc.join()
-
-    while not completed_queue.empty():
-        message_type, message = completed_queue.get()
-        if message_type == "plugin":
-            checksum, plugin = message
-            collection_cache[checksum] = plugin
-            stats["cache_added_success"] += 1
-        elif message_type == "error":
-            checksum, plugin_path, error = message
-            collection_cache[checksum] = json.dumps({"error": error})
-            errors.append({"path": str(plugin_path), "error": error})
-            stats["cache_added_errors"] += 1
+    start_time = time.monotonic()
+    chunksize = max(1, min(CHUNK_SIZE, len(missing) // (PROCESSES * 4)))
+    chunks = [missing[idx : idx + chunksize] for idx in range(0, len(missing), chunksize)]
+    batch: dict[str, str] = {}
+    with ProcessPoolExecutor(PROCESSES) as executor:
+        futures = {executor.submit(extract_docs, chunk, entry_version): chunk for chunk in chunks}
+        for future in as_completed(futures):
+            try:
+                messages = future.result()
+            except Exception as exc:  # noqa: BLE001
+                # BrokenProcessPool when a worker died, the exception a worker raised otherwise
+                error = f"{type(exc).__name__} (extract_doc): {exc!s}"
+                errors.extend({"path": str(entry[-1]), "error": error} for entry in futures[future])
+                continue
+            for message_type, message in messages:
+                if message_type == "plugin":
+                    checksum, plugin = message
+                    batch[checksum] = plugin
+                    stats["cache_added_success"] += 1
+                elif message_type == "error":
+                    checksum, plugin_path, error = message
+                    batch[checksum] = json.dumps({"error": error, "version": entry_version})
+                    errors.append({"path": str(plugin_path), "error": error})
+                    stats["cache_added_errors"] += 1
+            if len(batch) >= CACHE_BATCH_SIZE:
+                collection_cache.update_many(batch)
+                batch.clear()
+    collection_cache.update_many(batch)
+
+    duration = time.monotonic() - start_time
+    stats["docs_duration"] = round(duration, 3)
+    stats["plugins_per_second"] = round(len(missing) / duration, 1) if duration else 0.0
 
 
 def get_doc_withast(content: Any) -> tuple[Any, Any, Any, Any]:
@@ -764,7 +808,7 @@ def main() -> dict[Any, Any]:
     stats["collection_count"] = len(collections)
 
     collection_cache_path = Path(args.collection_cache_path).resolve().expanduser()
-    collection_cache = KeyValueStore(collection_cache_path)
+    collection_cache = KeyValueStore(collection_cache_path, compress=True)
 
     handled, missing, plugin_count = identify_missing(collections, collection_cache)
     stats["plugin_count"] = plugin_count
@@ -772,7 +816,7 @@ def main() -> dict[Any, Any]:
     stats["processed"] = len(missing)
 
     if missing:
-        retrieve_docs(collection_cache, errors, missing, stats)
+        retrieve_docs(collection_cache, errors, missing, stats, args.entry_version)
 
     cached_checksums = collection_cache.keys()
     stats["cache_length"] = len(collection_cache.keys())
@@ -20,9 +20,23 @@ from typing import TypeAlias
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
 
 _WORKER_TIMEOUT = 30
 
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+"""The CPU quota and period of the container, with cgroup v2"""
+
+CGROUP_V1_CPU_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+"""The CPU quota of the container, with cgroup v1"""
+
+CGROUP_V1_CPU_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+"""The CPU period of the container, with cgroup v1"""
+
+RPM_PACKAGE_START = re.compile(r"^Name\s{2,}:")
+"""The first line of a package in the output of ``rpm -qai``"""
+
 # https://github.com/python/typing/issues/182#issuecomment-1320974824
 JSONTypes: TypeAlias = dict[str, "JSONTypes"] | list["JSONTypes"] | str | int | float | bool | None
 
@@ -59,6 +73,49 @@ def run_command(command: Command) -> None:
         command.errors = [str(exc.stderr)]
 
 
+def _read_first_line(path: str) -> str:
+    """Read the first line of a file.
+
+    Args:
+        path: The path to the file
+
+    Returns:
+        The first line, empty if the file cannot be read
+    """
+    try:
+        with open(path, encoding="utf-8") as file:  # noqa: PTH123
+            return file.readline().strip()
+    except OSError:
+        return ""
+
+
+def cpu_quota() -> int:
+    """Determine the number of CPUs the container may use.
+
+    The CPU quota of the container's cgroup is used if there is one, the CPUs the
+    process may run on otherwise.
+
+    Returns:
+        The number of CPUs, at least one
+    """
+    try:
+        available = len(os.sched_getaffinity(0))
+    except AttributeError:
+        available = os.cpu_count() or 1
+
+    quota, _, period = _read_first_line(CGROUP_V2_CPU_MAX).partition(" ")
+    if not period:
+        quota = _read_first_line(CGROUP_V1_CPU_QUOTA)
+        period = _read_first_line(CGROUP_V1_CPU_PERIOD)
+    try:
+        quota_cpus = -(-int(quota) // int(period))
+    except (ValueError, ZeroDivisionError):
+        return max(available, 1)
+    if quota_cpus <= 0:
+        return max(available, 1)
+    return max(min(quota_cpus, available), 1)
+
+
 def worker(pending_queue: Queue[Any], completed_queue: Queue[Any]) -> None:
     """Run a command from pending, parse, and place in completed.
 
@@ -85,10 +142,16 @@ class CommandRunner:
     Run commands using single or multiple processes.
     """
 
-    def __init__(self) -> None:
-        """Initialize the command runner."""
+    def __init__(self, workers: int | None = None) -> None:
+        """Initialize the command runner.
+
+        Args:
+            workers: The maximum number of commands run at the same time, the CPU quota
+                of the container by default
+        """
         self._completed_queue: Queue[Any] | None = None
         self._pending_queue: Queue[Any] | None = None
+        self._workers = workers or cpu_quota()
 
     def run_multi_thread(self, command_classes: list[CmdParser]) -> list[CmdParser]:
         """Run commands with multiple threads.
@@ -144,7 +207,7 @@ class CommandRunner:
         Raises:
             RuntimeError: if the pending queue is not initialized
         """
-        worker_count = len(jobs)
+        worker_count = min(len(jobs), self._workers)
         threads: list[threading.Thread] = []
         for _proc in range(worker_count):
             proc = threading.Thread(
@@ -197,18 +260,42 @@ class CmdParser:
         separator_match = re.search(separator, content)
         if not separator_match or content.startswith(" "):
             return "", "", content
-        delim = separator_match.group(0)
-        key, content = re.split(delim, content, maxsplit=1)
-        return key, delim, content
+        return (
+            content[: separator_match.start()],
+            separator_match.group(0),
+            content[separator_match.end() :],
+        )
+
+    @staticmethod
+    def partition(content: str, separator: str) -> tuple[str, str, str]:
+        """Partition a string using a separator without special regular expression characters.
+
+        Args:
+            content: The content to partition
+            separator: The separator to use for the partitioning
+
+        Returns:
+            The first partition, separator, and final partition, the same as
+            :meth:`re_partition` would
+        """
+        if content.startswith(" "):
+            return "", "", content
+        key, delim, rest = content.partition(separator)
+        if not delim:
+            return "", "", content
+        return key, delim, rest
 
     def splitter(
         self,
-        lines: list[str],
+        lines: Iterable[str],
         line_split: str,
         section_delim: str | None = None,
     ) -> list[dict[str, Any]] | dict[str, Any]:
         """Split lines given a delimiter.
 
+        The lines are read one at a time, they can be produced as they are split. A
+        separator without special regular expression characters is found without one.
+
         Args:
             lines: The lines to split
             line_split: The delimiter use for splitting each line
@@ -220,9 +307,10 @@ class CmdParser:
         results: list[dict[str, Any]] = []
         result: dict[str, Any] = {}
         current_key: str = ""
-        while lines:
-            line = lines.pop(0)
-            key, delim, content = self.re_partition(line, line_split)
+        partition = self.partition if re.escape(line_split) == line_split else self.re_partition
+        pending = iter(lines)
+        for line in pending:
+            key, delim, content = partition(line, line_split)
             content = self._strip(content)
             if section_delim and line == section_delim:
                 results.append(result)
@@ -235,11 +323,10 @@ class CmdParser:
             # system_packages description field needs special handling
             if current_key == "description":
                 description = []
-                while lines:
-                    line = lines.pop(0)
-                    if line == section_delim:
+                for description_line in pending:
+                    if description_line == section_delim:
                         break
-                    description.append(line)
+                    description.append(description_line)
                 if description:
                     result[current_key] = " ".join(description)
                 else:
@@ -430,23 +517,29 @@ class SystemPackages(CmdParser):
         Args:
             command: The result of running the command
         """
-        packages = []
-        package: list[str] = []
-        for line in command.stdout.splitlines():
-            if re.match(r"^Name\s{2,}:", line) and package:
-                packages.append(package)
-                package = [line]
-            else:
-                package.append(line)
-        if package:
-            packages.append(package)
+        parsed: list[Any] = [
+            self.splitter(package, line_split=":") for package in self.packages(command.stdout)
+        ]
+        command.details = parsed
+
+    @staticmethod
+    def packages(output: str) -> Iterator[list[str]]:
+        """Split the output of the rpm command into packages, one at a time.
 
-        parsed: list[Any] = []
-        for package in packages:
-            result = self.splitter(package, line_split=":")
-            parsed.append(result)
+        Args:
+            output: The output of the rpm command
 
-        command.details = parsed
+        Yields:
+            The lines of each package
+        """
+        package: list[str] = []
+        for line in output.splitlines():
+            if package and RPM_PACKAGE_START.match(line):
+                yield package
+                package = []
+            package.append(line)
+        if package:
+            yield package
 
 
 ALL_COLLECTORS: dict[str, type[CmdParser]] = {
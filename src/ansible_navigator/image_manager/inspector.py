@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import re
+import time
 
 from collections.abc import Iterable
 from typing import Any
@@ -13,16 +14,46 @@ from ansible_navigator.command_runner import CommandRunner
 from ansible_navigator.utils.functions import pascal_to_snake
 
 
+INSPECT_BATCH_SIZE = 50
+"""The number of images inspected with one invocation of the container engine"""
+
+INSPECT_CACHE_TTL = 60.0
+"""The time in seconds the inspection of an image is reused for"""
+
+
+def _bare_id(image_id: str) -> str:
+    """Remove the digest algorithm from an image ID, as docker prefixes full IDs.
+
+    Args:
+        image_id: The image ID
+
+    Returns:
+        The image ID without the digest algorithm
+    """
+    return image_id.removeprefix("sha256:")
+
+
 class ImagesInspect:
-    """Functionality for inspecting container images."""
+    """Functionality for inspecting container images.
+
+    Images are inspected in batches, the container engine inspects every image ID
+    given and reports the images in a single list.
+    """
 
-    def __init__(self, container_engine: str, ids: list[str]) -> None:
+    def __init__(
+        self,
+        container_engine: str,
+        ids: list[str],
+        batch_size: int = INSPECT_BATCH_SIZE,
+    ) -> None:
         """Initialize the container image inspector.
 
         Args:
             container_engine: The name of the container engine to use
             ids: The ids of the container images to inspect
+            batch_size: The number of images inspected by one command
         """
+        self._batch_size = batch_size
         self._container_engine = container_engine
         self._image_ids = ids
 
@@ -31,27 +62,97 @@ class ImagesInspect:
         """Generate image inspection commands.
 
         Returns:
-            List of image inspection command objects
+            List of image inspection command objects, the identity of each is the
+            space separated ids of the images it inspects
         """
+        batches = (
+            self._image_ids[start : start + self._batch_size]
+            for start in range(0, len(self._image_ids), self._batch_size)
+        )
         return [
             Command(
-                identity=image_id,
-                command=f"{self._container_engine} inspect {image_id}",
+                identity=" ".join(batch),
+                command=f"{self._container_engine} inspect {' '.join(batch)}",
                 post_process=self.parse,
             )
-            for image_id in self._image_ids
+            for batch in batches
         ]
 
     @staticmethod
     def parse(command: Command) -> None:
         """Parse the image inspection command output.
 
+        The inspection of each image is matched to the id it was requested with. An
+        engine lists the images it found even if it could not find others.
+
         Args:
             command: Image inspection command object
         """
-        obj = json.loads(command.stdout)
-        snake = pascal_to_snake(obj[0])
-        command.details = snake
+        found = json.loads(command.stdout) if command.stdout.strip() else []
+        details: dict[str, Any] = {}
+        for obj in found:
+            snake = pascal_to_snake(obj)
+            if not isinstance(snake, dict):
+                continue
+            full_id = _bare_id(str(snake.get("id", "")))
+            for image_id in command.identity.split():
+                if full_id.startswith(_bare_id(image_id)):
+                    details[image_id] = snake
+        command.details = details
+
+
+class InspectCache:
+    """The recent inspections of images, keyed by the container engine and image ID.
+
+    An image ID identifies the content of an image, but its tags can change, so an
+    inspection is only reused for a short time.
+    """
+
+    def __init__(self, ttl: float = INSPECT_CACHE_TTL) -> None:
+        """Initialize the inspection cache.
+
+        Args:
+            ttl: The time in seconds an inspection is reused for
+        """
+        self._entries: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+        self._ttl = ttl
+
+    def get(self, container_engine: str, image_id: str) -> dict[str, Any] | None:
+        """Get the recent inspection of an image.
+
+        Args:
+            container_engine: The name of the container engine
+            image_id: The image ID
+
+        Returns:
+            The inspection of the image, or None if there was none recently
+        """
+        entry = self._entries.get((container_engine, image_id))
+        if entry is None:
+            return None
+        inspected, inspection = entry
+        if time.monotonic() - inspected > self._ttl:
+            del self._entries[container_engine, image_id]
+            return None
+        return inspection
+
+    def put(self, container_engine: str, image_id: str, inspection: dict[str, Any]) -> None:
+        """Store the inspection of an image.
+
+        Args:
+            container_engine: The name of the container engine
+            image_id: The image ID
+            inspection: The inspection of the image
+        """
+        self._entries[container_engine, image_id] = (time.monotonic(), inspection)
+
+    def clear(self) -> None:
+        """Remove all inspections."""
+        self._entries.clear()
+
+
+inspect_cache = InspectCache()
+"""The recent inspections of images, shared by every listing of the images"""
 
 
 class ImagesList:
@@ -121,9 +222,34 @@ def inspect_all(container_engine: str) -> tuple[list[dict[str, Any]], str]:
     if not isinstance(images_list.details, Iterable):
         raise TypeError
     images = {image["image_id"]: image for image in images_list.details}
-    image_ids = [image["image_id"] for image in images.values()]
-    images_inspect_class = ImagesInspect(container_engine=container_engine, ids=image_ids)
-    inspects = cmd_runner.run_single_process(commands=images_inspect_class.commands)
+    pending = []
+    for image_id, image in images.items():
+        inspection = inspect_cache.get(container_engine, image_id)
+        if inspection is None:
+            pending.append(image_id)
+        else:
+            image["inspect"] = inspection
+    if not pending:
+        return list(images.values()), images_list.stderr
+
+    images_inspect_class = ImagesInspect(
+        container_engine=container_engine,
+        ids=pending,
+        batch_size=INSPECT_BATCH_SIZE,
+    )
+    commands = images_inspect_class.commands
+    if len(commands) == 1:
+        inspects = cmd_runner.run_single_process(commands=commands)
+    else:
+        inspects = cmd_runner.run_multi_thread(commands=commands)
     for inspect in inspects:
-        images[inspect.identity]["inspect"] = {"details": inspect.details, "errors": inspect.errors}
+        details = inspect.details if isinstance(inspect.details, dict) else {}
+        for image_id in inspect.identity.split():
+            if image_id in details:
+                inspection = {"details": details[image_id], "errors": inspect.errors}
+                inspect_cache.put(container_engine, image_id, inspection)
+            else:
+                errors = inspect.errors or inspect.stderr or f"Image {image_id} was not found"
+                inspection = {"details": None, "errors": errors}
+            images[image_id]["inspect"] = inspection
     return list(images.values()), images_list.stderr
@@ -0,0 +1,124 @@
+"""A cache of image introspection output, kept on disk between sessions.
+
+The output of the introspection script for an image depends only on the image and
+the script. Entries are keyed by the image ID and a digest of the script, so a
+rebuilt image or an updated script is introspected again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from ansible_navigator.data import image_introspect
+from ansible_navigator.utils.key_value_store import KeyValueStore
+
+
+INTROSPECTION_CACHE_NAME = "image_introspection_cache.db"
+"""The name of the introspection cache within the application cache directory"""
+
+INTROSPECTION_CACHE_MAX_BYTES = 32 * 1024 * 1024
+"""The maximum size of the cached output, the least recently used is removed beyond it"""
+
+INTROSPECTION_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+"""The time in seconds after which cached output not used since is removed"""
+
+
+@cache
+def script_version() -> str:
+    """Determine the version of the introspection script, a digest of its source.
+
+    Returns:
+        The version of the introspection script
+    """
+    source = Path(image_introspect.__file__).read_bytes()
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+def image_identity(image: dict[str, Any]) -> str:
+    """Determine the identity of an image, its full ID if it was inspected.
+
+    Args:
+        image: An image from the images list
+
+    Returns:
+        The image ID
+    """
+    try:
+        return str(image["inspect"]["details"]["id"])
+    except (KeyError, TypeError):
+        return str(image["image_id"])
+
+
+def cache_key(image_id: str) -> str:
+    """Build the key for the introspection output of an image.
+
+    Args:
+        image_id: The image ID
+
+    Returns:
+        The cache key
+    """
+    return f"{image_id}:{script_version()}"
+
+
+class IntrospectionCache:
+    """The introspection output of images, stored compressed on disk.
+
+    A connection is opened for each read or write, so output introspected in a
+    background thread can be stored while the images menu is shown.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the introspection cache.
+
+        Args:
+            path: The full path to the cache database
+        """
+        self.path = Path(path)
+
+    def _open(self) -> KeyValueStore:
+        """Open the cache database.
+
+        Returns:
+            The key-value store holding the introspection output
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return KeyValueStore(self.path, compress=True, track_access=True)
+
+    def get(self, image_id: str) -> str | None:
+        """Get the introspection output of an image.
+
+        Args:
+            image_id: The image ID
+
+        Returns:
+            The introspection output, or None if it was not cached
+        """
+        key = cache_key(image_id)
+        store = self._open()
+        try:
+            return store.get_many((key,)).get(key)
+        finally:
+            store.close()
+
+    def put(self, image_id: str, output: str) -> None:
+        """Store the introspection output of an image.
+
+        Args:
+            image_id: The image ID
+            output: The introspection output
+        """
+        store = self._open()
+        try:
+            with store.transaction():
+                store[cache_key(image_id)] = output
+            store.evict(
+                max_bytes=INTROSPECTION_CACHE_MAX_BYTES,
+                max_age=INTROSPECTION_CACHE_MAX_AGE,
+            )
+        finally:
+            store.close()
@@ -5,8 +5,10 @@ These helpers are specific to ansible_navigator.
 
 from __future__ import annotations
 
+import json
 import logging
 import os
+import sqlite3
 import sys
 
 from pathlib import Path
@@ -14,6 +16,7 @@ from typing import TYPE_CHECKING
 from typing import NoReturn
 
 from ._version_doc_cache import __version_collection_doc_cache__ as VERSION_CDC
+from ._version_doc_cache import __version_collection_doc_entry__ as VERSION_CDC_ENTRY
 from .configuration_subsystem import Configurator
 from .configuration_subsystem import Constants as C
 from .diagnostics import DiagnosticsCollector
@@ -30,6 +33,12 @@ from .utils.key_value_store import KeyValueStore
 if TYPE_CHECKING:
     from .configuration_subsystem.definitions import ApplicationConfiguration
 
+COLLECTION_DOC_CACHE_MAX_BYTES = 64 * 1024 * 1024
+"""The maximum size of the cached docs, the least recently used docs are removed beyond it"""
+
+COLLECTION_DOC_CACHE_MAX_AGE = 90 * 24 * 60 * 60
+"""The time in seconds after which a cached doc not used since is removed"""
+
 
 def error_and_exit_early(exit_messages: list[ExitMessage]) -> NoReturn:
     """Exit the application early.
@@ -93,12 +102,70 @@ def find_config() -> tuple[list[LogMessage], list[ExitMessage], str | None, C]:
     return messages, exit_messages, config_path, settings_source
 
 
+def open_collection_doc_cache(collection_doc_cache_path: str) -> KeyValueStore:
+    """Open the collection doc cache, docs are compressed and their use recorded.
+
+    Args:
+        collection_doc_cache_path: Path for collection documentation
+            cache
+
+    Returns:
+        The collection doc cache
+    """
+    return KeyValueStore(collection_doc_cache_path, compress=True, track_access=True)
+
+
+def collection_doc_entry_version(value: str) -> str | None:
+    """Determine the version of a collection doc cache entry.
+
+    Entries written before entry versions were recorded are version 1.
+
+    Args:
+        value: The cache entry
+
+    Returns:
+        The entry version, or None if the entry cannot be parsed
+    """
+    try:
+        entry = json.loads(value)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(entry, dict):
+        return None
+    return str(entry.get("version", "1"))
+
+
+def migrate_collection_doc_cache(collection_cache: KeyValueStore) -> int:
+    """Remove the entries of a different version from the collection doc cache.
+
+    The migration only deletes, nothing is extracted here. The cache is refilled
+    lazily, the removed entries are extracted again by the collection catalog the
+    next time their collection is cataloged, all other entries are kept.
+
+    Args:
+        collection_cache: The collection doc cache
+
+    Returns:
+        The number of entries removed
+    """
+    stale = [
+        key
+        for key, value in collection_cache.iteritems()
+        if key != "version" and collection_doc_entry_version(value) != VERSION_CDC_ENTRY
+    ]
+    collection_cache.delete_many(stale)
+    collection_cache["version"] = VERSION_CDC
+    collection_cache.conn.commit()
+    return len(stale)
+
+
 def get_and_check_collection_doc_cache(
     collection_doc_cache_path: str,
 ) -> tuple[list[LogMessage], list[ExitMessage], KeyValueStore | None]:
     """Ensure the collection doc cache has current application version as a safeguard.
 
-    Always delete and rebuild if not.
+    If not, migrate the cache entries, the cache is only deleted and rebuilt if it
+    cannot be read.
 
     Args:
         collection_doc_cache_path: Path for collection documentation
@@ -134,20 +201,40 @@ def get_and_check_collection_doc_cache(
         exit_messages.append(ExitMessage(message=exit_msg, prefix=ExitPrefix.HINT))
         return messages, exit_messages, None
 
-    collection_cache: KeyValueStore = KeyValueStore(collection_doc_cache_path)
-    cache_version = collection_cache.get("version", None)
+    try:
+        collection_cache = open_collection_doc_cache(collection_doc_cache_path)
+        cache_version = collection_cache.get("version", None)
+    except sqlite3.DatabaseError as exc:
+        message = f"Collection doc cache: unreadable, rebuilding: {exc!s}"
+        messages.append(LogMessage(level=logging.WARNING, message=message))
+        Path(collection_doc_cache_path).unlink()
+        collection_cache = open_collection_doc_cache(collection_doc_cache_path)
+        cache_version = None
     message = f"Collection doc cache: 'current version' is '{cache_version}'"
     messages.append(LogMessage(level=logging.DEBUG, message=message))
     if cache_version is None or cache_version != VERSION_CDC:
-        message = "Collection doc cache: version was empty or incorrect, rebuilding"
+        stale = migrate_collection_doc_cache(collection_cache)
+        message = (
+            "Collection doc cache: version was empty or incorrect,"
+            f" removed {stale} entries to be extracted again"
+        )
         messages.append(LogMessage(level=logging.INFO, message=message))
-        collection_cache.close()
-        Path(collection_doc_cache_path).unlink()
-        collection_cache = KeyValueStore(collection_doc_cache_path)
-        collection_cache["version"] = VERSION_CDC
         cache_version = collection_cache["version"]
         message = f"Collection doc cache: 'current version' is '{cache_version}'"
         messages.append(LogMessage(level=logging.INFO, message=message))
+
+    evicted = collection_cache.evict(
+        max_bytes=COLLECTION_DOC_CACHE_MAX_BYTES,
+        max_age=COLLECTION_DOC_CACHE_MAX_AGE,
+        keep=("version",),
+    )
+    usage = collection_cache.usage()
+    message = (
+        f"Collection doc cache: {usage['entries']} entries,"
+        f" {usage['compressed_entries']} compressed, {usage['stored_bytes']} bytes stored,"
+        f" {usage['file_bytes']} bytes on disk, {evicted} evicted"
+    )
+    messages.append(LogMessage(level=logging.DEBUG, message=message))
     collection_cache.close()
     return messages, exit_messages, collection_cache
 
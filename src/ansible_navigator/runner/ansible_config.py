@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import warnings
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
 
 # Remove this catch-all once newer ansible-runner is released
 # https://github.com/ansible/ansible-runner/issues/1223
@@ -14,6 +17,10 @@ with warnings.catch_warnings():
 from .base import Base
 
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
 class AnsibleConfig(Base):
     """Abstraction for ansible-config command-line."""
 
@@ -48,3 +55,35 @@ class AnsibleConfig(Base):
             only_changed=only_changed,
             **self._runner_args,
         )
+
+    def fetch_ansible_configs(
+        self,
+        actions: Sequence[str],
+        config_file: str | None = None,
+    ) -> dict[str, tuple[str, str]]:
+        """Run several ansible-config commands at once and get their details.
+
+        Each action is a separate ansible-runner invocation, and with an execution
+        environment a separate container, so they are started together rather than one
+        after another. Artifact rotation removes the oldest artifact directories when a
+        run starts, so when fewer are kept than actions requested the runs are made
+        one after another.
+
+        Args:
+            actions: The configuration fetch actions to perform, see
+                :meth:`fetch_ansible_config`
+            config_file: Path to configuration file, defaults to first
+                file found in precedence. Defaults to ``None``.
+
+        Returns:
+            The response and error string (if any) of each action
+        """
+        workers = len(actions) or 1
+        if self._rotate_artifacts is not None and 0 < self._rotate_artifacts < workers:
+            workers = 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                action: executor.submit(self.fetch_ansible_config, action, config_file)
+                for action in actions
+            }
+        return {action: future.result() for action, future in futures.items()}
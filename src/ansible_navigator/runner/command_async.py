@@ -6,16 +6,41 @@ standard out and error from the command run and populates the
 queue with messages.
 """
 
-from copy import deepcopy
-from queue import Queue
-from threading import Thread
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 from typing import Any
 
+import ansible_runner
+
 from ansible_runner import run_command_async
 
 from .command_base import CommandBase
 
 
+if TYPE_CHECKING:
+    from queue import Queue
+    from threading import Event
+    from threading import Thread
+
+    from ansible_runner import Runner
+
+
+def shallow_copy_event(event: dict[str, Any]) -> dict[str, Any]:
+    """Copy an ansible-runner event and its event data, sharing nested values.
+
+    Args:
+        event: The event from ansible-runner
+
+    Returns:
+        The copied event
+    """
+    new_event = event.copy()
+    if isinstance(event.get("event_data"), dict):
+        new_event["event_data"] = event["event_data"].copy()
+    return new_event
+
+
 class CommandAsync(CommandBase):
     """A wrapper for the asynchronous runner."""
 
@@ -24,6 +49,7 @@ class CommandAsync(CommandBase):
         executable_cmd: str,
         queue: Queue[Any],
         write_job_events: bool,
+        events_queued: Event | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the arguments for the ``run_command_async`` interface of ``ansible-runner``.
@@ -35,15 +61,34 @@ class CommandAsync(CommandBase):
             queue: The queue to post events from ``ansible-runner``
             write_job_events: Allows job_events to be processed by
                 ``ansible-runner``
+            events_queued: Set each time an event is posted to the queue
             **kwargs: The arguments for the async runner call
         """
         self._queue = queue
+        self._events_queued = events_queued
         self._write_job_events = write_job_events
         super().__init__(executable_cmd, **kwargs)
 
-    def _event_handler(self, event: Any) -> bool:
+    @property
+    def event_shared(self) -> bool:
+        """Determine if ansible-runner uses an event after it has been handled.
+
+        The event is written to the job_events directory and passed to any
+        ansible-runner plugins after the event handler returns.
+
+        Returns:
+            True if ansible-runner still needs the event once handled
+        """
+        return self._write_job_events or bool(ansible_runner.plugins)
+
+    def _event_handler(self, event: dict[str, Any]) -> bool:
         """Handle the event from ansible-runner.
 
+        When ansible-runner is done with the event once handled, ownership of it
+        is transferred to the queue. Otherwise the consumer receives a shallow
+        copy of the event and its ``event_data``, the only levels it updates,
+        leaving nested results such as ``res`` shared.
+
         Args:
             event: The event from ansible-runner
 
@@ -51,10 +96,23 @@ class CommandAsync(CommandBase):
             The value of ``self._write_job_events``, a boolean
         """
         self._logger.debug("ansible-runner event handle: %s", event)
-        new_event = deepcopy(event)
-        self._queue.put(new_event)
+        if self.event_shared:
+            event = shallow_copy_event(event)
+        self._queue.put(event)
+        if self._events_queued is not None:
+            self._events_queued.set()
         return self._write_job_events
 
+    def runner_finished_callback(self, runner: Runner) -> None:
+        """Call when runner finishes, waking anything waiting for events.
+
+        Args:
+            runner: A runner instance
+        """
+        super().runner_finished_callback(runner)
+        if self._events_queued is not None:
+            self._events_queued.set()
+
     def run(self) -> Thread:
         """Initiate the execution of the runner command in async mode.
 
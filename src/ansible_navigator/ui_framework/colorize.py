@@ -11,10 +11,13 @@ import json
 import logging
 import re
 
-from itertools import chain
+from collections import OrderedDict
+from collections.abc import Sequence
+from itertools import pairwise
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import overload
 
 from ansible_navigator.tm_tokenize.grammars import Grammars
 from ansible_navigator.tm_tokenize.tokenize import tokenize
@@ -29,7 +32,12 @@ from .ui_constants import Decoration
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ansible_navigator.tm_tokenize.compiler import Compiler
     from ansible_navigator.tm_tokenize.region import Regions
+    from ansible_navigator.tm_tokenize.region import Scope
+    from ansible_navigator.tm_tokenize.state import State
     from ansible_navigator.utils.compatibility import Traversable
 
 
@@ -52,14 +60,27 @@ class ColorSchema:
     def __init__(self, schema: dict[str, str | list[Any] | dict[Any, Any]]) -> None:
         """Initialize the ColorSchema class.
 
+        The token colors are indexed by scope once, the first token color listing a scope
+        being the one used for it.
+
         Args:
             schema: The color scheme, theme to use
         """
         self._logger = logging.getLogger(__name__)
         self._schema = schema
+        self._token_colors: dict[str, tuple[str | None, str | None]] = {}
+        for token_color in self._schema.get("tokenColors", []):
+            if not isinstance(token_color, dict):
+                continue
+            settings = token_color.get("settings", {})
+            for prop in scope_to_list(token_color.get("scope", [])):
+                self._token_colors.setdefault(
+                    prop,
+                    (settings.get("foreground", None), settings.get("fontStyle", None)),
+                )
+        self._resolved: dict[Scope, tuple[RgbTuple | None, str | None]] = {}
 
-    @functools.lru_cache(maxsize=128)  # noqa: B019
-    def get_color_and_style(self, scope: str) -> tuple[RgbTuple | None, str | None]:
+    def get_color_and_style(self, scope: Scope) -> tuple[RgbTuple | None, str | None]:
         """Get a color from the schema, traverse all to aggregate color and style.
 
         Args:
@@ -68,28 +89,21 @@ class ColorSchema:
         Returns:
             The color in RGB format or nothing
         """
+        try:
+            return self._resolved[scope]
+        except KeyError:
+            pass
         found_color = None
         found_style = None
         for name in scope:
-            for parts in range(len(name.split("."))):
-                prop = name.split()[-1].rsplit(".", parts)[0]
-                color = next(
-                    (
-                        token_color
-                        for token_color in self._schema["tokenColors"]
-                        if (
-                            isinstance(token_color, dict)
-                            and prop in scope_to_list(token_color.get("scope", []))
-                        )
-                    ),
-                    None,
-                )
-                if color:
-                    found_color = color.get("settings", {}).get("foreground", None)
-                    found_style = color.get("settings", {}).get("fontStyle", None)
-        if found_color:
-            found_color = hex_to_rgb(found_color)
-        return found_color, found_style
+            last_name = name.split()[-1]
+            for parts in range(name.count(".") + 1):
+                token_color = self._token_colors.get(last_name.rsplit(".", parts)[0])
+                if token_color:
+                    found_color, found_style = token_color
+        resolved = (hex_to_rgb(found_color) if found_color else None, found_style)
+        self._resolved[scope] = resolved
+        return resolved
 
 
 class Colorize:
@@ -106,6 +120,7 @@ class Colorize:
         self._schema: ColorSchema
         self._grammars = Grammars(str(grammar_dir))
         self._theme_path = Path(str(theme_path))
+        self._ansi = IncrementalAnsiRender()
         self._load()
 
     def _load(self) -> None:
@@ -113,19 +128,18 @@ class Colorize:
         with self._theme_path.open(mode="r", encoding="utf-8") as fh:
             self._schema = ColorSchema(json.load(fh))
 
-    @staticmethod
-    @functools.lru_cache(maxsize=100)
-    def render_ansi(doc: str) -> CursesLines:
+    def render_ansi(self, doc: str | list[str]) -> Sequence[CursesLine]:
         """Convert ansi colored text into curses lines.
 
+        When the text was appended to since the last call, only the new text is converted.
+
         Args:
-            doc: The text to convert
+            doc: The text to convert, a string or a list of lines
 
         Returns:
             Lines ready to present using the TUI
         """
-        lines = tuple(ansi_to_curses(line) for line in doc.splitlines())
-        return CursesLines(lines)
+        return self._ansi.render(doc)
 
     @functools.lru_cache(maxsize=100)  # noqa: B019
     def render(self, doc: str, scope: str) -> list[list[SimpleLinePart]]:
@@ -138,12 +152,8 @@ class Colorize:
         Returns:
             A list of lines, each a list of dicts
         """
-        try:
-            compiler = self._grammars.compiler_for_scope(scope)
-        except KeyError:
-            compiler = None
-
-        if compiler and scope != "no_color":
+        compiler = self._compiler(scope)
+        if compiler:
             state = compiler.root_state
             lines = []
             for line_idx, line in enumerate(doc.splitlines()):
@@ -152,19 +162,7 @@ class Colorize:
                 try:
                     state, regions = tokenize(compiler, state, line, first_line)
                 except Exception as exc:  # noqa: BLE001
-                    self._logger.critical(
-                        (
-                            "An unexpected error occurred within the tokenization"
-                            " subsystem.  Please log an issue with the following:"
-                        ),
-                    )
-                    self._logger.critical(
-                        "  Err: '%s', Scope: '%s', Line follows....",
-                        str(exc),
-                        scope,
-                    )
-                    self._logger.critical("  '%s'", line)
-                    self._logger.critical("  The current content will be rendered without color")
+                    log_tokenize_error(self._logger, exc, scope, line)
                     break
                 else:
                     lines.append((regions, line))
@@ -180,6 +178,208 @@ class Colorize:
         ]
         return res
 
+    def render_incremental(self, doc: str, scope: str) -> Sequence[list[SimpleLinePart]]:
+        """Render text lines into lines of columns and colors as they are requested.
+
+        Markdown is rendered at once, since removing the markup changes the lines.
+
+        Args:
+            doc: The string to split, tokenize and color
+            scope: The scope, aka the format of the string
+
+        Returns:
+            A sequence of lines, each a list of line parts
+        """
+        if scope == "text.html.markdown":
+            return self.render(doc=doc, scope=scope)
+        return IncrementalRender(
+            doc=doc,
+            scope=scope,
+            compiler=self._compiler(scope),
+            schema=self._schema,
+        )
+
+    def _compiler(self, scope: str) -> Compiler | None:
+        """Get the compiler for a scope.
+
+        Args:
+            scope: The scope, aka the format of the string
+
+        Returns:
+            The compiler or nothing if the scope should not be colored
+        """
+        if scope == "no_color":
+            return None
+        try:
+            return self._grammars.compiler_for_scope(scope)
+        except KeyError:
+            return None
+
+
+CHECKPOINT_INTERVAL = 100
+"""The number of lines between the tokenizer states kept by an incremental render."""
+
+RENDERED_CHUNKS = 32
+"""The number of chunks of rendered lines kept by an incremental render."""
+
+
+class IncrementalRender(Sequence[list[SimpleLinePart]]):
+    """The lines of a document, tokenized and colored when they are requested.
+
+    The tokenizer state at the start of every ``CHECKPOINT_INTERVAL`` lines is kept,
+    so lines are rendered a chunk at a time from the nearest checkpoint. Only the most
+    recently used chunks are kept, rendering the visible lines takes the same time
+    regardless of the size of the document, once the checkpoints before them are known.
+    """
+
+    def __init__(
+        self,
+        doc: str,
+        scope: str,
+        compiler: Compiler | None,
+        schema: ColorSchema,
+    ) -> None:
+        """Initialize the incremental render.
+
+        Args:
+            doc: The string to split, tokenize and color
+            scope: The scope, aka the format of the string
+            compiler: The compiler for the scope or nothing if it should not be colored
+            schema: An instance of the ColorSchema
+        """
+        self._logger = logging.getLogger(__name__)
+        self._lines = doc.splitlines()
+        self._scope = scope
+        self._compiler = compiler
+        self._schema = schema
+        self._checkpoints: list[State] = [compiler.root_state] if compiler else []
+        self._chunks: OrderedDict[int, list[list[SimpleLinePart]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of lines.
+
+        Returns:
+            The number of lines in the document
+        """
+        return len(self._lines)
+
+    @overload
+    def __getitem__(self, index: int) -> list[SimpleLinePart]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[list[SimpleLinePart]]: ...
+
+    def __getitem__(
+        self,
+        index: int | slice,
+    ) -> list[SimpleLinePart] | list[list[SimpleLinePart]]:
+        """Get one or more rendered lines.
+
+        Args:
+            index: The index or slice of the lines
+
+        Returns:
+            The line parts of the line or a list of them for a slice
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        if isinstance(index, slice):
+            return [self[line_idx] for line_idx in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "line index out of range"
+            raise IndexError(msg)
+        chunk_idx, offset = divmod(index, CHECKPOINT_INTERVAL)
+        return self._chunk(chunk_idx)[offset]
+
+    def _chunk(self, chunk_idx: int) -> list[list[SimpleLinePart]]:
+        """Get the rendered lines of a chunk, rendering it if necessary.
+
+        Args:
+            chunk_idx: The index of the chunk
+
+        Returns:
+            The rendered lines of the chunk
+        """
+        if chunk_idx in self._chunks:
+            self._chunks.move_to_end(chunk_idx)
+            return self._chunks[chunk_idx]
+        # Tokenize the chunks before this one to find its checkpoint, keeping nothing else
+        while self._compiler and len(self._checkpoints) <= chunk_idx:
+            self._tokenize(len(self._checkpoints) - 1)
+        tokenized = self._tokenize(chunk_idx) if self._compiler else None
+        start = chunk_idx * CHECKPOINT_INTERVAL
+        if tokenized is None:
+            chunk = [
+                [SimpleLinePart(column=0, chars=line, color=None, style=None)]
+                for line in self._lines[start : start + CHECKPOINT_INTERVAL]
+            ]
+        else:
+            chunk = columns_and_colors(tokenized, self._schema)
+        self._chunks[chunk_idx] = chunk
+        if len(self._chunks) > RENDERED_CHUNKS:
+            self._chunks.popitem(last=False)
+        return chunk
+
+    def _tokenize(self, chunk_idx: int) -> list[tuple[Regions, str]] | None:
+        """Tokenize the lines of a chunk from its checkpoint, adding the next checkpoint.
+
+        When tokenization fails, the remainder of the document is not colored.
+
+        Args:
+            chunk_idx: The index of the chunk
+
+        Returns:
+            The lines of the chunk and their regions or nothing if tokenization failed
+        """
+        if self._compiler is None:
+            return None
+        state = self._checkpoints[chunk_idx]
+        start = chunk_idx * CHECKPOINT_INTERVAL
+        lines = []
+        for line_idx, line in enumerate(
+            self._lines[start : start + CHECKPOINT_INTERVAL],
+            start=start,
+        ):
+            line += "\n"
+            try:
+                state, regions = tokenize(self._compiler, state, line, line_idx == 0)
+            except Exception as exc:  # noqa: BLE001
+                log_tokenize_error(self._logger, exc, self._scope, line)
+                self._compiler = None
+                self._chunks.clear()
+                return None
+            lines.append((regions, line))
+        if len(self._checkpoints) == chunk_idx + 1:
+            self._checkpoints.append(state)
+        return lines
+
+
+def log_tokenize_error(logger: logging.Logger, exc: Exception, scope: str, line: str) -> None:
+    """Log an unexpected error from the tokenization subsystem.
+
+    Args:
+        logger: The logger to use
+        exc: The exception raised
+        scope: The scope, aka the format of the string
+        line: The line being tokenized
+    """
+    logger.critical(
+        (
+            "An unexpected error occurred within the tokenization"
+            " subsystem.  Please log an issue with the following:"
+        ),
+    )
+    logger.critical(
+        "  Err: '%s', Scope: '%s', Line follows....",
+        str(exc),
+        scope,
+    )
+    logger.critical("  '%s'", line)
+    logger.critical("  The current content will be rendered without color")
+
 
 def scope_to_list(scope: str | list[Any]) -> list[Any]:
     """Convert a token scope to a list if necessary.
@@ -307,64 +507,93 @@ def rgb_to_ansi(red: int, green: int, blue: int, colors: int) -> int:
     return ansi
 
 
-def _apply_regions_to_parts(
-    line_parts: list[SimpleLinePart],
+def _painted_spans(
+    line_text: str,
     regions: Regions,
     schema: ColorSchema,
-) -> None:
-    """Apply color and style from regions to line parts.
+) -> Iterator[tuple[int, int, RgbTuple | None, str | None]]:
+    """Paint overlapping regions onto a line, later regions taking precedence.
+
+    Regions from the tokenizer are ordered and do not overlap, this is only used
+    for the unusual case where they do.
 
     Args:
-        line_parts: The individual character parts of a line
+        line_text: The line text
         regions: The tokenized regions for the line
         schema: An instance of the ColorSchema
+
+    Yields:
+        The start, end, color and style of each character
     """
+    colors: list[RgbTuple | None] = [None] * len(line_text)
+    styles: list[str | None] = [None] * len(line_text)
     for region in regions:
         color, style = schema.get_color_and_style(region.scope)
+        end = min(region.end, len(line_text))
         if color:
-            for idx in range(region.start, region.end):
-                line_parts[idx].color = color
+            colors[region.start : end] = [color] * (end - region.start)
         if style:
-            for idx in range(region.start, region.end):
-                line_parts[idx].style = style
+            styles[region.start : end] = [style] * (end - region.start)
+    for idx, (color, style) in enumerate(zip(colors, styles, strict=True)):
+        yield idx, idx + 1, color, style
 
 
-def _compress_line_parts(
-    line_parts: list[SimpleLinePart],
+def _region_spans(
     line_text: str,
-) -> list[SimpleLinePart]:
-    """Compress adjacent line parts with the same color and style.
+    regions: Regions,
+    schema: ColorSchema,
+) -> Iterator[tuple[int, int, RgbTuple | None, str | None]]:
+    """Map the regions of a line to spans of color and style covering the whole line.
 
     Args:
-        line_parts: The individual character parts of a line
-        line_text: The original line text
+        line_text: The line text
+        regions: The tokenized regions for the line
+        schema: An instance of the ColorSchema
 
-    Returns:
-        Compressed line parts
+    Yields:
+        The start, end, color and style of each span
     """
-    if not line_parts:
-        return [SimpleLinePart(chars=line_text, color=None, column=0, style=None)]
-    grouped = [line_parts.pop(0)]
-    while line_parts:
-        entry = line_parts.pop(0)
-        if entry.color == grouped[-1].color and entry.style == grouped[-1].style:
-            grouped[-1].chars += entry.chars
-        else:
-            grouped.append(entry)
-    return grouped
+    if any(previous.end > region.start for previous, region in pairwise(regions)):
+        yield from _painted_spans(line_text, regions, schema)
+        return
+    position = 0
+    for region in regions:
+        if region.start > position:
+            yield position, region.start, None, None
+        position = min(region.end, len(line_text))
+        yield region.start, position, *schema.get_color_and_style(region.scope)
+    if position < len(line_text):
+        yield position, len(line_text), None, None
 
 
-def _update_line_part_columns(results: list[list[SimpleLinePart]]) -> None:
-    """Update column offsets in each line part based on preceding text lengths.
+def _line_parts(
+    line_text: str,
+    regions: Regions,
+    schema: ColorSchema,
+) -> list[SimpleLinePart]:
+    """Build the parts of a line, merging adjacent spans with the same color and style.
 
     Args:
-        results: Lines of text parts to update
+        line_text: The line text
+        regions: The tokenized regions for the line
+        schema: An instance of the ColorSchema
+
+    Returns:
+        The line parts, each with the column where it starts
     """
-    for result in results:
-        column = 0
-        for line_part in result:
-            line_part.column = column
-            column += len(line_part.chars)
+    parts: list[SimpleLinePart] = []
+    run_start = 0
+    run_attrs: tuple[RgbTuple | None, str | None] | None = None
+    for start, end, color, style in _region_spans(line_text, regions, schema):
+        if start >= end or (color, style) == run_attrs:
+            continue
+        if run_attrs is not None:
+            parts.append(SimpleLinePart(line_text[run_start:start], run_start, *run_attrs))
+        run_start, run_attrs = start, (color, style)
+    if run_attrs is None:
+        return [SimpleLinePart(chars=line_text, color=None, column=0, style=None)]
+    parts.append(SimpleLinePart(line_text[run_start:], run_start, *run_attrs))
+    return parts
 
 
 def columns_and_colors(
@@ -373,6 +602,9 @@ def columns_and_colors(
 ) -> list[list[SimpleLinePart]]:
     """Convert to colors and columns.
 
+    Each line is rendered from the spans of its regions, characters of like color and
+    decoration are grouped as the spans are walked.
+
     Args:
         lines: Lines of text and their regions
         schema: An instance of the ColorSchema
@@ -380,68 +612,79 @@ def columns_and_colors(
     Returns:
         Lines of text, each broken into sections
     """
-    results: list[list[SimpleLinePart]] = []
-
-    for line in lines:
-        # Break the into 1 character parts, temporarily set the column to 0
-        line_parts = [
-            SimpleLinePart(chars=character, color=None, column=0, style=None)
-            for character in line[1]
-        ]
+    return [_line_parts(line_text, regions, schema) for regions, line_text in lines]
 
-        # Replace the color with the RgbTuple
-        _apply_regions_to_parts(line_parts, line[0], schema)
 
-        # Compress the line, grouping characters of like color and decoration
-        results.append(_compress_line_parts(line_parts, line[1]))
+ANSI_CONTROL_SEQUENCE = re.compile(r"\x1b\[([\d;]*)([@-~])")
+"""A control sequence, the final character ``m`` selects the graphic rendition."""
 
-    # Update the column in each line part, based on the total of the preceding text lengths
-    _update_line_part_columns(results)
+ANSI_16_COLORS = {
+    **{code: color for color, code in enumerate(range(30, 38))},
+    **{code: color for color, code in enumerate(range(90, 98), start=8)},
+}
+"""The foreground color codes of the 16 basic colors and their colors."""
+
+ANSI_STYLES_OFF = {
+    22: (CURSES_STYLES[1] or 0) | (CURSES_STYLES[2] or 0),
+    23: CURSES_STYLES[3] or 0,
+    24: CURSES_STYLES[4] or 0,
+    25: CURSES_STYLES[5] or 0,
+    27: CURSES_STYLES[7] or 0,
+    28: CURSES_STYLES[8] or 0,
+}
+"""The codes removing styles and the decorations they remove."""
 
-    return results
 
+@functools.lru_cache(maxsize=1024)
+def _select_graphic_rendition(parameters: str, color: int, style: int) -> tuple[int, int]:
+    """Apply the parameters of a select graphic rendition sequence to a color and style.
 
-def _parse_ansi_match(
-    cap: dict[str, str | None],
-    color: int = 0,
-    style: int = 0,
-) -> tuple[int, int]:
-    """Parse an ANSI color match groupdict into a color and style.
+    Background colors are not supported, their parameters are skipped.
 
     Args:
-        cap: The groupdict from a color_regex match
-        color: The current color state to preserve across calls
-        style: The current style state to preserve across calls
+        parameters: The parameters of the sequence, separated by ``;``
+        color: The current color
+        style: The current style, a combination of curses decorations
 
     Returns:
-        A (color, style) tuple
+        The color and style
     """
-    one = cap["one"]
-    two = cap["two"]
-    if cap["fg_action"] == "39;" or (one == "0" and two is None):
-        pass  # default color
-    elif cap["fg_action"] == "38;5;":
-        color = int(one)  # type: ignore[arg-type]
-        if two:
-            style = CURSES_STYLES.get(int(two)) or 0
-    elif not cap["fg_action"]:
-        ansi_16 = list(chain(range(30, 38), range(90, 98)))
-        if two is None:
-            color = ansi_16.index(int(one)) if int(one) in ansi_16 else int(one)  # type: ignore[arg-type]
-        else:
-            color = ansi_16.index(int(two)) if int(two) in ansi_16 else int(two)
-            style = CURSES_STYLES.get(int(one)) or 0  # type: ignore[arg-type]
+    codes = [int(code) if code else 0 for code in parameters.split(";")]
+    idx = 0
+    while idx < len(codes):
+        code = codes[idx]
+        if code == 0:
+            color, style = 0, 0
+        elif code in ANSI_16_COLORS:
+            color = ANSI_16_COLORS[code]
+        elif code == 39:
+            color = 0
+        elif code in CURSES_STYLES:
+            style |= CURSES_STYLES[code] or 0
+        elif code in ANSI_STYLES_OFF:
+            style &= ~ANSI_STYLES_OFF[code]
+        elif code in (38, 48) and idx + 2 < len(codes) and codes[idx + 1] == 5:
+            if code == 38:
+                color = codes[idx + 2]
+            idx += 2
+        elif code in (38, 48) and idx + 4 < len(codes) and codes[idx + 1] == 2:
+            if code == 38:
+                color = _rgb_to_ansi_256(*codes[idx + 2 : idx + 5])
+            idx += 4
+        idx += 1
     return color, style
 
 
-def ansi_to_curses(line: str) -> CursesLine:
-    """Convert ansible color codes to curses colors.
+def _ansi_line_to_curses(line: str, color: int, style: int) -> tuple[CursesLine, int, int]:
+    """Convert one line with ansi color codes to curses colors, starting with a color and style.
 
     Args:
         line: A string with ansi colors
+        color: The color at the start of the line
+        style: The style at the start of the line
 
     Returns:
-        A line ready for presentation in the TUI
+        The line ready for presentation in the TUI, the color and style at its end
     """
     if line == "":
         line_part = CursesLinePart(
@@ -450,42 +693,158 @@ def ansi_to_curses(line: str) -> CursesLine:
             color=Color.BLACK,
             decoration=Decoration.NORMAL,
         )
-        return CursesLine((line_part,))
+        return CursesLine((line_part,)), color, style
+    if "\x1b" not in line:
+        return CursesLine((CursesLinePart(0, line, color, style),)), color, style
 
     printable = []
-    ansi_regex = re.compile(r"(\x1b\[[\d;]*m)")
-    color_regex = re.compile(
-        r"""(?x)
-            \x1b\[                              # Control Sequence Introducer
-            (?P<fg_action>(38;5|39);)?          # optional FG color action
-            (?P<_bg_action>(48;5|49);)?         # optional BG color action
-            (?P<one>\d+)                        # required, one number
-            (;(?P<two>\d+))?                    # optional 2nd number
-            m
-        """,
-    )
-    parts = ansi_regex.split(line)
+    position = 0
     colno = 0
-    color = 0
-    style = 0
-    while parts:
-        part = parts.pop(0)
-        if part:
-            match = color_regex.match(part)
-            if match:
-                color, style = _parse_ansi_match(match.groupdict(), color, style)
-            else:
-                curses_line = CursesLinePart(
-                    column=colno,
-                    string=part,
-                    color=color,
-                    decoration=style,
-                )
-                printable.append(curses_line)
-                colno += len(part)
-                color = 0
-                style = 0
-    return CursesLine(tuple(printable))
+    for match in ANSI_CONTROL_SEQUENCE.finditer(line):
+        start, end = match.span()
+        if start > position:
+            printable.append(CursesLinePart(colno, line[position:start], color, style))
+            colno += start - position
+        parameters, final = match.groups()
+        if final == "m":
+            color, style = _select_graphic_rendition(parameters, color, style)
+        position = end
+    if position < len(line):
+        printable.append(CursesLinePart(colno, line[position:], color, style))
+    return CursesLine(tuple(printable)), color, style
+
+
+def ansi_to_curses(line: str) -> CursesLine:
+    """Convert ansible color codes to curses colors.
+
+    Args:
+        line: A string with ansi colors
+
+    Returns:
+        A line ready for presentation in the TUI
+    """
+    return _ansi_line_to_curses(line, 0, 0)[0]
+
+
+class LinesView(Sequence[CursesLine]):
+    """The lines converted so far, lines converted later are not part of the view."""
+
+    def __init__(self, lines: list[CursesLine]) -> None:
+        """Initialize the lines view.
+
+        Args:
+            lines: The converted lines, only ever appended to
+        """
+        self._lines = lines
+        self._length = len(lines)
+
+    def __len__(self) -> int:
+        """Get the number of lines.
+
+        Returns:
+            The number of lines
+        """
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> CursesLine: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> CursesLines: ...
+
+    def __getitem__(self, index: int | slice) -> CursesLine | CursesLines:
+        """Get one or more lines.
+
+        Args:
+            index: The index or slice of the lines
+
+        Returns:
+            The line or lines
+        """
+        if isinstance(index, slice):
+            return CursesLines(tuple(self._lines[idx] for idx in range(self._length)[index]))
+        return self._lines[range(self._length)[index]]
+
+
+class IncrementalAnsiRender:
+    """Convert ansi colored text into curses lines, only converting text appended since the last.
+
+    The text is either a string or a list of complete lines, such as the standard output
+    of a playbook. The color and style are carried from one line to the next. The last line
+    of a string is converted again when text is appended, in case it was not complete.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the incremental ansi render."""
+        self._source: str | list[str] | None = None
+        self._source_length = 0
+        self._lines: list[CursesLine] = []
+        self._rendered = LinesView(self._lines)
+        self._last_line_start = 0
+        self._last_line_state = (0, 0)
+        self._state = (0, 0)
+
+    def render(self, doc: str | list[str]) -> Sequence[CursesLine]:
+        """Convert ansi colored text into curses lines.
+
+        Args:
+            doc: The text to convert, a string or a list of lines
+
+        Returns:
+            Lines ready to present using the TUI
+        """
+        if isinstance(doc, list):
+            return self._render_lines(doc)
+        if doc == self._source:
+            return self._rendered
+        if self._lines and isinstance(self._source, str) and doc.startswith(self._source):
+            start = self._last_line_start
+            color, style = self._last_line_state
+            del self._lines[-1]
+        else:
+            start = 0
+            color, style = 0, 0
+            self._lines = []
+        tail = doc[start:]
+        lines = tail.splitlines()
+        if lines:
+            self._last_line_start = start + len(tail) - len(tail.splitlines(keepends=True)[-1])
+        for line in lines:
+            self._last_line_state = (color, style)
+            curses_line, color, style = _ansi_line_to_curses(line, color, style)
+            self._lines.append(curses_line)
+        self._source = doc
+        self._rendered = LinesView(self._lines)
+        return self._rendered
+
+    def _render_lines(self, lines: list[str]) -> Sequence[CursesLine]:
+        """Convert ansi colored lines into curses lines.
+
+        When the same list was appended to since the last call, only the lines appended
+        are converted.
+
+        Args:
+            lines: The lines to convert
+
+        Returns:
+            Lines ready to present using the TUI
+        """
+        if lines is self._source and len(lines) >= self._source_length:
+            if len(lines) == self._source_length:
+                return self._rendered
+            color, style = self._state
+        else:
+            color, style = 0, 0
+            self._lines = []
+            self._source_length = 0
+        for line in lines[self._source_length :]:
+            curses_line, color, style = _ansi_line_to_curses(line, color, style)
+            self._lines.append(curses_line)
+        self._source = lines
+        self._source_length = len(lines)
+        self._state = (color, style)
+        self._rendered = LinesView(self._lines)
+        return self._rendered
 
 
 def _process_markdown_part(
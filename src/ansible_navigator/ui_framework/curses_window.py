@@ -7,14 +7,15 @@ import json
 import logging
 
 from typing import TYPE_CHECKING
+from typing import NamedTuple
 
 from .colorize import hex_to_rgb_curses
+from .curses_defs import CursesLine
 
 
 if TYPE_CHECKING:
     from _curses import window
 
-    from .curses_defs import CursesLine
     from .curses_defs import CursesLinePart
     from .ui_config import UIConfig
 
@@ -45,6 +46,29 @@ COLOR_MAP = {
 }
 
 
+class Frame(dict[int, list[tuple[str | None, CursesLine]]]):
+    """The lines to draw on each row of a window, in the order they are drawn."""
+
+    def add(self, lineno: int, line: CursesLine, prefix: str | None = None) -> None:
+        """Add a line to a row of the frame.
+
+        Args:
+            lineno: The row
+            line: The line to add
+            prefix: The prefix for the line
+        """
+        self.setdefault(lineno, []).append((prefix, line))
+
+
+class FrameStats(NamedTuple):
+    """What was written to a window to draw a frame."""
+
+    #: The number of rows written
+    rows: int
+    #: The number of bytes of text written
+    text_bytes: int
+
+
 class CursesWindow:
     # pylint: disable=too-many-instance-attributes
     """Abstraction for a curses window."""
@@ -64,6 +88,9 @@ class CursesWindow:
         self._theme_dir: str
         self._term_osc4_support: bool
         self._ui_config = ui_config
+        self._frame = Frame()
+        self._frame_size: tuple[int, int] | None = None
+        self.frame_stats = FrameStats(rows=0, text_bytes=0)
         self._logger.debug("self._ui_config: %s", self._ui_config)
         self._set_colors()
 
@@ -190,6 +217,47 @@ class CursesWindow:
             for line_part in line:
                 self._render_line_part(window, lineno, line_part, len(prefix or ""))
 
+    def _draw_frame(self, window: Window, frame: Frame) -> None:
+        """Draw a frame to a window, rewriting only the rows changed since the last frame.
+
+        The window is erased and drawn in full when its size changes or the last frame
+        was forgotten.
+
+        Args:
+            window: A curses window
+            frame: The lines to draw on each row
+        """
+        size = window.getmaxyx()
+        if size != self._frame_size:
+            window.erase()
+            self._frame = Frame()
+            self._frame_size = size
+
+        rows = text_bytes = 0
+        for lineno in self._frame.keys() - frame.keys():
+            window.move(lineno, 0)
+            window.clrtoeol()
+            rows += 1
+        for lineno, row in frame.items():
+            if self._frame.get(lineno) == row:
+                continue
+            window.move(lineno, 0)
+            window.clrtoeol()
+            for prefix, line in row:
+                self._add_line(window=window, lineno=lineno, line=line, prefix=prefix)
+                text_bytes += len((prefix or "").encode())
+                text_bytes += sum(len(line_part.string.encode()) for line_part in line)
+            rows += 1
+        self._frame = frame
+        self.frame_stats = FrameStats(rows=rows, text_bytes=text_bytes)
+        if rows:
+            self._logger.debug("Frame drawn: %s", self.frame_stats)
+
+    def _forget_frame(self) -> None:
+        """Forget the last frame, the window was drawn over or cleared since."""
+        self._frame = Frame()
+        self._frame_size = None
+
     def _set_colors(self) -> None:
         """Set the colors for curses."""
         # curses colors may have already been initialized
@@ -0,0 +1,161 @@
+"""Find the menu items matching a filter."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from re import Pattern
+
+
+FILTER_CACHE_SIZE = 8
+"""The number of filter results kept by the filter engine."""
+
+REGEX_SPECIAL = frozenset(".^$*+?{}[]\\|()")
+"""Characters with a special meaning in a regular expression."""
+
+
+class FilterKey(NamedTuple):
+    """A filter applied to the columns of a menu."""
+
+    #: The identity of the menu items
+    items_id: int
+    #: The filter
+    pattern: str
+    #: The flags of the filter
+    flags: int
+    #: The columns the filter is applied to
+    columns: tuple[str, ...]
+
+
+class FilterResult(NamedTuple):
+    """The result of a filter applied to the columns of a menu."""
+
+    #: The menu items, referenced so their identity cannot be reused
+    items: Sequence[Any]
+    #: The values of the columns of each menu item when the filter was applied
+    values: list[tuple[Any, ...]]
+    #: Whether each menu item matched the filter
+    matched: list[bool]
+    #: The indices of the menu items that matched
+    indices: tuple[int, ...]
+
+
+def is_literal(pattern: str) -> bool:
+    """Determine if a filter matches its own text only.
+
+    Args:
+        pattern: The filter
+
+    Returns:
+        True if the filter has no characters with a special meaning
+    """
+    return REGEX_SPECIAL.isdisjoint(pattern)
+
+
+class FilterEngine:
+    """Find the menu items matching a filter, reusing previous results.
+
+    Results are kept for the most recently used filters. When a filter is applied to
+    the same menu items again, only items appended or with changed column values are
+    searched. When a literal filter is extended, only the items the shorter filter
+    matched are searched, the others cannot match it either.
+    """
+
+    def __init__(self, size: int = FILTER_CACHE_SIZE) -> None:
+        """Initialize the filter engine.
+
+        Args:
+            size: The number of filter results to keep
+        """
+        self._results: OrderedDict[FilterKey, FilterResult] = OrderedDict()
+        self._size = size
+        self.searched = 0
+
+    def indices(
+        self,
+        regex: Pattern[str],
+        items: Sequence[Any],
+        columns: Sequence[str],
+    ) -> tuple[int, ...]:
+        """Get the indices of the menu items with a column matching a filter.
+
+        Args:
+            regex: The filter
+            items: The menu items, each a dictionary
+            columns: The keys of the columns to search
+
+        Returns:
+            The indices of the matching menu items
+        """
+        key = FilterKey(
+            items_id=id(items),
+            pattern=regex.pattern,
+            flags=regex.flags,
+            columns=tuple(columns),
+        )
+        base = self._results.get(key)
+        exact = base is not None and base.items is items
+        if not exact:
+            base = self._narrower(key, items)
+
+        values = [tuple(map(item.get, key.columns)) for item in items]
+        matched = []
+        for idx, item_values in enumerate(values):
+            if (
+                base is not None
+                and idx < len(base.values)
+                and base.values[idx] == item_values
+                and (exact or not base.matched[idx])
+            ):
+                matched.append(base.matched[idx])
+                continue
+            self.searched += 1
+            matched.append(any(regex.search(str(value)) for value in item_values))
+
+        result = FilterResult(
+            items=items,
+            values=values,
+            matched=matched,
+            indices=tuple(idx for idx, match in enumerate(matched) if match),
+        )
+        self._results[key] = result
+        self._results.move_to_end(key)
+        while len(self._results) > self._size:
+            self._results.popitem(last=False)
+        return result.indices
+
+    def _narrower(self, key: FilterKey, items: Sequence[Any]) -> FilterResult | None:
+        """Find the result of a shorter literal filter the filter extends.
+
+        Args:
+            key: The filter applied
+            items: The menu items
+
+        Returns:
+            The result of the longest shorter literal filter, if any
+        """
+        if not is_literal(key.pattern):
+            return None
+        candidates = [
+            (len(other.pattern), result)
+            for other, result in self._results.items()
+            if other.items_id == key.items_id
+            and result.items is items
+            and other.flags == key.flags
+            and other.columns == key.columns
+            and is_literal(other.pattern)
+            and other.pattern in key.pattern
+        ]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda candidate: candidate[0])[1]
+
+    def clear(self) -> None:
+        """Remove all filter results."""
+        self._results.clear()
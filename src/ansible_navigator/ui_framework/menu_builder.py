@@ -8,6 +8,7 @@ import re
 
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import NamedTuple
 
 from .curses_defs import CursesLine
 from .curses_defs import CursesLinePart
@@ -18,6 +19,7 @@ from .utils import distribute
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Sequence
 
     from ansible_navigator.content_defs import ContentBase
     from ansible_navigator.content_defs import ContentTypeSequence
@@ -25,6 +27,117 @@ if TYPE_CHECKING:
     from .ui_config import UIConfig
 
 
+def _column_heading(column: str) -> str:
+    """Get the heading of a menu column, without the leading underscores.
+
+    Args:
+        column: The column (key) in the dicts
+
+    Returns:
+        The heading of the column
+    """
+    return re.sub("^__", "", column)
+
+
+class MenuLayout(NamedTuple):
+    """The placement of the columns of a menu."""
+
+    #: The starting position of each column
+    column_starts: list[int]
+    #: The width of each column, distributed across the screen
+    column_widths: list[int]
+
+
+class MenuModel:
+    """The cells of a menu and the widths of its columns, kept between redraws.
+
+    Only the menu items showing are stringified, each once. When the model is updated
+    with the same menu items, a showing item is stringified again only if its column
+    values changed. The width of each column is that of the widest showing cell, and
+    the columns are laid out again only when the screen width or a column width changes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the menu model."""
+        self._items: ContentTypeSequence | None = None
+        self._columns: tuple[str, ...] = ()
+        self._rows: dict[int, tuple[tuple[Any, ...], tuple[str, ...]]] = {}
+        self._widths: list[int] = []
+        self._layout_key: tuple[int, tuple[int, ...]] | None = None
+        self._layout = MenuLayout(column_starts=[0], column_widths=[])
+        self.stringified = 0
+        self.layouts = 0
+
+    def update(
+        self,
+        items: ContentTypeSequence,
+        columns: Sequence[str],
+        progress_bar_width: int,
+        indices: Sequence[int],
+    ) -> None:
+        """Bring the cells and column widths of the showing menu items up to date.
+
+        Percentages are converted to progress bars in the menu items, in place, as
+        the items are stringified.
+
+        Args:
+            items: The menu items, each a dict or content
+            columns: The columns (keys) to use in the menu items
+            progress_bar_width: The width of a progress bar
+            indices: The indices of the menu items showing
+        """
+        if items is not self._items or tuple(columns) != self._columns:
+            self._items = items
+            self._columns = tuple(columns)
+            self._rows = {}
+
+        widths = [len(_column_heading(column)) for column in self._columns]
+        for idx in indices:
+            item = items[idx]
+            values = tuple(map(item.get, self._columns))
+            row = self._rows.get(idx)
+            if row is None or values != row[0]:
+                convert_percentage(item, list(self._columns), progress_bar_width)
+                values = tuple(map(item.get, self._columns))
+                row = (values, tuple(map(str, values)))
+                self._rows[idx] = row
+                self.stringified += 1
+            widths = [max(width, len(cell)) for width, cell in zip(widths, row[1], strict=True)]
+        self._widths = widths
+
+    def row(self, idx: int) -> tuple[tuple[Any, ...], tuple[str, ...]]:
+        """Get the column values of a menu item and their text.
+
+        Args:
+            idx: The index of the menu item
+
+        Returns:
+            The column values and the text of each
+        """
+        return self._rows[idx]
+
+    def layout(self, available: int) -> MenuLayout:
+        """Lay out the columns across the width available, if not already.
+
+        Args:
+            available: The width available to the columns
+
+        Returns:
+            The placement of the columns
+        """
+        key = (available, tuple(self._widths))
+        if key != self._layout_key:
+            # add a space
+            column_widths = distribute(available, [width + 1 for width in self._widths])
+            column_starts = [0]
+            for idx, column_width in enumerate(column_widths):
+                column_starts.append(column_width + column_starts[idx])
+            self._layout = MenuLayout(column_starts=column_starts, column_widths=column_widths)
+            self._layout_key = key
+            self.layouts += 1
+        return self._layout
+
+
 class MenuBuilder:
     """Build a menu from list of dicts."""
 
@@ -35,6 +148,8 @@ class MenuBuilder:
         number_colors: int,
         color_menu_item: Callable[..., Any],
         ui_config: UIConfig,
+        *,
+        model: MenuModel | None = None,
     ) -> None:
         """Initialize the menu builder.
 
@@ -46,7 +161,9 @@ class MenuBuilder:
             color_menu_item: The callback for adding color to menu
                 entries
             ui_config: The current user interface configuration
+            model: The menu model kept between redraws, a new one if not provided
         """
+        self._model = MenuModel() if model is None else model
         self._number_colors = number_colors
         self._progress_bar_width = progress_bar_width
         self._screen_width = screen_width
@@ -89,23 +206,9 @@ class MenuBuilder:
         """
         line_prefix_w = len(str(len(dicts))) + len("|")
 
-        for idx in indices:
-            convert_percentage(dicts[idx], cols, self._progress_bar_width)
-
-        lines = [[str(dicts[idx].get(c)) for c in cols] for idx in indices]
-        column_widths = [
-            max(len(str(v)) for v in c)
-            for c in zip(*lines + [[re.sub("^__", "", col) for col in cols]], strict=False)
-        ]
-        # add a space
-        column_widths = [c + 1 for c in column_widths]
-
+        self._model.update(dicts, cols, self._progress_bar_width, indices)
         available = self._screen_width - line_prefix_w - 1  # scrollbar width
-        adjusted_column_widths = distribute(available, column_widths)
-
-        col_starts = [0]
-        for idx, column_width in enumerate(adjusted_column_widths):
-            col_starts.append(column_width + col_starts[idx])
+        col_starts, adjusted_column_widths = self._model.layout(available)
 
         menu_layout = (col_starts, cols, adjusted_column_widths)
         header = self._menu_header_line(menu_layout)
@@ -149,8 +252,7 @@ class MenuBuilder:
             The menu head line
         """
         col_starts, cols, adjusted_column_widths = menu_layout
-        coltext = re.sub("^__", "", cols[colno])
-        coltext = coltext.replace("_", " ")
+        coltext = _column_heading(cols[colno]).replace("_", " ")
         adj_entry = coltext[0 : adjusted_column_widths[colno]].capitalize()
         # right justify header if progress
         if cols[colno] == "__progress":
@@ -188,17 +290,25 @@ class MenuBuilder:
         Returns:
             The menu lines
         """
-        return CursesLines(tuple(self._menu_line(dicts[idx], menu_layout) for idx in indices))
+        return CursesLines(
+            tuple(
+                self._menu_line(dicts[idx], *self._model.row(idx), menu_layout) for idx in indices
+            ),
+        )
 
     def _menu_line(
         self,
         menu_entry: dict[str, Any] | ContentBase[Any],
+        values: tuple[Any, ...],
+        cells: tuple[str, ...],
         menu_layout: tuple[list[Any], ...],
     ) -> CursesLine:
         """Generate one the menu line.
 
         Args:
             menu_entry: One dict from which the menu line will be generated
+            values: The column values of the dict
+            cells: The text of each column value
             menu_layout: A tuple of menu details:
 
             * ``menu_layout[0]``: ``List[int]``, the starting in for each column
@@ -209,11 +319,9 @@ class MenuBuilder:
         Returns:
             A menu line
         """
-        _column_starts, cols, _adjusted_column_widths, _header = menu_layout
-        menu_line = (menu_entry.get(c) for c in cols)
         line_parts = (
-            self._menu_line_part(colno, coltext, menu_entry, menu_layout)
-            for colno, coltext in enumerate(menu_line)
+            self._menu_line_part(colno, coltext, cell, menu_entry, menu_layout)
+            for colno, (coltext, cell) in enumerate(zip(values, cells, strict=True))
         )
         return CursesLine(tuple(line_parts))
 
@@ -221,6 +329,7 @@ class MenuBuilder:
         self,
         colno: int,
         coltext: Any,
+        cell: str,
         menu_entry: dict[str, Any] | ContentBase[Any],
         menu_layout: tuple[list[Any], ...],
     ) -> CursesLinePart:
@@ -229,7 +338,8 @@ class MenuBuilder:
 
         Args:
             colno: The column number of the line part
-            coltext: The text to be placed at the given column
+            coltext: The value to be placed at the given column
+            cell: The text of the value
             menu_entry: The dict from which the menu line will be
                 generated
             menu_layout: A tuple of menu details:
@@ -246,7 +356,7 @@ class MenuBuilder:
 
         color, decoration = self._color_menu_item(colno, cols[colno], menu_entry)
 
-        text = str(coltext)[0 : adjusted_column_widths[colno]]
+        text = cell[0 : adjusted_column_widths[colno]]
 
         is_bool = isinstance(coltext, bool)
         is_number = isinstance(coltext, int | float)
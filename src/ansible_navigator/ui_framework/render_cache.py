@@ -0,0 +1,155 @@
+"""A cache of content rendered for the TUI."""
+
+from __future__ import annotations
+
+import operator
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from itertools import chain
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Sequence
+
+    from ansible_navigator.content_defs import ContentFormat
+    from ansible_navigator.content_defs import ContentView
+
+    from .curses_defs import CursesLine
+    from .curses_defs import CursesLines
+
+
+RENDER_CACHE_SIZE = 16
+"""The number of rendered objects kept by the render cache."""
+
+
+class RenderKey(NamedTuple):
+    """How an object was rendered."""
+
+    #: The identity of the object
+    obj_id: int
+    #: The format the object was serialized to
+    content_format: ContentFormat
+    #: The view of the object
+    content_view: ContentView
+    #: The screen width the heading was built for
+    width: int
+    #: The function that built the heading
+    content_heading: Callable[..., Any]
+    #: The function that filtered the keys of the object, None if they were not filtered
+    filter_content_keys: Callable[..., Any] | None
+
+
+class RenderedContent(NamedTuple):
+    """An object rendered for the TUI."""
+
+    #: The object rendered, referenced so its identity cannot be reused
+    obj: Any
+    #: The members of the object when it was rendered
+    snapshot: tuple[Any, ...]
+    #: The heading for the object
+    heading: CursesLines | None
+    #: The lines of the object
+    lines: Sequence[CursesLine]
+
+
+def snapshot(obj: Any) -> tuple[Any, ...]:
+    """Capture the members of an object, to find out if they were changed in place.
+
+    The keys and values of a mapping or the items of a list are captured. Referencing
+    them ensures none can be replaced by another at the same address, so an identity
+    comparison finds any replaced. Changes within them are not found, the content
+    of a running task is replaced as a whole when it completes.
+
+    Args:
+        obj: The object
+
+    Returns:
+        The members of the object
+    """
+    if isinstance(obj, Mapping):
+        return tuple(chain.from_iterable(obj.items()))
+    if isinstance(obj, list):
+        return tuple(obj)
+    return ()
+
+
+class RenderCache:
+    """A bounded, least recently used cache of rendered objects."""
+
+    def __init__(self, size: int = RENDER_CACHE_SIZE) -> None:
+        """Initialize the render cache.
+
+        Args:
+            size: The number of rendered objects to keep
+        """
+        self._entries: OrderedDict[RenderKey, RenderedContent] = OrderedDict()
+        self._size = size
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Get the number of rendered objects cached.
+
+        Returns:
+            The number of rendered objects
+        """
+        return len(self._entries)
+
+    def get(self, key: RenderKey, obj: Any) -> RenderedContent | None:
+        """Get a rendered object, if it has not changed since it was rendered.
+
+        Args:
+            key: How the object is rendered
+            obj: The object
+
+        Returns:
+            The rendered object or nothing if it needs to be rendered
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            current = snapshot(obj)
+            if (
+                entry.obj is obj
+                and len(current) == len(entry.snapshot)
+                and all(map(operator.is_, current, entry.snapshot))
+            ):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        key: RenderKey,
+        obj: Any,
+        heading: CursesLines | None,
+        lines: Sequence[CursesLine],
+    ) -> None:
+        """Cache a rendered object, removing the least recently used beyond the size.
+
+        Args:
+            key: How the object was rendered
+            obj: The object
+            heading: The heading for the object
+            lines: The lines of the object
+        """
+        self._entries[key] = RenderedContent(
+            obj=obj,
+            snapshot=snapshot(obj),
+            heading=heading,
+            lines=lines,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all rendered objects."""
+        self._entries.clear()
@@ -7,12 +7,12 @@ from __future__ import annotations
 import curses
 import logging
 import re
+import time
 
 from collections.abc import Callable
 from collections.abc import Mapping
 from collections.abc import Sequence
 from curses import ascii as curses_ascii
-from functools import cache
 from math import ceil
 from math import floor
 from re import Match
@@ -21,6 +21,7 @@ from typing import TYPE_CHECKING
 from typing import Any
 from typing import NamedTuple
 from typing import Protocol
+from typing import overload
 
 from ansible_navigator.content_defs import ContentFormat
 from ansible_navigator.content_defs import ContentType
@@ -37,11 +38,16 @@ from .curses_defs import CursesLines
 from .curses_defs import RgbTuple
 from .curses_defs import SimpleLinePart
 from .curses_window import CursesWindow
+from .curses_window import Frame
 from .curses_window import Window
 from .field_text import FieldText
+from .filter_engine import FilterEngine
 from .form_handler_text import FormHandlerText
 from .form_utils import warning_notification
 from .menu_builder import MenuBuilder
+from .menu_builder import MenuModel
+from .render_cache import RenderCache
+from .render_cache import RenderKey
 from .ui_constants import Decoration
 
 
@@ -136,6 +142,7 @@ class Ui(NamedTuple):
     show_form: Callable[[Form], Form]
     update_status: Callable[..., Any]
     content_format: ContentFormatCallable
+    wake_on: Callable[..., Any]
 
 
 class Interaction(NamedTuple):
@@ -148,6 +155,51 @@ class Interaction(NamedTuple):
     menu: Menu | None = None
 
 
+class DecoratedLines(Sequence[CursesLine]):
+    """Rendered lines, colored and decorated for curses when they are requested."""
+
+    def __init__(
+        self,
+        lines: Sequence[list[SimpleLinePart]],
+        decorate: Callable[[list[list[SimpleLinePart]]], CursesLines],
+    ) -> None:
+        """Initialize the decorated lines.
+
+        Args:
+            lines: The rendered lines
+            decorate: A callable to color and decorate rendered lines
+        """
+        self._lines = lines
+        self._decorate = decorate
+
+    def __len__(self) -> int:
+        """Get the number of lines.
+
+        Returns:
+            The number of lines
+        """
+        return len(self._lines)
+
+    @overload
+    def __getitem__(self, index: int) -> CursesLine: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> CursesLines: ...
+
+    def __getitem__(self, index: int | slice) -> CursesLine | CursesLines:
+        """Get one or more lines ready for curses.
+
+        Args:
+            index: The index or slice of the lines
+
+        Returns:
+            The line or lines ready for curses
+        """
+        if isinstance(index, slice):
+            return self._decorate(list(self._lines[index]))
+        return self._decorate([self._lines[index]])[0]
+
+
 class UserInterface(CursesWindow):
     # pylint: disable=too-many-instance-attributes
     # pylint: disable=too-many-arguments
@@ -184,22 +236,28 @@ class UserInterface(CursesWindow):
         self._default_pairs = None
         self._default_content_format = ContentFormat.YAML
         self._filter_content_keys: Callable[[Any], dict[Any, Any]]
+        self._filter_engine = FilterEngine()
         self._hide_keys = True
         self._kegexes = kegexes
+        self._last_frame = 0.0
         self._logger = logging.getLogger(__name__)
         self._menu_filter: Pattern[str] | None = None
         self._menu_indices: tuple[int, ...] = ()
+        self._menu_model = MenuModel()
 
         self._progress_bar_width = progress_bar_width
         self._status_width = status_width
         self._prefix_color = 8
         self._refresh = [refresh]
+        self._render_cache = RenderCache()
         self._rgb_to_curses_color_idx: dict[RgbTuple, int] = {}
         self._screen_min_height = screen_min_height
         self._scroll = 0
         self._content_format = self._default_content_format
         self._status = ""
         self._status_color = 0
+        self._status_detail = ""
+        self._wake: Callable[[], bool] | None = None
         self._screen: Window = curses.initscr()
         self._screen.timeout(refresh)
         self._screen.keypad(True)  # Enable keypad mode
@@ -217,6 +275,7 @@ class UserInterface(CursesWindow):
         """Clear the screen."""
         self._screen.clear()
         self._screen.refresh()
+        self._forget_frame()
 
     def disable_refresh(self) -> None:
         """Disable the screen refresh."""
@@ -229,15 +288,30 @@ class UserInterface(CursesWindow):
         self._refresh.pop()
         self._screen.timeout(self._refresh.pop())
 
-    def update_status(self, status: str = "", status_color: int = 0) -> None:
+    def wake_on(self, condition: Callable[[], bool] | None) -> None:
+        """Set when the screen is refreshed while waiting for a key.
+
+        Without a condition, the screen is refreshed each refresh interval. With one,
+        the screen is refreshed only once the condition is met, checked each refresh
+        interval and no sooner than the maximum frame rate allows.
+
+        Args:
+            condition: A callable returning True when there is new content to show,
+                None to refresh the screen each refresh interval
+        """
+        self._wake = condition
+
+    def update_status(self, status: str = "", status_color: int = 0, detail: str = "") -> None:
         """Update the status.
 
         Args:
             status: The string of status information
             status_color: The color of status
+            detail: Additional information shown to the left of the status
         """
         self._status = status
         self._status_color = status_color
+        self._status_detail = detail
 
     def menu_filter(self, value: str | None = "") -> Pattern[str] | None:
         """Set or return the menu filter.
@@ -312,6 +386,7 @@ class UserInterface(CursesWindow):
             show_form=self.show_form,
             update_status=self.update_status,
             content_format=self.content_format,
+            wake_on=self.wake_on,
         )
         return res
 
@@ -326,6 +401,9 @@ class UserInterface(CursesWindow):
         """
         column_widths = [len(f"{k!s}: {v!s}") for k, v in key_dict.items()]
         status_width = self._progress_bar_width if self._status else 0
+        if self._status and self._status_detail:
+            # the status, the detail to its left and the scroll bar, each separated by a space
+            status_width = self._status_width + len(self._status_detail) + 2
         gap = floor((self._screen_width - status_width - sum(column_widths)) / len(key_dict))
         adjusted_column_widths = [c + gap for c in column_widths]
         col_starts = [0]
@@ -368,6 +446,17 @@ class UserInterface(CursesWindow):
                     decoration=curses.A_REVERSE,
                 ),
             )
+            if self._status_detail:
+                # immediately left of the status, separated by a space
+                detail_start = self._screen_width - status_width
+                footer.append(
+                    CursesLinePart(
+                        column=detail_start,
+                        string=self._status_detail,
+                        color=self._status_color,
+                        decoration=0,
+                    ),
+                )
         return CursesLine(tuple(footer))
 
     def _scroll_bar(
@@ -377,6 +466,8 @@ class UserInterface(CursesWindow):
         menu_size: int,
         body_start: int,
         body_stop: int,
+        *,
+        frame: Frame,
     ) -> None:
         """Add a scroll bar if the length of the content is longer than the viewport height.
 
@@ -386,6 +477,7 @@ class UserInterface(CursesWindow):
             menu_size: The number of lines in the content
             body_start: Where we are in the body
             body_stop: The end of the body
+            frame: The frame to add the scroll bar to
         """
         start_scroll_bar = body_start / menu_size * viewport_height
         stop_scroll_bar = body_stop / menu_size * viewport_height
@@ -399,8 +491,7 @@ class UserInterface(CursesWindow):
                 color=color,
                 decoration=0,
             )
-            self._add_line(
-                window=self._screen,
+            frame.add(
                 lineno=min(lineno, viewport_height + len_heading),
                 line=CursesLine(
                     (line_part,),
@@ -437,8 +528,32 @@ class UserInterface(CursesWindow):
                 break
         self.restore_refresh()
         self._curs_set(0)
+        self._forget_frame()
         return user_input
 
+    def _get_key(self) -> int:
+        """Wait for a key, or until the screen should be refreshed.
+
+        Returns:
+            The key pressed, -1 if the screen should be refreshed
+        """
+        if self._wake is None or self._refresh[-1] == -1:
+            return self._screen.getch()
+
+        remaining = self._last_frame + 1 / self._ui_config.max_frame_rate - time.monotonic()
+        if remaining > 0:
+            self._screen.timeout(ceil(remaining * 1000))
+            char = self._screen.getch()
+            self._screen.timeout(self._refresh[-1])
+            if char != -1:
+                return char
+
+        while not self._wake():
+            char = self._screen.getch()
+            if char != -1:
+                return char
+        return -1
+
     def _handle_display_key(
         self,
         key: str,
@@ -541,12 +656,12 @@ class UserInterface(CursesWindow):
         ]
 
         while True:
-            self._screen.erase()
+            frame = Frame()
             prefix = " " * (index_width + len("|")) if indent_heading else None
 
             # Add the heading
             for idx, line in enumerate(heading):
-                self._add_line(window=self._screen, lineno=idx, line=line, prefix=prefix)
+                frame.add(lineno=idx, line=line, prefix=prefix)
 
             # Add the content
             for idx, line in enumerate(lines):
@@ -572,12 +687,7 @@ class UserInterface(CursesWindow):
                     line_to_draw = CursesLine(highlighted_parts)
                 else:
                     line_to_draw = line
-                self._add_line(
-                    window=self._screen,
-                    lineno=idx + len(heading),
-                    line=line_to_draw,
-                    prefix=prefix,
-                )
+                frame.add(lineno=idx + len(heading), line=line_to_draw, prefix=prefix)
 
             # Add the scroll bar
             if count > viewport_height:
@@ -587,15 +697,18 @@ class UserInterface(CursesWindow):
                     menu_size=count,
                     body_start=self._scroll - viewport_height,
                     body_stop=self._scroll,
+                    frame=frame,
                 )
 
             # Add the footer after the rest of the screen has been drawn
-            self._add_line(window=self._screen, lineno=footer_at, line=footer)
+            frame.add(lineno=footer_at, line=footer)
 
+            self._draw_frame(self._screen, frame)
             self._screen.refresh()
+            self._last_frame = time.monotonic()
 
             if await_input:
-                char = self._screen.getch()
+                char = self._get_key()
                 key = KEY_REFRESH if char == -1 else curses.keyname(char).decode()
                 if char in [10, 13]:  # Enter key codes: 10=LF, 13=CR
                     key = "CURSOR_ENTER"
@@ -663,9 +776,12 @@ class UserInterface(CursesWindow):
         self._show_form(warning_notification(msgs))
         return None, None
 
-    def _serialize_color(self, obj: Any) -> CursesLines:
+    def _serialize_color(self, obj: Any) -> Sequence[CursesLine]:
         """Serialize, if necessary and color an obj.
 
+        Only the lines requested from the result are tokenized and colored, so
+        showing the first screenful does not depend on the size of the object.
+
         Args:
             obj: the object to color
 
@@ -690,9 +806,20 @@ class UserInterface(CursesWindow):
         if self._ui_config.color:
             scope = self.content_format().value.scope
 
-        rendered = self._colorizer.render(doc=string, scope=scope)
-        self._cache_init_colors(rendered)
-        return self._color_decorate_lines(rendered)
+        rendered = self._colorizer.render_incremental(doc=string or "", scope=scope)
+        return DecoratedLines(lines=rendered, decorate=self._color_decorate_rendered)
+
+    def _color_decorate_rendered(self, lines: list[list[SimpleLinePart]]) -> CursesLines:
+        """Cache and init the colors of rendered lines, then color and decorate them.
+
+        Args:
+            lines: The rendered lines
+
+        Returns:
+            All lines colored
+        """
+        self._cache_init_colors(lines)
+        return self._color_decorate_lines(lines)
 
     def _cache_init_colors(self, lines: list[list[SimpleLinePart]]) -> None:
         """Cache and init the unique colors for future use.
@@ -779,18 +906,37 @@ class UserInterface(CursesWindow):
             decoration=decoration,
         )
 
-    def _filter_and_serialize(self, obj: Any) -> tuple[CursesLines | None, CursesLines]:
+    def _filter_and_serialize(self, obj: Any) -> tuple[CursesLines | None, Sequence[CursesLine]]:
         """Filter an obj and serialize.
 
+        The heading and lines are cached, so showing the obj again, in the same format and
+        view with the same heading and key filter, is immediate unless it has been changed.
+        ANSI content is not cached, it is typically output that grows, only the text appended
+        to it is converted.
+
         Args:
             obj: the obj to serialize
 
         Returns:
             the serialize lines ready for display
         """
+        key = RenderKey(
+            obj_id=id(obj),
+            content_format=self.content_format(),
+            content_view=ContentView.NORMAL if self._hide_keys else ContentView.FULL,
+            width=self._screen_width,
+            content_heading=self._content_heading,
+            filter_content_keys=self._filter_content_keys if self._hide_keys else None,
+        )
+        cacheable = key.content_format is not ContentFormat.ANSI
+        cached = self._render_cache.get(key, obj) if cacheable else None
+        if cached is not None:
+            return cached.heading, cached.lines
         heading = self._content_heading(obj, self._screen_width)
         filtered_obj = self._filter_content_keys(obj) if self._hide_keys else obj
         lines = self._serialize_color(filtered_obj)
+        if cacheable:
+            self._render_cache.put(key, obj, heading, lines)
         return heading, lines
 
     def _show_form(self, obj: Form) -> Form:
@@ -803,6 +949,7 @@ class UserInterface(CursesWindow):
             The form
         """
         res = obj.present(screen=self._screen, ui_config=self._ui_config)
+        self._forget_frame()
         return res
 
     def _handle_obj_navigation(
@@ -897,7 +1044,7 @@ class UserInterface(CursesWindow):
             line_numbers = tuple(range(first_line_idx, last_line_idx + 1))
 
             entry = self._display(
-                lines=CursesLines(lines[first_line_idx : last_line_idx + 1]),
+                lines=CursesLines(tuple(lines[first_line_idx : last_line_idx + 1])),
                 line_numbers=line_numbers,
                 heading=heading,
                 indent_heading=False,
@@ -911,11 +1058,12 @@ class UserInterface(CursesWindow):
                 index,
             )
             if should_continue:
-                if new_index != index:
+                # Scrolling only changes the lines requested from the rendered content
+                if new_index != index or new_entry == "_":
                     index = new_index
-                self.scroll(0)
-                if new_entry == "_":
-                    self._hide_keys = not self._hide_keys
+                    self.scroll(0)
+                    if new_entry == "_":
+                        self._hide_keys = not self._hide_keys
                     heading, lines = self._filter_and_serialize(objs[index])
                 elif new_entry == "KEY_RESIZE":
                     heading = self._content_heading(objs[index], self._screen_width)
@@ -932,32 +1080,6 @@ class UserInterface(CursesWindow):
                 content = Content(showing=filtered)
                 return Interaction(name=name, action=action, content=content, ui=self._ui)
 
-    def _obj_match_filter(self, obj: dict[Any, Any], columns: list[str]) -> bool:
-        """Check columns in a dictionary against a regex.
-
-        Args:
-            obj: The dict to check
-            columns: The dicts keys to check
-
-        Returns:
-            True if a match else False
-        """
-        return any(self._search_value(self.menu_filter(), obj.get(key)) for key in columns)
-
-    @staticmethod
-    @cache
-    def _search_value(regex: Pattern[str], value: str) -> Match[str] | None:
-        """Check a str against a regex.
-
-        Args:
-            regex: the compiled regex
-            value: the string to check
-
-        Returns:
-            the match if made
-        """
-        return regex.search(str(value))
-
     def _get_heading_menu_items(
         self,
         current: Sequence[Any],
@@ -980,6 +1102,7 @@ class UserInterface(CursesWindow):
             number_colors=curses.COLORS,
             color_menu_item=self._color_menu_item,
             ui_config=self._ui_config,
+            model=self._menu_model,
         )
         menu_heading, menu_items = menu_builder.build(current, columns, indices)
         return menu_heading, menu_items
@@ -1047,6 +1170,12 @@ class UserInterface(CursesWindow):
         if id(current) != self._menu_current_id:
             self._menu_cursor_pos = None
             self._menu_current_id = id(current)
+        # The menu and filter do not change until an interaction is returned
+        menu_filter = self.menu_filter()
+        if menu_filter:
+            self._menu_indices = self._filter_engine.indices(menu_filter, current, columns)
+        else:
+            self._menu_indices = tuple(range(len(current)))
         while True:
             if self.scroll() == 0:
                 last_line_idx = min(len(current) - 1, self._screen_height - 3)
@@ -1055,14 +1184,10 @@ class UserInterface(CursesWindow):
 
             first_line_idx = max(0, last_line_idx - (self._screen_height - 3))
 
-            if self.menu_filter():
-                self._menu_indices = tuple(
-                    idx for idx, mi in enumerate(current) if self._obj_match_filter(mi, columns)
-                )
+            if menu_filter:
                 line_numbers = tuple(range(last_line_idx - first_line_idx + 1))
                 self._scroll = min(len(self._menu_indices), self._scroll)
             else:
-                self._menu_indices = tuple(range(len(current)))
                 line_numbers = self._menu_indices[first_line_idx : last_line_idx + 1]
 
             showing_indices = self._menu_indices[first_line_idx : last_line_idx + 1]
@@ -1154,7 +1279,7 @@ class UserInterface(CursesWindow):
         columns = columns or []
         self.content_format(content_format or self._default_content_format)
 
-        if index is not None and isinstance(obj, list | tuple):
+        if index is not None and isinstance(obj, Sequence) and not isinstance(obj, str):
             result = self._show_obj_from_list(obj, index, await_input)
         elif columns and isinstance(obj, list | tuple):
             result = self._show_menu(obj, columns, await_input)
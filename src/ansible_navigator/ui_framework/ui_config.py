@@ -20,6 +20,8 @@ class UIConfig:
     colors_initialized: bool
     #: The path to the grammar directory
     grammar_dir: Traversable
+    #: The most times per second the screen is refreshed when woken by new content
+    max_frame_rate: int
     #: Indicates if terminal support for OSC4 is enabled
     osc4: bool
     #: The path to the 16 terminal color map
@@ -1,21 +1,114 @@
-"""An interface to use a sqlite database as a key-value store."""
+"""An interface to use a sqlite database as a key-value store.
+
+Values may be stored compressed, a compressed value is stored as a blob starting with
+a format marker, uncompressed values are stored as text. Both are read transparently.
+"""
 
 from __future__ import annotations
 
 import sqlite3
+import time
+import zlib
 
 from collections.abc import ItemsView
 from collections.abc import Iterator
 from collections.abc import KeysView
+from collections.abc import Mapping
 from collections.abc import MutableMapping
 from collections.abc import ValuesView
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
+    from collections.abc import Container
+    from collections.abc import Iterable
     from pathlib import Path
 
 
+PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("temp_store", "MEMORY"),
+    ("cache_size", "-8000"),
+)
+"""Connection settings, write-ahead logging lets readers and a writer work concurrently"""
+
+MAX_VARIABLES = 500
+"""The maximum number of keys in one query, below the lowest sqlite variable limit of 999"""
+
+COMPRESSED_MARKER = b"zlib:"
+"""The prefix of a compressed value, followed by the zlib compressed UTF-8 text"""
+
+COMPRESS_MIN_SIZE = 256
+"""Values shorter than this are stored uncompressed, compression would not save space"""
+
+VACUUM_FREE_RATIO = 4
+"""The database is vacuumed after eviction once more than 1 in this many pages are free"""
+
+USAGE_TRIGGERS = (
+    # A REPLACE removes the existing row without firing the delete trigger, so the
+    # replaced value is subtracted before the new one is inserted
+    """CREATE TRIGGER IF NOT EXISTS kv_usage_replace BEFORE INSERT ON kv
+    WHEN EXISTS (SELECT 1 FROM kv WHERE key = NEW.key) BEGIN
+        UPDATE kv_usage SET entries = entries - 1,
+            compressed = compressed
+                - (SELECT typeof(value) = 'blob' FROM kv WHERE key = NEW.key),
+            stored = stored
+                - (SELECT length(CAST(value AS BLOB)) FROM kv WHERE key = NEW.key);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS kv_usage_insert AFTER INSERT ON kv BEGIN
+        UPDATE kv_usage SET entries = entries + 1,
+            compressed = compressed + (typeof(NEW.value) = 'blob'),
+            stored = stored + length(CAST(NEW.value AS BLOB));
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS kv_usage_update AFTER UPDATE OF value ON kv BEGIN
+        UPDATE kv_usage SET
+            compressed = compressed - (typeof(OLD.value) = 'blob')
+                + (typeof(NEW.value) = 'blob'),
+            stored = stored - length(CAST(OLD.value AS BLOB))
+                + length(CAST(NEW.value AS BLOB));
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS kv_usage_delete AFTER DELETE ON kv BEGIN
+        UPDATE kv_usage SET entries = entries - 1,
+            compressed = compressed - (typeof(OLD.value) = 'blob'),
+            stored = stored - length(CAST(OLD.value AS BLOB));
+    END""",
+)
+"""Triggers keeping a running total of the stored values, so the size is known without a scan"""
+
+
+def _encode(value: str, compress: bool) -> str | bytes:
+    """Encode a value for storage, compressed if requested and worthwhile.
+
+    Args:
+        value: The value
+        compress: Whether to compress the value
+
+    Returns:
+        The value to store
+    """
+    if not compress or len(value) < COMPRESS_MIN_SIZE:
+        return value
+    return COMPRESSED_MARKER + zlib.compress(value.encode("utf-8"))
+
+
+def _decode(stored: str | bytes) -> str:
+    """Decode a stored value.
+
+    Args:
+        stored: The stored value
+
+    Returns:
+        The value
+    """
+    if isinstance(stored, bytes):
+        if stored.startswith(COMPRESSED_MARKER):
+            stored = zlib.decompress(stored[len(COMPRESSED_MARKER) :])
+        return stored.decode("utf-8")
+    return stored
+
+
 class KVSKeysView(KeysView[str]):
     """A glorified KeysView specific to, and returned by, methods in KeyValueStore."""
 
@@ -31,16 +124,64 @@ class KVSValuesView(ValuesView[str]):
 class KeyValueStore(MutableMapping[str, str]):
     """An interface to use a sqlite database as a key-value store."""
 
-    def __init__(self, filename: str | Path) -> None:
+    def __init__(
+        self,
+        filename: str | Path,
+        compress: bool = False,
+        track_access: bool = False,
+    ) -> None:
         """Initialize the key-value store.
 
         Args:
             filename: The full path to the sqlite database file
+            compress: Whether to compress values when they are set
+            track_access: Whether reading a value records the time it was read, for
+                least recently used eviction
         """
         self._path = str(filename)
-        self.conn = sqlite3.connect(self._path)
+        self.compress = compress
+        self.track_access = track_access
+        self.conn = self._connect()
         cursor = self.conn.cursor()
-        cursor.execute("CREATE TABLE IF NOT EXISTS kv (key text unique, value text)")
+        cursor.execute(
+            "CREATE TABLE IF NOT EXISTS kv (key text unique, value text, accessed integer)",
+        )
+        columns = [row[1] for row in cursor.execute("PRAGMA table_info(kv)")]
+        if "accessed" not in columns:
+            cursor.execute("ALTER TABLE kv ADD COLUMN accessed integer")
+            cursor.execute("UPDATE kv SET accessed = ?", (int(time.time()),))
+            self.conn.commit()
+        cursor.execute("CREATE INDEX IF NOT EXISTS kv_accessed ON kv (accessed)")
+        cursor.execute(
+            "CREATE TABLE IF NOT EXISTS kv_usage (entries integer, compressed integer,"
+            " stored integer)",
+        )
+        if cursor.execute("SELECT COUNT(*) FROM kv_usage").fetchone()[0] == 0:
+            # A store created before the running total was kept is measured once
+            cursor.execute(
+                "INSERT INTO kv_usage SELECT COUNT(*), COUNT(CASE WHEN typeof(value) = 'blob'"
+                " THEN 1 END), COALESCE(SUM(length(CAST(value AS BLOB))), 0) FROM kv",
+            )
+        for trigger in USAGE_TRIGGERS:
+            cursor.execute(trigger)
+        self.conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connect to the database and apply the connection settings.
+
+        A setting the database does not support, for example write-ahead logging on
+        a read-only file system, is skipped.
+
+        Returns:
+            A connection to the database
+        """
+        conn = sqlite3.connect(self._path)
+        for pragma, value in PRAGMAS:
+            try:
+                conn.execute(f"PRAGMA {pragma}={value}")
+            except sqlite3.DatabaseError:
+                continue
+        return conn
 
     @property
     def path(self) -> str:
@@ -62,9 +203,141 @@ class KeyValueStore(MutableMapping[str, str]):
         Returns:
             A connection to the database
         """
-        self.conn = sqlite3.connect(self.path)
+        self.conn = self._connect()
         return self.conn
 
+    @contextmanager
+    def transaction(self) -> Iterator[KeyValueStore]:
+        """Group changes to the key-value store in a single transaction.
+
+        The changes are committed when the block completes, or rolled back if it raises.
+
+        Yields:
+            The key-value store
+        """
+        with self.conn:
+            yield self
+
+    def update_many(self, items: Mapping[str, str] | Iterable[tuple[str, str]]) -> None:
+        """Place many key-value combinations in the key-value store in one transaction.
+
+        Args:
+            items: The key-value combinations to set
+        """
+        if isinstance(items, Mapping):
+            items = items.items()
+        now = int(time.time())
+        rows = ((key, _encode(value, self.compress), now) for key, value in items)
+        with self.conn:
+            self.conn.executemany("REPLACE INTO kv (key, value, accessed) VALUES (?,?,?)", rows)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """Return the values for many keys, using the index on the key column.
+
+        Args:
+            keys: The keys to find
+
+        Returns:
+            The values found, keys missing from the key-value store are left out
+        """
+        keys = list(keys)
+        found: dict[str, str] = {}
+        cursor = self.conn.cursor()
+        for start in range(0, len(keys), MAX_VARIABLES):
+            chunk = keys[start : start + MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            query = f"SELECT key, value FROM kv WHERE key IN ({placeholders})"  # noqa: S608
+            found.update((key, _decode(value)) for key, value in cursor.execute(query, chunk))
+            if self.track_access:
+                query = f"UPDATE kv SET accessed = ? WHERE key IN ({placeholders})"  # noqa: S608
+                cursor.execute(query, [int(time.time()), *chunk])
+        return found
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Delete many keys from the key-value store in one transaction.
+
+        Keys missing from the key-value store are ignored.
+
+        Args:
+            keys: The keys to delete
+        """
+        with self.conn:
+            self.conn.executemany("DELETE FROM kv WHERE key = ?", ((key,) for key in keys))
+
+    def usage(self) -> dict[str, int]:
+        """Report the size of the key-value store.
+
+        The entry counts and stored size are running totals, reading them does not scan
+        the values.
+
+        Returns:
+            The number of entries, how many are compressed, the size of the stored
+            values and the size of the database files on disk, in bytes
+        """
+        cursor = self.conn.cursor()
+        entries, compressed, stored = cursor.execute(
+            "SELECT entries, compressed, stored FROM kv_usage",
+        ).fetchone()
+        page_count = cursor.execute("PRAGMA page_count").fetchone()[0]
+        page_size = cursor.execute("PRAGMA page_size").fetchone()[0]
+        return {
+            "entries": entries,
+            "compressed_entries": compressed,
+            "stored_bytes": stored,
+            "file_bytes": page_count * page_size,
+        }
+
+    def evict(
+        self,
+        max_bytes: int | None = None,
+        max_age: float | None = None,
+        keep: Container[str] = (),
+    ) -> int:
+        """Remove entries not accessed recently, to keep the key-value store bounded.
+
+        Entries not accessed within the maximum age are removed first, then the least
+        recently accessed entries until the stored values fit within the maximum size.
+        The entries are only scanned when the running size or the oldest access time
+        shows there is something to remove, and the database is only vacuumed once a
+        large part of it is free.
+
+        Args:
+            max_bytes: The maximum size of the stored values in bytes
+            max_age: The maximum time in seconds since an entry was last accessed
+            keep: Keys never removed
+
+        Returns:
+            The number of entries removed
+        """
+        cursor = self.conn.cursor()
+        oldest = 0 if max_age is None else time.time() - max_age
+        stored = cursor.execute("SELECT stored FROM kv_usage").fetchone()[0]
+        expired = cursor.execute(
+            "SELECT 1 FROM kv WHERE accessed < ? OR accessed IS NULL LIMIT 1",
+            (oldest,),
+        ).fetchone()
+        if (max_bytes is None or stored <= max_bytes) and (max_age is None or not expired):
+            return 0
+        budget = max_bytes
+        remove = []
+        rows = cursor.execute(
+            "SELECT key, length(CAST(value AS BLOB)), accessed FROM kv ORDER BY accessed DESC",
+        )
+        for key, size, accessed in rows:
+            if key in keep:
+                continue
+            if budget is not None:
+                budget -= size
+            if (accessed or 0) < oldest or (budget is not None and budget < 0):
+                remove.append(key)
+        if remove:
+            self.delete_many(remove)
+            free = cursor.execute("PRAGMA freelist_count").fetchone()[0]
+            pages = cursor.execute("PRAGMA page_count").fetchone()[0]
+            if free * VACUUM_FREE_RATIO > pages:
+                self.conn.execute("VACUUM")
+        return len(remove)
+
     def __len__(self) -> int:
         """Count the number of keys in the key-value store.
 
@@ -98,7 +371,7 @@ class KeyValueStore(MutableMapping[str, str]):
         """
         cursor = self.conn.cursor()
         for row in cursor.execute("SELECT value FROM kv"):
-            yield row[0]
+            yield _decode(row[0])
 
     def iteritems(self) -> Iterator[tuple[str, str]]:
         """Yield items from the key-value store one by one.
@@ -108,7 +381,7 @@ class KeyValueStore(MutableMapping[str, str]):
         """
         cursor = self.conn.cursor()
         for row in cursor.execute("SELECT key, value FROM kv"):
-            yield row[0], row[1]
+            yield row[0], _decode(row[1])
 
     def keys(self) -> KVSKeysView:
         """Return all keys in the key-value store.
@@ -170,7 +443,9 @@ class KeyValueStore(MutableMapping[str, str]):
         item = cursor.execute("SELECT value FROM kv WHERE key = ?", (key,)).fetchone()
         if item is None:
             raise KeyError(key)
-        return item[0]
+        if self.track_access:
+            cursor.execute("UPDATE kv SET accessed = ? WHERE key = ?", (int(time.time()), key))
+        return _decode(item[0])
 
     def __setitem__(self, key: str, value: str) -> None:
         """Place a key-value combination in the key-value store.
@@ -180,7 +455,10 @@ class KeyValueStore(MutableMapping[str, str]):
             value: The value of the combination to set
         """
         cursor = self.conn.cursor()
-        cursor.execute("REPLACE INTO kv (key, value) VALUES (?,?)", (key, value))
+        cursor.execute(
+            "REPLACE INTO kv (key, value, accessed) VALUES (?,?,?)",
+            (key, _encode(value, self.compress), int(time.time())),
+        )
 
     def __delitem__(self, key: str) -> None:
         """Delete a key-value combination in the key-value store.
@@ -0,0 +1,939 @@
+"""Streaming playbook artifacts.
+
+A streaming playbook artifact is a JSON Lines file written while the playbook runs.
+Each line is a record, ``{"type": <type>, "data": <data>}``, appended as soon as the
+content it holds is complete:
+
+- ``header``: The artifact version, always the first record
+- ``play``: A play, without its tasks, written when the play starts
+- ``task``: A task result for one host, written when the task finishes
+- ``stdout``: Lines of playbook standard output
+- ``trailer``: The playbook status and settings, written when the playbook completes
+
+An artifact without a trailer is the result of an interrupted run, everything
+recorded up to that point can still be replayed.
+
+Either kind of artifact is gzip compressed when its file name ends with ``.gz``,
+for example ``.json.gz`` or ``.jsonl.gz``. Compressed artifacts are detected from
+their content when read.
+
+Large artifacts, streaming or JSON, are replayed using an :class:`IndexedArtifact`.
+The byte offsets of each play, task and standard output record are stored in a sidecar
+index file on first open, records are then read from the memory-mapped artifact when
+they are shown.
+
+While a playbook runs, task results are kept in a :class:`TaskStore`, a temporary file,
+with only a :class:`TaskRow` of the task menu columns kept in memory for each.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import mmap
+import re
+import tempfile
+
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import SupportsIndex
+from typing import overload
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+    from typing import IO
+
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_VERSION = "2.0.0"
+STREAMING_SUFFIX = ".jsonl"
+COMPRESSED_SUFFIX = ".gz"
+COMPRESS_LEVEL = 6
+"""The gzip compression level, higher levels are much slower for little gain on JSON"""
+GZIP_MAGIC = b"\x1f\x8b"
+INCOMPLETE_STATUS = ("incomplete", 13)
+
+INDEX_SUFFIX = ".index"
+INDEX_VERSION = 1
+"""The version of the sidecar index, an index with a different version is rebuilt"""
+
+TASK_CACHE_SIZE = 64
+"""The number of full task results kept in memory by an indexed artifact"""
+
+SUMMARY_KEYS = ("host", "play", "play_uuid", "task", "task_uuid")
+"""Task keys kept in the index for task menus, in addition to the ``__`` prefixed keys"""
+
+TASK_ROW_KEYS = (
+    "__changed",
+    "__duration",
+    "__host",
+    "__number",
+    "__result",
+    "__task",
+    "__task_action",
+    *SUMMARY_KEYS,
+)
+"""Task keys kept in memory for the task menus while a playbook runs"""
+
+_JSON_LAYOUT = re.compile(
+    rb"""
+    \n\ {4}(?:
+        "(?P<section>plays|stdout)":\ (?P<section_start>\[)(?P<section_empty>\])?,?
+        |(?P<section_end>\]),?
+        |"(?P<meta>status|status_color|version)":\ (?P<meta_value>[^\r\n]*?),?
+        |\ {4}(?:
+            (?P<play>\{)
+            |(?P<play_end>\}),?
+            |\ {4}(?:
+                "tasks":\ (?P<tasks>\[)(?P<tasks_empty>\])?,?
+                |(?P<tasks_end>\]),?
+                |\ {4}(?:
+                    (?P<task>\{)
+                    |(?P<task_end>\}),?
+                    |\ {4}"(?P<key>__[^"]*|host|play|play_uuid|task|task_uuid)":
+                    \ (?P<value>[^\r\n]*?),?
+                )
+            )
+        )
+    )(?=\r?\n)
+    """,
+    re.VERBOSE,
+)
+"""The lines of interest in a JSON artifact written with an indent of 4.
+
+Only the layout navigator writes, ``json.dump`` with ``indent=4`` and one key per
+line, is matched. A JSON artifact written any other way, for example compacted or
+re-indented by another tool, cannot be indexed and is loaded in full with ``json.load``.
+"""
+
+
+def is_streaming_artifact(filename: str | Path) -> bool:
+    """Determine if a playbook artifact file name refers to a streaming artifact.
+
+    Args:
+        filename: The artifact file name
+
+    Returns:
+        True if the artifact is a streaming artifact
+    """
+    return str(filename).removesuffix(COMPRESSED_SUFFIX).endswith(STREAMING_SUFFIX)
+
+
+def is_compressed_artifact(filename: str | Path) -> bool:
+    """Determine if a playbook artifact file name refers to a compressed artifact.
+
+    Args:
+        filename: The artifact file name
+
+    Returns:
+        True if the artifact is compressed
+    """
+    return str(filename).endswith(COMPRESSED_SUFFIX)
+
+
+def open_artifact(path: Path, mode: str = "r") -> IO[str]:
+    """Open a playbook artifact as text, compressed or not.
+
+    When writing, the artifact is compressed if the file name ends with ``.gz``. When
+    reading, a compressed artifact is detected from its content, regardless of its name.
+
+    Args:
+        path: The path to the artifact file
+        mode: Either "r" or "w"
+
+    Returns:
+        The open artifact file
+    """
+    if mode == "w":
+        compressed = is_compressed_artifact(path)
+    else:
+        with path.open(mode="rb") as fh:
+            compressed = fh.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+    if not compressed:
+        return path.open(mode=mode, encoding="utf-8")
+    if mode == "w":
+        return gzip.open(path, mode="wt", encoding="utf-8", compresslevel=COMPRESS_LEVEL)
+    return gzip.open(path, mode="rt", encoding="utf-8")
+
+
+class ArtifactWriter:
+    """Append records to a streaming playbook artifact."""
+
+    def __init__(self, path: Path) -> None:
+        """Open the artifact and write the header.
+
+        Args:
+            path: The path to the artifact file
+        """
+        self.path = path
+        self._file = open_artifact(path, mode="w")
+        self._write("header", {"version": ARTIFACT_VERSION})
+
+    def _write(self, record_type: str, data: Any) -> None:
+        """Write one record.
+
+        Args:
+            record_type: The type of record
+            data: The record data
+        """
+        self._file.write(json.dumps({"type": record_type, "data": data}, ensure_ascii=False))
+        self._file.write("\n")
+
+    def play(self, play: dict[str, Any]) -> None:
+        """Write a play, without its tasks.
+
+        Args:
+            play: The play
+        """
+        self._write("play", {k: v for k, v in play.items() if k != "tasks"})
+
+    def task(self, task: dict[str, Any]) -> None:
+        """Write a task result, the play is identified by the task's ``play_uuid``.
+
+        Args:
+            task: The task result
+        """
+        self._write("task", task)
+
+    def stdout(self, lines: list[str]) -> None:
+        """Write lines of standard output.
+
+        Args:
+            lines: The lines of standard output
+        """
+        if lines:
+            self._write("stdout", lines)
+
+    def write_all(self, plays: list[dict[str, Any]], stdout: list[str]) -> None:
+        """Write all plays, their tasks and the standard output at once.
+
+        Args:
+            plays: The plays, including their tasks
+            stdout: The standard output
+        """
+        for play in plays:
+            self.play(play)
+            for task in play["tasks"]:
+                self.task(task)
+        self.stdout(stdout)
+
+    def flush(self) -> None:
+        """Flush the records written so far to disk."""
+        self._file.flush()
+
+    def close(self, trailer: dict[str, Any]) -> None:
+        """Write the trailer and close the artifact file.
+
+        Args:
+            trailer: The playbook status and settings
+        """
+        self._write("trailer", trailer)
+        self._file.close()
+
+
+def iter_records(path: Path) -> Iterator[tuple[str, Any]]:
+    """Read the records of a streaming playbook artifact one at a time.
+
+    A partially written last line, left by an interrupted run, is skipped.
+
+    Args:
+        path: The path to the artifact file
+
+    Yields:
+        The record type and data
+    """
+    with open_artifact(path) as fh:
+        lines = iter(fh)
+        while True:
+            try:
+                line = next(lines)
+            except StopIteration:
+                return
+            except EOFError:
+                logger.warning("Artifact '%s' is truncated", path)
+                return
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("Skipping a truncated record in artifact '%s'", path)
+                continue
+            yield record["type"], record["data"]
+
+
+def load_streaming_artifact(path: Path, include_plays: bool = True) -> dict[str, Any]:
+    """Load a streaming playbook artifact into the structure of a JSON playbook artifact.
+
+    Args:
+        path: The path to the artifact file
+        include_plays: Whether to load the plays and tasks, or only the standard output
+
+    Returns:
+        The artifact content
+    """
+    artifact: dict[str, Any] = {"plays": [], "stdout": []}
+    plays: dict[str, dict[str, Any]] = {}
+    trailer = None
+    for record_type, data in iter_records(path):
+        if record_type == "header":
+            artifact.update(data)
+        elif record_type == "stdout":
+            artifact["stdout"].extend(data)
+        elif record_type == "trailer":
+            trailer = data
+        elif not include_plays:
+            continue
+        elif record_type == "play":
+            data["tasks"] = []
+            plays[data["uuid"]] = data
+            artifact["plays"].append(data)
+        elif record_type == "task":
+            try:
+                plays[data["play_uuid"]]["tasks"].append(data)
+            except KeyError:
+                logger.warning("Task record without parent play in artifact '%s'", path)
+
+    for play in artifact["plays"]:
+        play["tasks"].sort(key=lambda task: task["__number"])
+
+    if trailer is None:
+        logger.warning("Artifact '%s' has no trailer, the playbook did not complete", path)
+        artifact["status"], artifact["status_color"] = INCOMPLETE_STATUS
+    else:
+        artifact.update(trailer)
+    return artifact
+
+
+def _summarize(task: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a task result to the keys used by the task menus.
+
+    Args:
+        task: The task result
+
+    Returns:
+        The task summary
+    """
+    return {k: v for k, v in task.items() if k.startswith("__") or k in SUMMARY_KEYS}
+
+
+class IndexedArtifact:
+    """A playbook artifact, read on demand using an index of record offsets.
+
+    The index is stored next to the artifact, ``<artifact>.index``, and rebuilt when
+    the artifact changes. If the index cannot be written, it is only kept in memory.
+    Compressed artifacts cannot be memory-mapped and are not indexed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Map the artifact into memory and load or build the index.
+
+        Args:
+            path: The path to the artifact file
+
+        Raises:
+            ValueError: If the artifact is empty, compressed or cannot be indexed
+        """
+        self.path = path
+        self.index_path = path.with_name(path.name + INDEX_SUFFIX)
+        self._streaming = is_streaming_artifact(path)
+        self._file = path.open(mode="rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise
+        if self._map[: len(GZIP_MAGIC)] == GZIP_MAGIC:
+            self.close()
+            msg = f"Artifact '{path}' is compressed"
+            raise ValueError(msg)
+        self._tasks: OrderedDict[tuple[int, int], dict[str, Any]] = OrderedDict()
+        try:
+            self.index = self._load_index() or self._build_index()
+        except ValueError:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Unmap and close the artifact file."""
+        self._map.close()
+        self._file.close()
+
+    def _fingerprint(self) -> dict[str, Any]:
+        """Identify the artifact content the index was built for.
+
+        Returns:
+            The index version, artifact size and modification time
+        """
+        stat = self.path.stat()
+        return {"index_version": INDEX_VERSION, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _load_index(self) -> dict[str, Any] | None:
+        """Load the sidecar index if it was built for the current artifact.
+
+        Returns:
+            The index, or None if missing or stale
+        """
+        try:
+            with self.index_path.open(encoding="utf-8") as fh:
+                index = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(index, dict) or index.get("fingerprint") != self._fingerprint():
+            logger.debug("Index '%s' is stale, rebuilding", self.index_path)
+            return None
+        return index
+
+    def _build_index(self) -> dict[str, Any]:
+        """Index the artifact and store the index next to it.
+
+        Returns:
+            The index
+        """
+        index = self._index_streaming() if self._streaming else self._index_json()
+        index["fingerprint"] = self._fingerprint()
+        try:
+            with self.index_path.open(mode="w", encoding="utf-8") as fh:
+                json.dump(index, fh)
+        except OSError as exc:
+            logger.debug("Index '%s' not written: %s", self.index_path, str(exc))
+        return index
+
+    def _index_streaming(self) -> dict[str, Any]:
+        """Index a streaming artifact, one record per line.
+
+        Returns:
+            The index
+        """
+        index: dict[str, Any] = {"plays": [], "stdout": []}
+        plays: dict[str, dict[str, Any]] = {}
+        trailer = None
+        offset = 0
+        self._file.seek(0)
+        for line in self._file:
+            span = (offset, offset + len(line))
+            offset = span[1]
+            if line.startswith(b'{"type": "stdout"'):
+                index["stdout"].append(span)
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("Skipping a truncated record in artifact '%s'", self.path)
+                continue
+            record_type, data = record["type"], record["data"]
+            if record_type == "header":
+                index.update(data)
+            elif record_type == "trailer":
+                trailer = data
+            elif record_type == "play":
+                play = {"play": data, "tasks": []}
+                plays[data["uuid"]] = play
+                index["plays"].append(play)
+            elif record_type == "task":
+                try:
+                    plays[data["play_uuid"]]["tasks"].append((*span, _summarize(data)))
+                except KeyError:
+                    logger.warning("Task record without parent play in artifact '%s'", self.path)
+
+        for play in index["plays"]:
+            play["tasks"].sort(key=lambda task: task[2]["__number"])
+
+        if trailer is None:
+            logger.warning("Artifact '%s' has no trailer, the playbook did not complete", self.path)
+            index["status"], index["status_color"] = INCOMPLETE_STATUS
+        else:
+            index["status"] = trailer.get("status")
+            index["status_color"] = trailer.get("status_color")
+        return index
+
+    def _index_json(self) -> dict[str, Any]:
+        """Index a JSON artifact by matching the lines of its indented layout.
+
+        Returns:
+            The index
+
+        Raises:
+            ValueError: If the artifact does not have the expected layout
+        """
+        index: dict[str, Any] = {"plays": [], "stdout": []}
+        section = ""
+        play_start = tasks_start = tasks_end = task_start = -1
+        summary: dict[str, Any] = {}
+        play: dict[str, Any] = {}
+        for match in _JSON_LAYOUT.finditer(self._map):
+            if match["section"]:
+                section = match["section"].decode()
+                if match["section_empty"]:
+                    section = ""
+                elif section == "stdout":
+                    index["stdout"] = [(match.start("section_start"), -1)]
+            elif match["section_end"]:
+                if section == "stdout":
+                    index["stdout"] = [(index["stdout"][0][0], match.end("section_end"))]
+                section = ""
+            elif match["meta"]:
+                index[match["meta"].decode()] = json.loads(match["meta_value"])
+            elif section != "plays":
+                continue
+            elif match["play"]:
+                play_start, tasks_start, tasks_end = match.start("play"), -1, -1
+                play = {"tasks": []}
+            elif match["play_end"]:
+                header = self._map[play_start : match.end("play_end")]
+                if tasks_start >= 0:
+                    header = (
+                        self._map[play_start:tasks_start]
+                        + b"[]"
+                        + self._map[tasks_end : match.end("play_end")]
+                    )
+                play["play"] = json.loads(header)
+                index["plays"].append(play)
+                play_start = -1
+            elif play_start < 0:
+                continue
+            elif match["tasks"]:
+                tasks_start = match.start("tasks")
+                tasks_end = match.end("tasks_empty") if match["tasks_empty"] else -1
+            elif tasks_start < 0 or tasks_end >= 0:
+                continue
+            elif match["tasks_end"]:
+                tasks_end = match.end("tasks_end")
+            elif match["task"]:
+                task_start, summary = match.start("task"), {}
+            elif match["task_end"]:
+                play["tasks"].append((task_start, match.end("task_end"), summary))
+                task_start = -1
+            elif match["key"] and task_start >= 0:
+                try:
+                    summary[match["key"].decode()] = json.loads(match["value"])
+                except json.JSONDecodeError:
+                    continue
+
+        if section or play_start >= 0 or "version" not in index:
+            msg = f"Artifact '{self.path}' does not have the expected layout"
+            raise ValueError(msg)
+        return index
+
+    @property
+    def version(self) -> str:
+        """Return the artifact version.
+
+        Returns:
+            The artifact version
+        """
+        return str(self.index.get("version", ""))
+
+    @property
+    def status(self) -> tuple[str, int]:
+        """Return the playbook status and its color.
+
+        Returns:
+            The playbook status and its color
+        """
+        return self.index["status"], self.index["status_color"]
+
+    def plays(self) -> list[dict[str, Any]]:
+        """Build the plays, each with the summaries of its tasks.
+
+        Returns:
+            The plays
+        """
+        plays = []
+        for play_index, play in enumerate(self.index["plays"]):
+            tasks = TaskSummaries(
+                (summary for _start, _end, summary in play["tasks"]),
+                artifact=self,
+                play_index=play_index,
+            )
+            plays.append({**play["play"], "tasks": tasks})
+        return plays
+
+    def task(self, play_index: int, task_index: int) -> dict[str, Any]:
+        """Read a full task result from the artifact.
+
+        Args:
+            play_index: The index of the play
+            task_index: The index of the task within the play
+
+        Returns:
+            The task result
+        """
+        key = (play_index, task_index)
+        if key in self._tasks:
+            self._tasks.move_to_end(key)
+            return self._tasks[key]
+        start, end, _summary = self.index["plays"][play_index]["tasks"][task_index]
+        task = json.loads(self._map[start:end])
+        if self._streaming:
+            task = task["data"]
+        self._tasks[key] = task
+        if len(self._tasks) > TASK_CACHE_SIZE:
+            self._tasks.popitem(last=False)
+        return task
+
+    def stdout(self) -> list[str]:
+        """Read the standard output from the artifact.
+
+        Returns:
+            The lines of standard output
+        """
+        stdout: list[str] = []
+        for start, end in self.index["stdout"]:
+            lines = json.loads(self._map[start:end])
+            stdout.extend(lines["data"] if self._streaming else lines)
+        return stdout
+
+
+class TaskSummaries(list[dict[str, Any]]):
+    """The task summaries of a play, used for the task menu.
+
+    The full task results are read from an indexed artifact, or from the task store
+    while the playbook runs.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        artifact: IndexedArtifact | TaskStore,
+        play_index: int,
+    ) -> None:
+        """Initialize the task summaries.
+
+        Args:
+            *args: The task summaries
+            artifact: The artifact or task store the tasks are read from
+            play_index: The index of the play in the artifact
+        """
+        super().__init__(*args)
+        self.artifact = artifact
+        self.play_index = play_index
+
+    def results(self) -> TaskResults:
+        """Provide the tasks, read in full from the artifact when accessed by index.
+
+        Returns:
+            The task results
+        """
+        return TaskResults(self)
+
+
+class TaskResults(Sequence[dict[str, Any]]):
+    """The tasks of a play, read in full from the artifact or task store when accessed.
+
+    Indexing, slicing and iteration all provide full task results, only the tasks
+    accessed are read.
+    """
+
+    def __init__(self, summaries: TaskSummaries) -> None:
+        """Initialize the task results.
+
+        Args:
+            summaries: The task summaries of the play
+        """
+        self._summaries = summaries
+
+    def __len__(self) -> int:
+        """Get the number of tasks.
+
+        Returns:
+            The number of tasks
+        """
+        return len(self._summaries)
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: SupportsIndex | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        """Read a task result, or the task results of a slice.
+
+        Args:
+            index: The index of the task, or a slice of tasks
+
+        Returns:
+            The task result, or task results for a slice
+        """
+        if isinstance(index, slice):
+            return [self[task_index] for task_index in range(len(self))[index]]
+        task_index = range(len(self))[index]
+        return self._summaries.artifact.task(self._summaries.play_index, task_index)
+
+
+def full_tasks(tasks: list[Any]) -> Sequence[dict[str, Any]]:
+    """Provide the full task results of a play, read as used if its tasks are summaries.
+
+    Args:
+        tasks: The tasks of a play
+
+    Returns:
+        The task results
+    """
+    if not isinstance(tasks, TaskSummaries):
+        return tasks
+    return tasks.results()
+
+
+def _json_key(key: Any) -> str:
+    """Convert a dictionary key to a string, as ``json.dumps`` does.
+
+    Args:
+        key: The dictionary key
+
+    Raises:
+        TypeError: If the key cannot be used as a JSON object key
+
+    Returns:
+        The key as a string
+    """
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, int | float):
+        return json.dumps(key)
+    msg = f"keys must be str, int, float, bool or None, not {key.__class__.__name__}"
+    raise TypeError(msg)
+
+
+def _iterencode(value: Any, level: int, expand: int) -> Iterator[str]:
+    """Encode a value as ``json.dump`` does with an indent of 4 and sorted keys.
+
+    Dictionaries and sequences are encoded an item at a time for ``expand`` levels,
+    so the items of a lazy sequence are read one by one, deeper values are encoded
+    whole.
+
+    Args:
+        value: The value to encode
+        level: The indentation of the value
+        expand: The number of levels to encode an item at a time
+
+    Yields:
+        The encoded value, in parts
+    """
+    indent = "\n" + " " * (level + 4)
+    if expand and isinstance(value, dict) and value:
+        yield "{"
+        for number, key in enumerate(sorted(value)):
+            encoded_key = json.dumps(_json_key(key), ensure_ascii=False)
+            yield f"{',' if number else ''}{indent}{encoded_key}: "
+            yield from _iterencode(value[key], level + 4, expand - 1)
+        yield "\n" + " " * level + "}"
+    elif expand and isinstance(value, list | tuple | TaskResults) and len(value):
+        yield "["
+        for number, item in enumerate(value):
+            yield f"{',' if number else ''}{indent}"
+            yield from _iterencode(item, level + 4, expand - 1)
+        yield "\n" + " " * level + "]"
+    else:
+        encoded = json.dumps(value, indent=4, sort_keys=True, ensure_ascii=False)
+        yield encoded.replace("\n", "\n" + " " * level)
+
+
+def write_json_artifact(file_handle: IO[str], artifact: dict[str, Any]) -> None:
+    """Write a JSON artifact, one task result at a time.
+
+    The layout is that of ``json.dump`` with an indent of 4 and sorted keys, as matched
+    by ``_JSON_LAYOUT``, the tasks of each play may be a :class:`TaskResults` read from
+    the task store as they are written.
+
+    Args:
+        file_handle: The file to write to
+        artifact: The artifact, its plays including their tasks
+    """
+    # the artifact, its plays, each play, its tasks
+    for part in _iterencode(artifact, level=0, expand=4):
+        file_handle.write(part)
+    file_handle.write("\n")
+
+
+class TaskRow(Mapping[str, Any]):
+    """The columns of a task used by the task menus, kept in memory while a playbook runs.
+
+    Only the keys in ``TASK_ROW_KEYS`` are kept, in a list rather than a dictionary,
+    the full task result is read from the :class:`TaskStore`.
+    """
+
+    __slots__ = ("_values",)
+
+    _INDEX = {key: index for index, key in enumerate(TASK_ROW_KEYS)}
+
+    def __init__(self, task: Mapping[str, Any]) -> None:
+        """Initialize the task row.
+
+        Args:
+            task: The task result
+        """
+        self._values = [task.get(key) for key in TASK_ROW_KEYS]
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the value of a column.
+
+        Args:
+            key: The column
+
+        Returns:
+            The value of the column
+
+        Raises:
+            KeyError: If the column is not kept
+        """
+        try:
+            return self._values[self._INDEX[key]]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the columns.
+
+        Returns:
+            An iterator over the columns
+        """
+        return iter(TASK_ROW_KEYS)
+
+    def __len__(self) -> int:
+        """Get the number of columns.
+
+        Returns:
+            The number of columns
+        """
+        return len(TASK_ROW_KEYS)
+
+    def update(self, task: Mapping[str, Any]) -> None:
+        """Update the columns from a task result.
+
+        Args:
+            task: The task result
+        """
+        for key, index in self._INDEX.items():
+            if key in task:
+                self._values[index] = task[key]
+
+
+class TaskStore:
+    """Task results kept in a temporary file while a playbook runs.
+
+    A task in progress is kept in memory, its result is written to the file once, when
+    the task finishes. A replaced result is written over the previous copy if it fits,
+    otherwise appended. The offset and size of the latest copy of each result are kept
+    in arrays per play. The file is created when the first result is written and
+    removed when the store is closed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the task store, the temporary file is created when first needed."""
+        self._file: IO[bytes] | None = None
+        self._offsets: list[array[int]] = []
+        self._sizes: list[array[int]] = []
+        self._pending: dict[tuple[int, int], dict[str, Any]] = {}
+        self._tasks: OrderedDict[tuple[int, int], dict[str, Any]] = OrderedDict()
+
+    def close(self) -> None:
+        """Close and remove the temporary file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._pending.clear()
+        self._tasks.clear()
+
+    def _write(self, task: dict[str, Any], offset: int, size: int) -> tuple[int, int]:
+        """Write a task result to the file, over its previous copy if it fits.
+
+        Args:
+            task: The task result
+            offset: The offset of the previous copy, -1 if not written yet
+            size: The size of the previous copy
+
+        Returns:
+            The offset and size of the task result in the file
+        """
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix="ansible-navigator-tasks-")  # noqa: SIM115
+        data = json.dumps(task, ensure_ascii=False).encode("utf-8")
+        if offset < 0 or len(data) > size:
+            offset = self._file.seek(0, 2)
+        else:
+            self._file.seek(offset)
+        self._file.write(data)
+        return offset, len(data)
+
+    def _cache(self, key: tuple[int, int], task: dict[str, Any]) -> None:
+        """Keep a task result in memory, removing the least recently used.
+
+        Args:
+            key: The index of the play and the task
+            task: The task result
+        """
+        self._tasks[key] = task
+        self._tasks.move_to_end(key)
+        if len(self._tasks) > TASK_CACHE_SIZE:
+            self._tasks.popitem(last=False)
+
+    def add(self, play_index: int, task: dict[str, Any]) -> int:
+        """Add a task in progress to a play, it is kept in memory until replaced.
+
+        Args:
+            play_index: The index of the play
+            task: The task result
+
+        Returns:
+            The index of the task within the play
+        """
+        while len(self._offsets) <= play_index:
+            self._offsets.append(array("q"))
+            self._sizes.append(array("q"))
+        self._offsets[play_index].append(-1)
+        self._sizes[play_index].append(0)
+        task_index = len(self._offsets[play_index]) - 1
+        self._pending[play_index, task_index] = task
+        return task_index
+
+    def replace(self, play_index: int, task_index: int, task: dict[str, Any]) -> None:
+        """Replace a task result, writing it to the file.
+
+        Args:
+            play_index: The index of the play
+            task_index: The index of the task within the play
+            task: The task result
+        """
+        self._pending.pop((play_index, task_index), None)
+        offset, size = self._write(
+            task,
+            self._offsets[play_index][task_index],
+            self._sizes[play_index][task_index],
+        )
+        self._offsets[play_index][task_index] = offset
+        self._sizes[play_index][task_index] = size
+        self._cache((play_index, task_index), task)
+
+    def task(self, play_index: int, task_index: int) -> dict[str, Any]:
+        """Read a task result.
+
+        Args:
+            play_index: The index of the play
+            task_index: The index of the task within the play
+
+        Raises:
+            KeyError: If no task result was added for the play and task
+
+        Returns:
+            The task result
+        """
+        key = (play_index, task_index)
+        if key in self._pending:
+            return self._pending[key]
+        if key in self._tasks:
+            self._tasks.move_to_end(key)
+            return self._tasks[key]
+        if self._file is None:
+            raise KeyError(key)
+        self._file.seek(self._offsets[play_index][task_index])
+        task: dict[str, Any] = json.loads(self._file.read(self._sizes[play_index][task_index]))
+        self._cache(key, task)
+        return task
@@ -207,6 +207,7 @@ class ActionRunTest:
             show_form=self.show_form,
             update_status=self.callable_pass,
             content_format=self.content_format,
+            wake_on=self.callable_pass_one_arg,
         )
         match = re.match(self._app_action.Action.KEGEX, self._action_name)
         if not match:
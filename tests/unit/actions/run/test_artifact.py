@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import pathlib
@@ -12,6 +13,7 @@ from dataclasses import dataclass
 from re import Pattern
 from typing import TYPE_CHECKING
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -25,6 +27,8 @@ from ansible_navigator.actions.run import Action as action
 from ansible_navigator.configuration_subsystem import NavigatorConfiguration
 from ansible_navigator.configuration_subsystem.definitions import Constants
 from ansible_navigator.initialization import parse_and_update
+from ansible_navigator.utils.playbook_artifact import load_streaming_artifact
+from ansible_navigator.utils.playbook_artifact import open_artifact
 from tests.defaults import BaseScenario
 
 
@@ -213,10 +217,9 @@ def test_artifact_path(
     monkeypatch.setenv("HOME", "/home/test_user")
     monkeypatch.setattr(pathlib.Path, "mkdir", make_dirs)
     monkeypatch.setattr(action, "_get_status", get_status)
-    mocked_write = mocker.patch(
-        "ansible_navigator.actions.run.serialize_write_file",
-        return_value=None,
-    )
+    mocked_open = mocker.patch("ansible_navigator.actions.run.open_artifact")
+    mocker.patch("ansible_navigator.actions.run.write_json_artifact", return_value=None)
+    mocked_replace = mocker.patch.object(pathlib.Path, "replace", autospec=True)
 
     args = deepcopy(NavigatorConfiguration)
     args.entry("playbook").value.current = data.playbook
@@ -245,13 +248,13 @@ def test_artifact_path(
     run_action.write_artifact(filename=data.filename)
 
     if data.playbook_artifact_enable is True:
-        opened_filename = str(mocked_write.call_args[1]["file"])
+        opened_filename = str(mocked_replace.call_args[0][1])
         if data.starts_with is not None:
             assert opened_filename.startswith(data.starts_with), caplog.text
         if data.re_match is not None:
             assert data.re_match.match(opened_filename), caplog.text
     else:
-        mocked_write.assert_not_called()
+        mocked_open.assert_not_called()
 
 
 def test_artifact_contents(monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture) -> None:
@@ -263,8 +266,9 @@ def test_artifact_contents(monkeypatch: pytest.MonkeyPatch, mocker: MockerFixtur
     """
     monkeypatch.setattr(os, "makedirs", make_dirs)
     monkeypatch.setattr(action, "_get_status", get_status)
+    mocker.patch("ansible_navigator.actions.run.open_artifact")
     mocked_write = mocker.patch(
-        "ansible_navigator.actions.run.serialize_write_file",
+        "ansible_navigator.actions.run.write_json_artifact",
         return_value=None,
     )
 
@@ -276,8 +280,155 @@ def test_artifact_contents(monkeypatch: pytest.MonkeyPatch, mocker: MockerFixtur
     run_action = action(args=settings)
     run_action.write_artifact(filename="artifact.json")
 
-    settings_entries = mocked_write.call_args[1]["content"]["settings_entries"]
+    settings_entries = mocked_write.call_args[0][1]["settings_entries"]
     assert settings_entries["ansible-navigator"]["app"] == "run"
 
-    settings_sources = mocked_write.call_args[1]["content"]["settings_sources"]
+    settings_sources = mocked_write.call_args[0][1]["settings_sources"]
     assert settings_sources["ansible-navigator.app"] == Constants.USER_CLI.value
+
+
+def test_artifact_streamed(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+    """Test the artifact is streamed as the playbook runs and renamed once complete.
+
+    Args:
+        monkeypatch: The monkeypatch fixture
+        tmp_path: A temporary directory
+    """
+    monkeypatch.setattr(action, "_get_status", get_status)
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("playbook").value.current = str(tmp_path / "site.yml")
+    args.entry("playbook_artifact_enable").value.current = True
+    args.entry("time_zone").value.current = "UTC"
+    args.entry("playbook_artifact_save_as").value.current = str(
+        tmp_path / "{playbook_name}-{playbook_status}.jsonl",
+    )
+    args.entry("run_queue_batch_size").value.current = 500
+
+    run_action = action(args=args)
+    run_action._open_artifact_stream()
+    streamed = tmp_path / "site-running.jsonl"
+    assert streamed.exists()
+
+    play = {"name": "play", "uuid": "p1"}
+    task = {
+        "duration": 1,
+        "host": "host1",
+        "ignore_errors": False,
+        "play_uuid": "p1",
+        "task": "debug",
+        "task_action": "debug",
+        "task_uuid": "t1",
+    }
+    messages: list[dict[str, Any]] = [
+        {"event": "playbook_on_play_start", "event_data": play},
+        {"event": "runner_on_start", "event_data": dict(task)},
+        {"event": "runner_on_ok", "event_data": dict(task), "stdout": "ok"},
+        {"event": "runner_on_start", "event_data": {**task, "host": "host2"}},
+    ]
+    for message in messages:
+        run_action._queue.put(message)
+    run_action._dequeue()
+    assert len(streamed.read_text(encoding="utf-8").splitlines()) == 4
+
+    run_action.write_artifact()
+    assert not streamed.exists()
+    artifact = load_streaming_artifact(tmp_path / "site-successful.jsonl")
+    assert artifact["status"] == "successful"
+    assert artifact["stdout"] == ["ok"]
+    tasks = artifact["plays"][0]["tasks"]
+    assert [task["__result"] for task in tasks] == ["Ok", "In progress"]
+
+
+def test_artifact_compressed(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+    """Test the artifact is compressed when the file name ends with .gz.
+
+    Args:
+        monkeypatch: The monkeypatch fixture
+        tmp_path: A temporary directory
+    """
+    monkeypatch.setattr(action, "_get_status", get_status)
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("playbook").value.current = str(tmp_path / "site.yml")
+    args.entry("time_zone").value.current = "UTC"
+
+    run_action = action(args=args)
+    run_action.stdout = ["ok"]
+    filename = tmp_path / "site.json.gz"
+    run_action.write_artifact(filename=str(filename))
+
+    assert filename.read_bytes().startswith(b"\x1f\x8b")
+    with open_artifact(filename) as fh:
+        artifact = json.load(fh)
+    assert artifact["status"] == "successful"
+    assert artifact["stdout"] == ["ok"]
+
+
+@pytest.mark.parametrize("file_name", ("site.json", "site.jsonl"), ids=("json", "jsonl"))
+def test_artifact_not_encodable(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+    caplog: pytest.LogCaptureFixture,
+    file_name: str,
+) -> None:
+    """Test an artifact that cannot be encoded is reported and leaves no partial file.
+
+    Args:
+        monkeypatch: The monkeypatch fixture
+        tmp_path: A temporary directory
+        caplog: The log capture fixture
+        file_name: The artifact file name
+    """
+    monkeypatch.setattr(action, "_get_status", get_status)
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("playbook").value.current = str(tmp_path / "site.yml")
+    args.entry("time_zone").value.current = "UTC"
+
+    run_action = action(args=args)
+    task = {"__number": 0, "__result": "Ok", "res": {1: "mixed", "keys": object()}}
+    run_action._plays.value = [{"name": "play", "uuid": "p1", "tasks": [task]}]
+    filename = tmp_path / file_name
+    filename.write_text("previous", encoding="utf-8")
+    run_action.write_artifact(filename=str(filename))
+
+    assert "Saving the artifact file failed" in caplog.text
+    assert filename.read_text(encoding="utf-8") == "previous"
+    assert [path.name for path in tmp_path.iterdir()] == [file_name]
+
+
+def test_replay_unindexed_layout(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a JSON artifact without the indented layout is replayed in full.
+
+    Args:
+        monkeypatch: The monkeypatch fixture
+        tmp_path: A temporary directory
+        caplog: The log capture fixture
+    """
+    caplog.set_level(logging.DEBUG)
+    task = {"__number": 0, "__result": "Ok", "host": "host1", "res": {"msg": "hello"}}
+    artifact = {
+        "version": "2.0.0",
+        "plays": [{"name": "play", "uuid": "p1", "tasks": [task]}],
+        "stdout": ["ok"],
+        "status": "successful",
+        "status_color": 10,
+    }
+    path = tmp_path / "compact.json"
+    path.write_text(json.dumps(artifact), encoding="utf-8")
+
+    monkeypatch.setattr(action, "_update_args", lambda *_args: True)
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("mode").value.current = "interactive"
+    args.entry("playbook_artifact_replay").value.current = str(path)
+    run_action = action(args=args)
+    run_action._interaction = MagicMock()
+    run_action._interaction.action.match.groupdict.return_value = {"params_replay": None}
+
+    assert run_action._init_replay()
+    assert "not indexed" in caplog.text
+    assert run_action._replay_artifact is None
+    assert run_action._plays.value[0]["tasks"] == [task]
+    assert run_action.stdout == ["ok"]
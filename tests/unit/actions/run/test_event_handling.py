@@ -0,0 +1,279 @@
+"""Unit tests for runner event handling in the run action."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from copy import deepcopy
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from ansible_navigator.actions.run import EVENT_WAIT
+from ansible_navigator.actions.run import Action as action
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+from ansible_navigator.runner import CommandAsync
+
+
+def play_start(play_uuid: str) -> dict[str, Any]:
+    """Build a playbook_on_play_start message.
+
+    Args:
+        play_uuid: The uuid of the play
+
+    Returns:
+        The runner message
+    """
+    return {
+        "event": "playbook_on_play_start",
+        "event_data": {"name": f"play_{play_uuid}", "uuid": play_uuid},
+    }
+
+
+def runner_on(
+    runner_event: str,
+    play_uuid: str,
+    task_uuid: str,
+    host: str,
+) -> dict[str, Any]:
+    """Build a runner_on_* message.
+
+    Args:
+        runner_event: The runner event suffix, e.g. start, ok, failed
+        play_uuid: The uuid of the parent play
+        task_uuid: The uuid of the task
+        host: The host the task ran on
+
+    Returns:
+        The runner message
+    """
+    return {
+        "event": f"runner_on_{runner_event}",
+        "event_data": {
+            "duration": 1.5,
+            "host": host,
+            "ignore_errors": False,
+            "play_uuid": play_uuid,
+            "res": {"changed": runner_event == "ok"},
+            "task": f"task_{task_uuid}",
+            "task_action": "debug",
+            "task_uuid": task_uuid,
+        },
+    }
+
+
+@pytest.fixture(name="run_action")
+def fixture_run_action() -> action:
+    """Provide an instance of the run action.
+
+    Returns:
+        The run action
+    """
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("run_queue_batch_size").value.current = 500
+    args.entry("run_queue_time_budget").value.current = 100
+    return action(args=args)
+
+
+def test_task_finish_matched_by_uuid_and_host(run_action: action) -> None:
+    """Ensure finish events update the task started for the same host.
+
+    Args:
+        run_action: The run action
+    """
+    for play_uuid in ("p1", "p2"):
+        run_action._handle_message(play_start(play_uuid))
+        for host in ("host1", "host2"):
+            run_action._handle_message(runner_on("start", play_uuid, f"{play_uuid}_t1", host))
+
+    run_action._handle_message(runner_on("ok", "p2", "p2_t1", "host2"))
+    run_action._handle_message(runner_on("failed", "p1", "p1_t1", "host1"))
+
+    results = [
+        [(task["__host"], task["__result"]) for task in play["tasks"]]
+        for play in run_action._plays.value
+    ]
+    assert results == [
+        [("host1", "Failed"), ("host2", "In progress")],
+        [("host1", "In progress"), ("host2", "Ok")],
+    ]
+    assert run_action._plays.value[1]["tasks"][1]["__changed"] is True
+
+
+def test_task_results_stored(run_action: action) -> None:
+    """Ensure task rows keep the menu columns and full results are read from the store.
+
+    Args:
+        run_action: The run action
+    """
+    run_action._handle_message(play_start("p1"))
+    run_action._handle_message(runner_on("start", "p1", "t1", "host1"))
+    run_action._handle_message(runner_on("ok", "p1", "t1", "host1"))
+
+    tasks = run_action._plays.value[0]["tasks"]
+    assert tasks[0]["__result"] == "Ok"
+    assert "res" not in tasks[0]
+    result = tasks.results()[0]
+    assert result["res"] == {"changed": True}
+    assert result["__duration"] == "2s"
+
+
+def test_orphan_events_discarded(run_action: action, caplog: pytest.LogCaptureFixture) -> None:
+    """Ensure events without a parent play or task are discarded.
+
+    Args:
+        run_action: The run action
+        caplog: The log capture fixture
+    """
+    run_action._handle_message(runner_on("start", "missing", "t1", "host1"))
+    assert "Playbook event without parent play" in caplog.text
+
+    run_action._handle_message(play_start("p1"))
+    run_action._handle_message(runner_on("ok", "p1", "t1", "host1"))
+    assert "Task event without parent task" in caplog.text
+    assert run_action._plays.value[0]["tasks"] == []
+
+
+def test_dequeue_batches_within_budget(run_action: action) -> None:
+    """Ensure a time budget stops draining after a batch and the backlog is reported.
+
+    Args:
+        run_action: The run action
+    """
+    run_action._args.entry("run_queue_batch_size").value.current = 10
+    run_action._queue.put(play_start("p1"))
+    for host in range(24):
+        run_action._queue.put(runner_on("start", "p1", "t1", f"host{host}"))
+
+    run_action._dequeue(time_budget=0)
+    assert len(run_action._plays.value[0]["tasks"]) == 9
+    assert run_action._queue.qsize() == 15
+    assert run_action.drain_lag >= 0
+    assert run_action._drain_status().startswith("Queue: 15 Lag: ")
+    assert run_action._events_queued.is_set()
+
+    run_action._dequeue()
+    assert len(run_action._plays.value[0]["tasks"]) == 24
+    assert run_action._queue.empty()
+    assert not run_action._events_queued.is_set()
+    assert run_action.drain_lag == 0
+    assert not run_action._drain_status()
+
+
+def test_drain_settings(run_action: action) -> None:
+    """Ensure the drain batch size and time budget come from the settings.
+
+    Args:
+        run_action: The run action
+    """
+    run_action._args.entry("run_queue_batch_size").value.current = 20
+    for host in range(30):
+        run_action._queue.put(runner_on("start", "p1", "t1", f"host{host}"))
+    assert len(run_action._dequeue_batch()) == 20
+
+    run_action.runner = MagicMock()
+    run_action.runner.finished = False
+    run_action._calling_app = MagicMock()
+    run_action._dequeue = MagicMock()  # type: ignore[method-assign]
+    run_action._set_status = MagicMock()  # type: ignore[method-assign]
+    run_action._args.entry("run_queue_time_budget").value.current = 200
+    run_action.update()
+    run_action._dequeue.assert_called_once_with(time_budget=0.2)
+
+
+def test_pending_update(run_action: action) -> None:
+    """Ensure the user interface is woken for runner events and once the runner finishes.
+
+    Args:
+        run_action: The run action
+    """
+    assert run_action._pending_update() is False
+
+    run_action.runner = MagicMock(finished=False)
+    run_action._runner_finished = False
+    assert run_action._pending_update() is False
+
+    run_action._queue.put(play_start("p1"))
+    run_action._events_queued.set()
+    assert run_action._pending_update() is True
+    run_action._dequeue()
+    assert run_action._pending_update() is False
+
+    run_action.runner.finished = True
+    assert run_action._pending_update() is True
+    run_action._runner_finished = True
+    assert run_action._pending_update() is False
+
+
+def test_wait_for_events(run_action: action) -> None:
+    """Ensure waiting for runner events returns once one is queued.
+
+    Args:
+        run_action: The run action
+    """
+    start = time.monotonic()
+    run_action._wait_for_events(0.01)
+    assert time.monotonic() - start >= 0.01
+
+    command = CommandAsync(
+        executable_cmd="ansible-playbook",
+        queue=run_action._queue,
+        write_job_events=False,
+        events_queued=run_action._events_queued,
+    )
+    timer = threading.Timer(0.01, command._event_handler, args=(play_start("p1"),))
+    timer.start()
+    start = time.monotonic()
+    run_action._wait_for_events(5)
+    timer.join()
+    assert time.monotonic() - start < 5
+    assert run_action._queue.qsize() == 1
+
+
+def test_task_store_closed_on_exit(run_action: action) -> None:
+    """Ensure the task store is closed when the action exits.
+
+    Args:
+        run_action: The run action
+    """
+    run_action._handle_message(play_start("p1"))
+    run_action._handle_message(runner_on("start", "p1", "t1", "host1"))
+    run_action._handle_message(runner_on("ok", "p1", "t1", "host1"))
+    file = run_action._task_store._file
+    assert file is not None
+    run_action._previous_scroll = 0
+    run_action._previous_filter = None
+    interaction = MagicMock()
+
+    run_action._prepare_to_exit(interaction)
+    interaction.ui.wake_on.assert_called_once_with(None)
+    assert file.closed
+
+
+def test_stdout_mode_waits_for_events(run_action: action, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure mode stdout waits for the runner event and drains events posted before it finished.
+
+    Args:
+        run_action: The run action
+        monkeypatch: The monkeypatch fixture
+    """
+    run_action._args.entry("playbook_artifact_enable").value.current = False
+    runner = MagicMock(finished=False)
+    runner.ansible_runner_instance.rc = 0
+    waits: list[float] = []
+
+    def run_runner() -> None:
+        run_action.runner = runner
+
+    def wait_for_events(timeout: float) -> None:
+        waits.append(timeout)
+        run_action._queue.put(play_start("p1"))
+        runner.finished = True
+
+    monkeypatch.setattr(run_action, "_run_runner", run_runner)
+    monkeypatch.setattr(run_action, "_wait_for_events", wait_for_events)
+    assert run_action.run_stdout().return_code == 0
+    assert waits == [EVENT_WAIT]
+    assert run_action._plays.value[0]["uuid"] == "p1"
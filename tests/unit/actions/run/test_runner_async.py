@@ -6,6 +6,7 @@ from copy import deepcopy
 from dataclasses import dataclass
 from pathlib import Path
 from queue import Queue
+from threading import Event
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -56,6 +57,7 @@ class Scenario(BaseScenario):
 
 
 TEST_QUEUE: Queue[dict[str, str]] = Queue()
+TEST_EVENT = Event()
 
 test_data = [
     Scenario(
@@ -83,6 +85,7 @@ test_data = [
         expected={
             "executable_cmd": "ansible-playbook",
             "queue": TEST_QUEUE,
+            "events_queued": TEST_EVENT,
             "container_engine": "docker",
             "container_options": ["--net=host"],
             "execution_environment_image": "quay.io/ansible/network-ee:latest",
@@ -144,6 +147,7 @@ def test_runner_args(mocker: MockerFixture, data: Scenario) -> None:
 
     run = action(args=args)
     run._queue = TEST_QUEUE
+    run._events_queued = TEST_EVENT
     with pytest.raises(TestRunnerError):
         run._run_runner()
 
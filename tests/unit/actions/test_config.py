@@ -6,11 +6,13 @@ from copy import deepcopy
 
 import pytest
 
+from ansible_navigator.actions import config
 from ansible_navigator.actions.config import Action as action
 from ansible_navigator.actions.config import color_menu
 from ansible_navigator.actions.config import content_heading
 from ansible_navigator.actions.config import filter_content_keys
 from ansible_navigator.cli import NavigatorConfiguration
+from ansible_navigator.runner import AnsibleConfig
 from ansible_navigator.ui_framework.curses_defs import CursesLinePart
 
 
@@ -116,3 +118,40 @@ def test_parse_and_merge(
 
     if "GALAXY_SERVERS" in list_output:
         assert not any(config.get("option") == "GALAXY_SERVERS" for config in run_action._config)
+
+
+def test_parsed_config_reused(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure the parsed configuration is reused until something it depends on changes.
+
+    Args:
+        monkeypatch: The monkeypatch fixture
+    """
+    fetched = []
+
+    def fetch_ansible_configs(
+        _self: AnsibleConfig,
+        actions: tuple[str, ...],
+        config_file: str | None = None,
+    ) -> dict[str, tuple[str, str]]:
+        fetched.append(actions)
+        return {
+            "list": ("SOME_VAR:\n  default: some_value\n", ""),
+            "dump": ("SOME_VAR(default) = some_value\n", ""),
+        }
+
+    monkeypatch.setattr(AnsibleConfig, "fetch_ansible_configs", fetch_ansible_configs)
+    monkeypatch.setattr(config, "parsed_config_cache", {})
+    monkeypatch.setattr(action, "_installation_identity", lambda _self: "ansible")
+    args = deepcopy(NavigatorConfiguration)
+    kwargs = {"pass_environment_variable": [], "set_environment_variable": {"ONE": "1"}}
+
+    for _ in range(2):
+        run_action = action(args=args)
+        run_action._run_runner_interactive(dict(kwargs))
+        assert run_action._config
+        assert run_action._config[0]["option"] == "SOME_VAR"
+    assert fetched == [("list", "dump")]
+
+    kwargs["set_environment_variable"] = {"ONE": "2"}
+    action(args=args)._run_runner_interactive(dict(kwargs))
+    assert len(fetched) == 2
@@ -0,0 +1,174 @@
+"""Unit tests for the ``images`` action."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from threading import Event
+from threading import Thread
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+import pytest
+
+from ansible_navigator.actions.images import PREFETCH_TIMEOUT
+from ansible_navigator.actions.images import Action as action
+from ansible_navigator.cli import NavigatorConfiguration
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+IMAGE = "quay.io/ansible/creator-ee:latest"
+OUTPUT = '{"errors": []}'
+
+
+class Introspected(NamedTuple):
+    """An images action and the images it introspected."""
+
+    action: action
+    images: list[str]
+
+
+@pytest.fixture(name="introspected")
+def fixture_introspected(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Introspected:
+    """Provide an images action with a runner recording the images introspected.
+
+    Args:
+        tmp_path: The pytest tmp_path fixture
+        monkeypatch: The pytest monkeypatch fixture
+
+    Returns:
+        The images action and the images it introspected
+    """
+    args = deepcopy(NavigatorConfiguration)
+    args.internals.cache_path = tmp_path
+    args.entry("execution_environment_image").value.current = IMAGE
+    args.entry("images_refresh").value.current = False
+    introspected = Introspected(action=action(args=args), images=[])
+
+    def run_runner(image_name: str, timeout: int | None = None) -> tuple[str, str, int]:
+        introspected.images.append(image_name)
+        return OUTPUT, "", 0
+
+    monkeypatch.setattr(introspected.action, "_run_runner", run_runner)
+    return introspected
+
+
+def image(name: str, image_id: str) -> dict[str, Any]:
+    """Build an image from the images list.
+
+    Args:
+        name: The full image name
+        image_id: The image ID
+
+    Returns:
+        The image
+    """
+    return {
+        "__full_name": name,
+        "execution_environment": True,
+        "image_id": image_id[:12],
+        "inspect": {"details": {"id": image_id}, "errors": ""},
+    }
+
+
+def test_introspection_cached(introspected: Introspected) -> None:
+    """Ensure an image is introspected once, unless a refresh is requested.
+
+    Args:
+        introspected: The images action and the images it introspected
+    """
+    images_action = introspected.action
+    primary = image(IMAGE, "abc123def456ghi789")
+    assert images_action._introspection_output(primary) == (OUTPUT, "", 0)
+    assert images_action._introspection_output(primary) == (OUTPUT, "", 0)
+    assert introspected.images == [IMAGE]
+
+    images_action._args.entry("images_refresh").value.current = True
+    images_action._introspection_output(primary)
+    assert introspected.images == [IMAGE, IMAGE]
+
+
+def test_prefetch_primary(introspected: Introspected) -> None:
+    """Ensure only the primary image is introspected ahead of its selection.
+
+    Args:
+        introspected: The images action and the images it introspected
+    """
+    images_action = introspected.action
+    primary = image(IMAGE, "abc123def456ghi789")
+    images_action._images.value = [image("other:latest", "123abc456def789ghi"), primary]
+    images_action._prefetch_primary()
+    assert images_action._introspection_output(primary) == (OUTPUT, "", 0)
+    assert introspected.images == [IMAGE]
+
+    images_action._prefetch_primary()
+    assert not images_action._prefetched
+
+
+def test_prefetch_races_selection(
+    introspected: Introspected,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure selecting the primary image while it is introspected waits for that introspection.
+
+    Args:
+        introspected: The images action and the images it introspected
+        monkeypatch: The pytest monkeypatch fixture
+    """
+    images_action = introspected.action
+    primary = image(IMAGE, "abc123def456ghi789")
+    images_action._images.value = [primary]
+    started = Event()
+    release = Event()
+    timeouts: list[int | None] = []
+
+    def run_runner(image_name: str, timeout: int | None = None) -> tuple[str, str, int]:
+        introspected.images.append(image_name)
+        timeouts.append(timeout)
+        started.set()
+        release.wait(5)
+        return OUTPUT, "", 0
+
+    monkeypatch.setattr(images_action, "_run_runner", run_runner)
+    images_action._prefetch_primary()
+    assert started.wait(5)
+
+    selected: list[tuple[str, str, int]] = []
+    selection = Thread(target=lambda: selected.append(images_action._introspection_output(primary)))
+    selection.start()
+    selection.join(0.1)
+    assert selection.is_alive()
+
+    release.set()
+    selection.join(5)
+    assert images_action._prefetch_thread is not None
+    images_action._prefetch_thread.join(5)
+    assert not images_action._prefetch_thread.daemon
+    assert selected == [(OUTPUT, "", 0)]
+    assert introspected.images == [IMAGE]
+    assert timeouts == [PREFETCH_TIMEOUT]
+
+
+def test_prefetch_failed(introspected: Introspected, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure the primary image is introspected again when it failed in the background.
+
+    Args:
+        introspected: The images action and the images it introspected
+        monkeypatch: The pytest monkeypatch fixture
+    """
+    images_action = introspected.action
+    primary = image(IMAGE, "abc123def456ghi789")
+    images_action._images.value = [primary]
+    results = [("", "timed out", 254), (OUTPUT, "", 0)]
+
+    def run_runner(image_name: str, timeout: int | None = None) -> tuple[str, str, int]:
+        introspected.images.append(image_name)
+        return results.pop(0)
+
+    monkeypatch.setattr(images_action, "_run_runner", run_runner)
+    images_action._prefetch_primary()
+    assert images_action._introspection_output(primary) == (OUTPUT, "", 0)
+    assert introspected.images == [IMAGE, IMAGE]
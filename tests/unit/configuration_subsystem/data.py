@@ -272,46 +272,50 @@ ENV_VAR_DATA = [
         ["ansible_version", "python_version"],
         id="25",
     ),
+    pytest.param("images_refresh", "false", False, id="26"),
     pytest.param(
         "inventory",
         "/tmp/test1.yaml,/tmp/test2.yml",
         ["/tmp/test1.yaml", "/tmp/test2.yml"],
-        id="26",
+        id="27",
     ),
-    pytest.param("inventory_column", "t1,t2,t3", ["t1", "t2", "t3"], id="27"),
+    pytest.param("inventory_column", "t1,t2,t3", ["t1", "t2", "t3"], id="28"),
     pytest.param(
         "lint_config",
         "/tmp/ansible-lint-config.yml",
         "/tmp/ansible-lint-config.yml",
-        id="28",
+        id="29",
     ),
-    pytest.param("lintables", "/tmp/lintables", "/tmp/lintables", id="29"),
-    pytest.param("log_append", "false", False, id="30"),
-    pytest.param("log_file", TMP_APP_LOG, TMP_APP_LOG, id="31"),
-    pytest.param("log_level", "info", "info", id="32"),
-    pytest.param("mode", "interactive", "interactive", id="33"),
-    pytest.param("osc4", "false", False, id="34"),
-    pytest.param("pass_environment_variable", "a,b,c", ["a", "b", "c"], id="35"),
-    pytest.param("playbook", "/tmp/site.yaml", "/tmp/site.yaml", id="36"),
-    pytest.param("playbook_artifact_enable", "false", False, id="37"),
-    pytest.param("playbook_artifact_replay", "/tmp/load.json", "/tmp/load.json", id="38"),
-    pytest.param("playbook_artifact_save_as", "/tmp/save.json", "/tmp/save.json", id="39"),
-    pytest.param("plugin_name", "shell", "shell", id="40"),
-    pytest.param("plugin_type", "become", "become", id="41"),
-    pytest.param("pull_arguments", "--tls-verify=false", ["--tls-verify=false"], id="42"),
-    pytest.param("pull_policy", "never", "never", id="43"),
+    pytest.param("lintables", "/tmp/lintables", "/tmp/lintables", id="30"),
+    pytest.param("log_append", "false", False, id="31"),
+    pytest.param("log_file", TMP_APP_LOG, TMP_APP_LOG, id="32"),
+    pytest.param("log_level", "info", "info", id="33"),
+    pytest.param("max_frame_rate", "30", 30, id="34"),
+    pytest.param("mode", "interactive", "interactive", id="35"),
+    pytest.param("osc4", "false", False, id="36"),
+    pytest.param("pass_environment_variable", "a,b,c", ["a", "b", "c"], id="37"),
+    pytest.param("playbook", "/tmp/site.yaml", "/tmp/site.yaml", id="38"),
+    pytest.param("playbook_artifact_enable", "false", False, id="39"),
+    pytest.param("playbook_artifact_replay", "/tmp/load.json", "/tmp/load.json", id="40"),
+    pytest.param("playbook_artifact_save_as", "/tmp/save.json", "/tmp/save.json", id="41"),
+    pytest.param("plugin_name", "shell", "shell", id="42"),
+    pytest.param("plugin_type", "become", "become", id="43"),
+    pytest.param("pull_arguments", "--tls-verify=false", ["--tls-verify=false"], id="44"),
+    pytest.param("pull_policy", "never", "never", id="45"),
+    pytest.param("run_queue_batch_size", "100", 100, id="46"),
+    pytest.param("run_queue_time_budget", "100", 100, id="47"),
     pytest.param(
         "set_environment_variable",
         "T1=A,T2=B,T3=C",
         {"T1": "A", "T2": "B", "T3": "C"},
-        id="44",
+        id="48",
     ),
-    pytest.param("settings_effective", "false", False, id="45"),
-    pytest.param("settings_sample", "false", False, id="46"),
-    pytest.param("settings_schema", "json", "json", id="47"),
-    pytest.param("settings_sources", "false", False, id="48"),
-    pytest.param("time_zone", "Japan", "Japan", id="49"),
-    pytest.param("workdir", "/tmp/", "/tmp/", id="50"),
+    pytest.param("settings_effective", "false", False, id="49"),
+    pytest.param("settings_sample", "false", False, id="50"),
+    pytest.param("settings_schema", "json", "json", id="51"),
+    pytest.param("settings_sources", "false", False, id="52"),
+    pytest.param("time_zone", "Japan", "Japan", id="53"),
+    pytest.param("workdir", "/tmp/", "/tmp/", id="54"),
 ]
 
 SETTINGS = [
@@ -0,0 +1,52 @@
+"""Tests for the post processors of positive integer settings."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+
+import pytest
+
+from ansible_navigator.configuration_subsystem import Constants as C
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+from ansible_navigator.configuration_subsystem.navigator_post_processor import (
+    NavigatorPostProcessor,
+)
+
+
+@pytest.mark.parametrize(
+    "name",
+    ("max_frame_rate", "run_queue_batch_size", "run_queue_time_budget"),
+)
+@pytest.mark.parametrize(
+    ("current", "expected", "exit_message_substr"),
+    (
+        pytest.param("25", 25, "", id="valid"),
+        pytest.param("0", 0, "must be at least 1", id="zero"),
+        pytest.param("fast", "fast", "Value should be valid integer", id="not_integer"),
+    ),
+)
+def test_pp_direct(name: str, current: str, expected: int | str, exit_message_substr: str) -> None:
+    """Test the positive integer post processors.
+
+    Args:
+        name: The name of the settings entry
+        current: The current value of the entry
+        expected: The expected value of the entry
+        exit_message_substr: A substring of the expected exit message
+    """
+    settings = deepcopy(NavigatorConfiguration)
+    entry = settings.entry(name)
+
+    entry.value.current = current
+    entry.value.source = C.USER_CLI
+
+    _messages, exit_messages = getattr(NavigatorPostProcessor(), name)(
+        entry=entry,
+        config=settings,
+    )
+
+    assert entry.value.current == expected
+    if exit_message_substr:
+        assert exit_message_substr in exit_messages[0].message
+    else:
+        assert not exit_messages
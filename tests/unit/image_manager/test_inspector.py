@@ -0,0 +1,118 @@
+"""Unit tests for image inspection."""
+
+from __future__ import annotations
+
+import json
+import sys
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ansible_navigator.image_manager import inspector
+from ansible_navigator.image_manager.inspector import ImagesInspect
+from ansible_navigator.image_manager.inspector import InspectCache
+from ansible_navigator.image_manager.inspector import inspect_all
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+IMAGES = {
+    "0123456789ab": "quay.io/ansible/creator-ee",
+    "123456789abc": "quay.io/ansible/awx-ee",
+    "23456789abcd": "registry.example.com/base",
+}
+
+ENGINE = """
+import json
+import sys
+
+images = json.loads({images!r})
+with open({calls!r}, "a") as calls:
+    calls.write(" ".join(sys.argv[1:]) + "\\n")
+if sys.argv[1] == "images":
+    print("REPOSITORY                  TAG       IMAGE ID      CREATED       SIZE")
+    for image_id, repository in images.items():
+        print(f"{{repository:<26}}  latest    {{image_id}}  2 days ago    1 GB")
+else:
+    found = [
+        {{"Id": "sha256:" + image_id * 5, "RepoTags": [images[image_id] + ":latest"]}}
+        for image_id in sys.argv[2:]
+        if image_id in images
+    ]
+    print(json.dumps(found))
+"""
+
+
+@pytest.fixture(name="engine")
+def fixture_engine(tmp_path: Path) -> tuple[str, Path]:
+    """Provide a container engine listing and inspecting a few images.
+
+    Args:
+        tmp_path: The pytest tmp_path fixture
+
+    Returns:
+        The container engine command and the file its invocations are written to
+    """
+    calls = tmp_path / "calls.txt"
+    script = tmp_path / "engine.py"
+    script.write_text(ENGINE.format(images=json.dumps(IMAGES), calls=str(calls)))
+    inspector.inspect_cache.clear()
+    return f"{sys.executable} {script}", calls
+
+
+def test_inspect_all_batched(engine: tuple[str, Path], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure images are inspected in batches and the inspections reused.
+
+    Args:
+        engine: The container engine and the file its invocations are written to
+        monkeypatch: The pytest monkeypatch fixture
+    """
+    container_engine, calls = engine
+    monkeypatch.setattr(inspector, "INSPECT_BATCH_SIZE", 2)
+
+    images, error = inspect_all(container_engine=container_engine)
+    assert not error
+    for image in images:
+        assert image["inspect"]["details"]["repo_tags"] == [f"{image['repository']}:latest"]
+        assert image["inspect"]["details"]["id"].startswith(f"sha256:{image['image_id']}")
+    assert sorted(calls.read_text().splitlines()) == [
+        "images",
+        "inspect 0123456789ab 123456789abc",
+        "inspect 23456789abcd",
+    ]
+
+    inspect_all(container_engine=container_engine)
+    assert calls.read_text().splitlines()[3:] == ["images"]
+
+
+def test_inspect_missing(engine: tuple[str, Path]) -> None:
+    """Ensure an image missing from the inspection is reported.
+
+    Args:
+        engine: The container engine and the file its invocations are written to
+    """
+    container_engine, _calls = engine
+    command = ImagesInspect(container_engine=container_engine, ids=["0123456789ab", "fedcba987654"])
+    result = inspector.CommandRunner.run_single_process(command.commands)[0]
+    assert isinstance(result.details, dict)
+    assert list(result.details) == ["0123456789ab"]
+
+
+def test_inspect_cache_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure an inspection is not reused once it has expired.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture
+    """
+    now = [100.0]
+    monkeypatch.setattr(inspector.time, "monotonic", lambda: now[0])
+    cache = InspectCache(ttl=10)
+    cache.put("podman", "0123456789ab", {"details": {}, "errors": ""})
+    now[0] += 5
+    assert cache.get("podman", "0123456789ab") == {"details": {}, "errors": ""}
+    assert cache.get("docker", "0123456789ab") is None
+    now[0] += 10
+    assert cache.get("podman", "0123456789ab") is None
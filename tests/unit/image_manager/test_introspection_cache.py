@@ -0,0 +1,54 @@
+"""Unit tests for the image introspection cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from ansible_navigator.image_manager import introspection_cache
+from ansible_navigator.image_manager.introspection_cache import IntrospectionCache
+from ansible_navigator.image_manager.introspection_cache import image_identity
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+OUTPUT = '{"errors": [], "python_version": {"details": {"version": "3.11"}}}'
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    """Ensure introspection output is kept between instances of the cache.
+
+    Args:
+        tmp_path: The pytest tmp_path fixture
+    """
+    path = tmp_path / "cache" / introspection_cache.INTROSPECTION_CACHE_NAME
+    IntrospectionCache(path).put("abc123", OUTPUT)
+    cache = IntrospectionCache(path)
+    assert cache.get("abc123") == OUTPUT
+    assert cache.get("def456") is None
+
+
+def test_script_version(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure output from another version of the introspection script is not used.
+
+    Args:
+        tmp_path: The pytest tmp_path fixture
+        monkeypatch: The pytest monkeypatch fixture
+    """
+    cache = IntrospectionCache(tmp_path / introspection_cache.INTROSPECTION_CACHE_NAME)
+    cache.put("abc123", OUTPUT)
+    monkeypatch.setattr(introspection_cache, "script_version", lambda: "updated")
+    assert cache.get("abc123") is None
+
+
+def test_image_identity() -> None:
+    """Ensure the full ID from the image inspection is preferred."""
+    inspect: dict[str, Any] = {"details": {"id": "abc123def456"}, "errors": ""}
+    image = {"image_id": "abc123", "inspect": inspect}
+    assert image_identity(image) == "abc123def456"
+    inspect["details"] = None
+    assert image_identity(image) == "abc123"
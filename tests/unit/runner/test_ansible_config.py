@@ -0,0 +1,50 @@
+"""Unit tests for the ansible-config runner."""
+
+from __future__ import annotations
+
+import threading
+
+from typing import Any
+
+import pytest
+
+from ansible_navigator.runner import ansible_config
+from ansible_navigator.runner.ansible_config import AnsibleConfig
+
+
+@pytest.mark.parametrize(
+    ("rotate_artifacts", "expected_overlap"),
+    (
+        pytest.param(None, True, id="no_rotation"),
+        pytest.param(2, True, id="enough_kept"),
+        pytest.param(1, False, id="too_few_kept"),
+    ),
+)
+def test_fetch_ansible_configs(
+    monkeypatch: pytest.MonkeyPatch,
+    rotate_artifacts: int | None,
+    expected_overlap: bool,
+) -> None:
+    """Ensure the actions are fetched together unless artifact rotation prevents it.
+
+    Args:
+        monkeypatch: The monkeypatch fixture
+        rotate_artifacts: The number of artifact directories to keep
+        expected_overlap: Whether the fetches are expected to overlap
+    """
+    started = threading.Barrier(2, timeout=1)
+    overlapped = []
+
+    def get_ansible_config(action: str, **_kwargs: Any) -> tuple[str, str]:
+        try:
+            started.wait()
+            overlapped.append(True)
+        except threading.BrokenBarrierError:
+            overlapped.append(False)
+        return f"{action} output", ""
+
+    monkeypatch.setattr(ansible_config, "get_ansible_config", get_ansible_config)
+    runner = AnsibleConfig(rotate_artifacts=rotate_artifacts)
+    outputs = runner.fetch_ansible_configs(("list", "dump"))
+    assert outputs == {"list": ("list output", ""), "dump": ("dump output", "")}
+    assert all(overlapped) is expected_overlap
@@ -0,0 +1,70 @@
+"""Unit tests for the asynchronous runner command."""
+
+from __future__ import annotations
+
+from queue import Queue
+from threading import Event
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from ansible_navigator.runner.command_async import CommandAsync
+
+
+def runner_event() -> dict[str, Any]:
+    """Build an ansible-runner event.
+
+    Returns:
+        The event
+    """
+    return {
+        "event": "runner_on_ok",
+        "event_data": {"host": "localhost", "res": {"ansible_facts": {"packages": {}}}},
+        "uuid": "a-b-c",
+    }
+
+
+@pytest.mark.parametrize(
+    ("write_job_events", "shared"),
+    ((False, False), (True, True)),
+    ids=("transferred", "copied"),
+)
+def test_event_handler(write_job_events: bool, shared: bool) -> None:
+    """Ensure events are only copied when ansible-runner uses them once handled.
+
+    Args:
+        write_job_events: Whether ansible-runner writes the job events
+        shared: Whether the event is expected to be shared with ansible-runner
+    """
+    queue: Queue[Any] = Queue()
+    command = CommandAsync(
+        executable_cmd="ansible-playbook",
+        queue=queue,
+        write_job_events=write_job_events,
+    )
+    event = runner_event()
+
+    assert command._event_handler(event) is write_job_events
+    queued = queue.get_nowait()
+    assert command.event_shared is shared
+    assert (queued is event) is not shared
+    assert queued["event_data"]["res"] is event["event_data"]["res"]
+
+    queued["event_data"]["__host"] = "localhost"
+    assert ("__host" in event["event_data"]) is not shared
+
+
+def test_finished_sets_event() -> None:
+    """Ensure anything waiting for events is woken once the runner finishes."""
+    events_queued = Event()
+    command = CommandAsync(
+        executable_cmd="ansible-playbook",
+        queue=Queue(),
+        write_job_events=False,
+        events_queued=events_queued,
+    )
+    command.runner_finished_callback(MagicMock(status="successful"))
+    assert command.finished
+    assert command.status == "successful"
+    assert events_queued.is_set()
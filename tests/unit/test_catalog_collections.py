@@ -1,65 +1,96 @@
 """Unit tests for catalog collections."""
 
-import multiprocessing
+import json
 
 from pathlib import Path
-from typing import Any
 from unittest.mock import MagicMock  # pylint: disable=preferred-module
 from unittest.mock import patch  # pylint: disable=preferred-module
 
+from ansible_navigator.data.catalog_collections import extract_doc
 from ansible_navigator.data.catalog_collections import retrieve_collections_paths
+from ansible_navigator.data.catalog_collections import retrieve_docs
 from ansible_navigator.data.catalog_collections import run_command
-from ansible_navigator.data.catalog_collections import worker
+from ansible_navigator.utils.key_value_store import KeyValueStore
 
 
-def test_worker_with_failed_get_docstring() -> None:
-    """Test worker function.
+def test_extract_doc_with_failed_get_docstring() -> None:
+    """Test extract_doc function.
 
-    Test worker function when get_docstring fails and
+    Test extract_doc function when get_docstring fails and
      get_doc_withast method is used to parse the content.
     """
-    # Create the queues
-    pending_queue: multiprocessing.Queue[Any] = multiprocessing.Queue()
-    completed_queue: multiprocessing.Queue[Any] = multiprocessing.Queue()
-
     plugin_path = Path("tests/fixtures/common/module_1.py")
     collection_name = "microsoft.ad"
     checksum = "12345"
 
-    # Add an entry to the pending queue
-    entry = collection_name, checksum, plugin_path
-    pending_queue.put(entry)
-
-    # Add a None entry to signal the end of processing
-    pending_queue.put(None)
-
-    worker(pending_queue, completed_queue)
-
-    plugin_path, data = completed_queue.get()
+    message_type, data = extract_doc((collection_name, checksum, plugin_path))
+    assert message_type == "plugin"
     assert "vCenter" in data[1]
 
 
-def test_worker_with_invalid_plugin_path() -> None:
-    """Test the worker function when get_docstring has invalid plugin_path."""
-    pending_queue: multiprocessing.Queue[Any] = multiprocessing.Queue()
-    completed_queue: multiprocessing.Queue[Any] = multiprocessing.Queue()
-
+def test_extract_doc_with_invalid_plugin_path() -> None:
+    """Test the extract_doc function when get_docstring has invalid plugin_path."""
     plugin_path = Path("tests/fixtures/common/xyz.py")
     collection_name = "microsoft.ad"
     checksum = "12345"
 
-    # Add an entry to the pending queue
-    entry = collection_name, checksum, plugin_path
-    pending_queue.put(entry)
+    message_type, data = extract_doc((collection_name, checksum, plugin_path))
+    assert message_type == "error"
+    assert "FileNotFoundError (get_docstring)" in data[2]
 
-    # Add a None entry to signal the end of processing
-    pending_queue.put(None)
 
-    worker(pending_queue, completed_queue)
+def test_retrieve_docs(tmp_path: Path) -> None:
+    """Test the docs are written to the cache as they are extracted.
 
-    plugin_path, data = completed_queue.get()
-    assert plugin_path == "error"
-    assert "FileNotFoundError (get_docstring)" in data[2]
+    Args:
+        tmp_path: A temporary directory
+    """
+    collection_cache = KeyValueStore(tmp_path / "collection_doc_cache.db")
+    errors: list[dict[str, str]] = []
+    stats = {"cache_added_success": 0, "cache_added_errors": 0}
+    missing = [
+        ("microsoft.ad", "12345", Path("tests/fixtures/common/module_1.py")),
+        ("microsoft.ad", "67890", Path("tests/fixtures/common/xyz.py")),
+    ]
+
+    retrieve_docs(collection_cache, errors, missing, stats, entry_version="2")
+
+    assert "vCenter" in collection_cache["12345"]
+    assert json.loads(collection_cache["12345"])["version"] == "2"
+    assert "FileNotFoundError" in collection_cache["67890"]
+    assert errors[0]["path"] == "tests/fixtures/common/xyz.py"
+    assert stats["cache_added_success"] == stats["cache_added_errors"] == 1
+    assert stats["plugins_per_second"] > 0
+    collection_cache.close()
+
+
+def test_retrieve_docs_worker_raises(tmp_path: Path) -> None:
+    """Test the plugins of a worker that raises are recorded as errors and not cached.
+
+    Args:
+        tmp_path: A temporary directory
+    """
+    collection_cache = KeyValueStore(tmp_path / "collection_doc_cache.db")
+    errors: list[dict[str, str]] = []
+    stats = {"cache_added_success": 0, "cache_added_errors": 0}
+    missing = [
+        ("microsoft.ad", "12345", Path("tests/fixtures/common/module_1.py")),
+        # cannot be unpacked by the worker
+        ("microsoft.ad", Path("tests/fixtures/common/module_2.py")),
+    ]
+
+    retrieve_docs(collection_cache, errors, missing, stats)
+
+    assert list(collection_cache.keys()) == ["12345"]
+    assert errors == [
+        {
+            "path": "tests/fixtures/common/module_2.py",
+            "error": "ValueError (extract_doc): not enough values to unpack (expected 3, got 2)",
+        },
+    ]
+    assert stats["cache_added_success"] == 1
+    assert stats["cache_added_errors"] == 0
+    collection_cache.close()
 
 
 @patch("ansible_navigator.data.catalog_collections.subprocess.run")
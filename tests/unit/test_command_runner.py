@@ -162,3 +162,40 @@ class TestWorkerHealthCheck:
 
         assert len(results) == 1
         assert results[0].identity == "cmd1"
+
+
+class TestRunMultiThread:
+    """Tests for CommandRunner.run_multi_thread."""
+
+    def test_results_in_order(self) -> None:
+        """Verify the results are returned in the order of the commands."""
+        commands = [
+            Command(identity=f"cmd{idx}", command=f"echo {idx}", post_process=_noop_post_process)
+            for idx in range(12)
+        ]
+        results = CommandRunner.run_multi_thread(commands)
+        assert [result.identity for result in results] == [f"cmd{idx}" for idx in range(12)]
+        assert [result.stdout for result in results] == [f"{idx}\n" for idx in range(12)]
+        assert all(result.details == {"status": "ok"} for result in results)
+
+    def test_crashing_post_process(self) -> None:
+        """Verify a crashing post_process is recorded as an error."""
+        commands = [
+            Command(identity="ok", command="echo hello", post_process=_noop_post_process),
+            Command(identity="crash", command="echo world", post_process=_crashing_post_process),
+        ]
+        results = CommandRunner.run_multi_thread(commands)
+        assert not results[0].errors
+        assert "Simulated crash" in results[1].errors
+
+    def test_duration(self) -> None:
+        """Verify the wall time of each command is recorded."""
+        commands = [
+            Command(identity="sleep", command="sleep 0.1", post_process=_noop_post_process),
+        ]
+        results = CommandRunner.run_multi_thread(commands)
+        assert results[0].duration >= 0.1
+
+    def test_no_commands(self) -> None:
+        """Verify no commands produce no results."""
+        assert CommandRunner.run_multi_thread([]) == []
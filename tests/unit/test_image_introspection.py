@@ -6,7 +6,9 @@ import sys
 import types
 
 from importlib.machinery import ModuleSpec
+from pathlib import Path
 from queue import Empty
+from queue import Queue
 from types import SimpleNamespace
 from typing import Any
 
@@ -467,3 +469,54 @@ class TestRunMultiThreadHealthCheck:
 
         with pytest.raises(RuntimeError, match="All worker threads have terminated"):
             runner.run_multi_thread([cmd_parser])
+
+
+class TestBoundedWorkers:
+    """Tests for the number of commands run at the same time."""
+
+    @pytest.mark.parametrize(
+        ("cpu_max", "expected"),
+        (
+            pytest.param("150000 100000", 2, id="quota"),
+            pytest.param("max 100000", 4, id="no_quota"),
+            pytest.param("800000 100000", 4, id="quota_above_cpus"),
+            pytest.param("", 4, id="no_cgroup"),
+        ),
+    )
+    def test_cpu_quota(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        cpu_max: str,
+        expected: int,
+    ) -> None:
+        """Verify the CPU quota of the container limits the CPUs used.
+
+        Args:
+            tmp_path: Pytest tmp_path fixture
+            monkeypatch: Pytest monkeypatch fixture
+            cpu_max: The cgroup v2 CPU quota and period
+            expected: The number of CPUs expected
+        """
+        cgroup = tmp_path / "cpu.max"
+        if cpu_max:
+            cgroup.write_text(f"{cpu_max}\n")
+        monkeypatch.setattr(image_introspect, "CGROUP_V2_CPU_MAX", str(cgroup))
+        monkeypatch.setattr(image_introspect, "CGROUP_V1_CPU_QUOTA", str(tmp_path / "missing"))
+        monkeypatch.setattr(image_introspect.os, "sched_getaffinity", lambda _pid: {0, 1, 2, 3})
+        assert image_introspect.cpu_quota() == expected
+
+    def test_start_workers_bounded(self) -> None:
+        """Verify no more workers are started than the runner allows."""
+        runner = image_introspect.CommandRunner(workers=2)
+        runner._completed_queue = Queue()
+        runner._pending_queue = Queue()
+        commands = tuple(
+            image_introspect.Command(id_=str(idx), command="true", parse=lambda x: x)
+            for idx in range(5)
+        )
+        threads = runner.start_workers(commands)
+        assert len(threads) == 2
+        for thread in threads:
+            thread.join(timeout=10)
+        assert runner._completed_queue.qsize() == len(commands)
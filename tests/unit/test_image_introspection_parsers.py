@@ -62,6 +62,15 @@ class TestCmdParserRePartition:
         assert content == "value"
 
 
+class TestCmdParserPartition:
+    """Tests for CmdParser.partition."""
+
+    def test_same_as_re_partition(self) -> None:
+        """Test partitioning the same as with a regular expression."""
+        for content in ("key=value", "no separator", " key=value", "key=value=more", "=value"):
+            assert CmdParser.partition(content, "=") == CmdParser.re_partition(content, "=")
+
+
 class TestCmdParserSplitter:
     """Tests for CmdParser.splitter."""
 
@@ -83,6 +92,13 @@ class TestCmdParserSplitter:
         assert isinstance(result, list)
         assert len(result) == 2
 
+    def test_iterator(self) -> None:
+        """Test splitting lines read one at a time."""
+        parser = CmdParser()
+        lines = ["name: pkg1", "description:", "first line", "---", "name: pkg2"]
+        result = parser.splitter(iter(lines), ":", section_delim="---")
+        assert result == {"name": "pkg1", "description": "first line"}
+
     def test_continuation_line(self) -> None:
         """Test continuation line (no delimiter)."""
         parser = CmdParser()
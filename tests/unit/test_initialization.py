@@ -0,0 +1,56 @@
+"""Unit tests for initialization helpers."""
+
+from __future__ import annotations
+
+import json
+
+from typing import TYPE_CHECKING
+
+from ansible_navigator.initialization import VERSION_CDC
+from ansible_navigator.initialization import VERSION_CDC_ENTRY
+from ansible_navigator.initialization import get_and_check_collection_doc_cache
+from ansible_navigator.utils.key_value_store import KeyValueStore
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_collection_doc_cache_migrated(tmp_path: Path) -> None:
+    """Ensure only entries of another version are removed when the cache version changes.
+
+    Args:
+        tmp_path: A temporary directory
+    """
+    path = tmp_path / "collection_doc_cache.db"
+    cache = KeyValueStore(path)
+    cache["version"] = "0.0"
+    cache["current"] = json.dumps({"plugin": {}, "version": VERSION_CDC_ENTRY})
+    cache["stale"] = json.dumps({"plugin": {}, "version": "0"})
+    cache["unparsable"] = "{"
+    cache.close()
+
+    _messages, exit_messages, migrated = get_and_check_collection_doc_cache(str(path))
+    assert not exit_messages
+    assert migrated is not None
+    migrated.open_()
+    assert sorted(migrated) == ["current", "version"]
+    assert migrated["version"] == VERSION_CDC
+    migrated.close()
+
+
+def test_collection_doc_cache_unreadable(tmp_path: Path) -> None:
+    """Ensure a collection doc cache that is not a database is rebuilt.
+
+    Args:
+        tmp_path: A temporary directory
+    """
+    path = tmp_path / "collection_doc_cache.db"
+    path.write_text("not a database " * 100)
+
+    _messages, exit_messages, rebuilt = get_and_check_collection_doc_cache(str(path))
+    assert not exit_messages
+    assert rebuilt is not None
+    rebuilt.open_()
+    assert dict(rebuilt.items()) == {"version": VERSION_CDC}
+    rebuilt.close()
@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import curses
+
 from typing import NamedTuple
 from unittest.mock import MagicMock  # pylint: disable=W0407
 from unittest.mock import patch  # pylint: disable=W0407
 
-
-if TYPE_CHECKING:
-    import pytest
+import pytest
 
 from ansible_navigator.constants import GRAMMAR_DIR
 from ansible_navigator.constants import THEME_PATH
@@ -17,6 +16,12 @@ from ansible_navigator.content_defs import ContentFormat
 from ansible_navigator.content_defs import ContentView
 from ansible_navigator.content_defs import SerializationFormat
 from ansible_navigator.ui_framework.colorize import Colorize
+from ansible_navigator.ui_framework.colorize import IncrementalRender
+from ansible_navigator.ui_framework.colorize import _ansi_line_to_curses
+from ansible_navigator.ui_framework.colorize import ansi_to_curses
+from ansible_navigator.ui_framework.curses_defs import CursesLine
+from ansible_navigator.ui_framework.curses_defs import CursesLinePart
+from ansible_navigator.ui_framework.curses_defs import CursesLines
 from ansible_navigator.ui_framework.curses_defs import SimpleLinePart
 from ansible_navigator.utils.serialize import serialize
 
@@ -191,3 +196,149 @@ def test_styled_markdown() -> None:
     assert result == [
         [SimpleLinePart(chars="This is a header\n", column=0, color=(86, 156, 214), style="bold")],
     ]
+
+
+LARGE_JSON = Sample(
+    serialization_format=SerializationFormat.JSON,
+    content={f"key_{idx}": f"value\n{idx}" for idx in range(50)},
+)._asdict()
+
+
+def test_incremental(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure an incremental render matches a full render, keeping a bounded number of chunks.
+
+    Args:
+        monkeypatch: The monkeypatch fixture
+    """
+    monkeypatch.setattr("ansible_navigator.ui_framework.colorize.CHECKPOINT_INTERVAL", 7)
+    monkeypatch.setattr("ansible_navigator.ui_framework.colorize.RENDERED_CHUNKS", 2)
+    sample = str(serialize(**LARGE_JSON))
+    colorize = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH)
+    expected = colorize.render(doc=sample, scope="source.json")
+
+    result = colorize.render_incremental(doc=sample, scope="source.json")
+    assert isinstance(result, IncrementalRender)
+    assert len(result) == len(expected)
+    assert result[-3:] == expected[-3:]
+    assert result[10] == expected[10]
+    assert len(result._chunks) == 2
+    assert result[:] == expected
+    assert len(result._chunks) == 2
+
+
+def test_incremental_markdown() -> None:
+    """Ensure markdown is rendered at once."""
+    result = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH).render_incremental(
+        doc=STYLED_MARKDOWN,
+        scope=ContentFormat.MARKDOWN.value.scope,
+    )
+    assert not isinstance(result, IncrementalRender)
+
+
+def test_incremental_graceful_failure(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Ensure a tokenization error part way through renders the content without color.
+
+    Args:
+        monkeypatch: The monkeypatch fixture
+        caplog: Capture log
+    """
+    monkeypatch.setattr("ansible_navigator.ui_framework.colorize.CHECKPOINT_INTERVAL", 7)
+    sample = str(serialize(**LARGE_JSON))
+    result = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH).render_incremental(
+        doc=sample,
+        scope="source.json",
+    )
+    assert any(part.color for part in result[1])
+
+    with patch("ansible_navigator.ui_framework.colorize.tokenize", side_effect=ValueError()):
+        last = result[-1]
+    assert "rendered without color" in caplog.text
+    assert last == [SimpleLinePart(chars=sample.splitlines()[-1], column=0, color=None, style=None)]
+    assert not any(part.color for line in result for part in line)
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    (
+        pytest.param("", ((0, "", 0, 0),), id="empty"),
+        pytest.param("plain", ((0, "plain", 0, 0),), id="plain"),
+        pytest.param(
+            "\x1b[0;32mok: [localhost]\x1b[0m done",
+            ((0, "ok: [localhost]", 2, 0), (15, " done", 0, 0)),
+            id="ansible",
+        ),
+        pytest.param(
+            "\x1b[1;91mfatal\x1b[22m!\x1b[39m",
+            ((0, "fatal", 9, curses.A_BOLD), (5, "!", 9, 0)),
+            id="bright-bold",
+        ),
+        pytest.param(
+            "\x1b[38;5;208;4mwarn\x1b[48;5;12mbg\x1b[38;2;255;0;0mrgb\x1b[m",
+            (
+                (0, "warn", 208, curses.A_UNDERLINE),
+                (4, "bg", 208, curses.A_UNDERLINE),
+                (6, "rgb", 196, curses.A_UNDERLINE),
+            ),
+            id="extended",
+        ),
+        pytest.param("a\x1b[Kb", ((0, "a", 0, 0), (1, "b", 0, 0)), id="other-sequence"),
+    ),
+)
+def test_ansi_to_curses(line: str, expected: tuple[tuple[int, str, int, int], ...]) -> None:
+    """Ensure ansi color codes are converted to curses colors and decorations.
+
+    Args:
+        line: The line with ansi color codes
+        expected: The expected column, string, color and decoration of each part
+    """
+    assert ansi_to_curses(line) == CursesLine(tuple(CursesLinePart(*part) for part in expected))
+
+
+def test_render_ansi_incremental() -> None:
+    """Ensure appended text is converted, carrying the color across lines."""
+    colorize = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH)
+    doc = "\x1b[0;31mfailed\nstill red"
+    rendered = colorize.render_ansi(doc=doc)
+    assert [line[0].color for line in rendered] == [1, 1]
+    assert colorize.render_ansi(doc=doc) is rendered
+
+    doc += " and more\x1b[0m\nplain"
+    appended = colorize.render_ansi(doc=doc)
+    assert appended[0] is rendered[0]
+    assert appended[1] == CursesLine((CursesLinePart(0, "still red and more", 1, 0),))
+    assert appended[2] == CursesLine((CursesLinePart(0, "plain", 0, 0),))
+
+    other = colorize.render_ansi(doc="other")
+    assert other[:] == CursesLines((CursesLine((CursesLinePart(0, "other", 0, 0),)),))
+
+
+def test_render_ansi_lines() -> None:
+    """Ensure only the lines appended to a list are converted and earlier views do not grow."""
+    colorize = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH)
+    stdout = ["\x1b[0;31mfailed", "still red"]
+    rendered = colorize.render_ansi(doc=stdout)
+    assert [line[0].color for line in rendered] == [1, 1]
+    assert colorize.render_ansi(doc=stdout) is rendered
+
+    stdout.extend(["and more\x1b[0m", "plain"])
+    with patch(
+        "ansible_navigator.ui_framework.colorize._ansi_line_to_curses",
+        wraps=_ansi_line_to_curses,
+    ) as converted:
+        appended = colorize.render_ansi(doc=stdout)
+    assert converted.call_count == 2
+    assert len(rendered) == 2
+    assert appended[0] is rendered[0]
+    assert appended[2:] == CursesLines(
+        (
+            CursesLine((CursesLinePart(0, "and more", 1, 0),)),
+            CursesLine((CursesLinePart(0, "plain", 0, 0),)),
+        ),
+    )
+    assert appended[-1] is appended[3]
+
+    other = colorize.render_ansi(doc=["other"])
+    assert other[:] == CursesLines((CursesLine((CursesLinePart(0, "other", 0, 0),)),))
@@ -4,8 +4,41 @@ from __future__ import annotations
 
 import pytest
 
+from ansible_navigator.tm_tokenize.region import Region
+from ansible_navigator.ui_framework.colorize import ColorSchema
 from ansible_navigator.ui_framework.colorize import _rgb_to_ansi_16
 from ansible_navigator.ui_framework.colorize import _rgb_to_ansi_256
+from ansible_navigator.ui_framework.colorize import columns_and_colors
+from ansible_navigator.ui_framework.curses_defs import SimpleLinePart
+
+
+SCHEMA = ColorSchema(
+    {
+        "tokenColors": [
+            {"scope": "string", "settings": {"foreground": "#ff0000"}},
+            {"scope": "constant", "settings": {"foreground": "#ff0000"}},
+            {"scope": "keyword", "settings": {"fontStyle": "bold"}},
+            {"scope": ["string.quoted", "keyword"], "settings": {"foreground": "#00ff00"}},
+            "not a token color",
+        ],
+    },
+)
+
+
+class TestColorSchema:
+    """Tests for ColorSchema.get_color_and_style."""
+
+    def test_prefixes(self) -> None:
+        """Each prefix of a scope name is looked up, the first token color listing it is used."""
+        assert SCHEMA.get_color_and_style(("string.quoted.double.json",)) == ((255, 0, 0), None)
+        assert SCHEMA.get_color_and_style(("keyword.control",)) == (None, "bold")
+        assert SCHEMA.get_color_and_style(("meta.structure",)) == (None, None)
+
+    def test_last_name_matched(self) -> None:
+        """The last name in a scope with a token color determines the color and style."""
+        scope = ("source.yaml", "string.quoted.yaml", "keyword.other.yaml", "meta.tag")
+        assert SCHEMA.get_color_and_style(scope) == (None, "bold")
+        assert SCHEMA.get_color_and_style(scope) is SCHEMA.get_color_and_style(scope)
 
 
 class TestRgbToAnsi256:
@@ -76,3 +109,49 @@ class TestRgbToAnsi16:
         """Return type is always int."""
         result = _rgb_to_ansi_16(100, 150, 200)
         assert isinstance(result, int)
+
+
+class TestColumnsAndColors:
+    """Tests for columns_and_colors."""
+
+    def test_merged_runs(self) -> None:
+        """Adjacent regions of like color are merged and gaps are uncolored."""
+        line = '"ab" 12 x\n'
+        regions = (
+            Region(0, 4, ("string",)),
+            Region(5, 7, ("constant",)),
+            Region(7, 8, ("constant",)),
+            Region(8, 9, ("keyword",)),
+        )
+        assert columns_and_colors([(regions, line)], SCHEMA) == [
+            [
+                SimpleLinePart(chars='"ab"', column=0, color=(255, 0, 0), style=None),
+                SimpleLinePart(chars=" ", column=4, color=None, style=None),
+                SimpleLinePart(chars="12 ", column=5, color=(255, 0, 0), style=None),
+                SimpleLinePart(chars="x", column=8, color=None, style="bold"),
+                SimpleLinePart(chars="\n", column=9, color=None, style=None),
+            ],
+        ]
+
+    def test_overlapping_regions(self) -> None:
+        """Overlapping regions are painted in order, keeping color and style separately."""
+        line = "abcd\n"
+        regions = (
+            Region(0, 4, ("string",)),
+            Region(1, 3, ("keyword",)),
+            Region(2, 3, ("other",)),
+        )
+        assert columns_and_colors([(regions, line)], SCHEMA) == [
+            [
+                SimpleLinePart(chars="a", column=0, color=(255, 0, 0), style=None),
+                SimpleLinePart(chars="bc", column=1, color=(255, 0, 0), style="bold"),
+                SimpleLinePart(chars="d", column=3, color=(255, 0, 0), style=None),
+                SimpleLinePart(chars="\n", column=4, color=None, style=None),
+            ],
+        ]
+
+    def test_no_regions(self) -> None:
+        """A line without regions is a single uncolored part."""
+        assert columns_and_colors([((), "text\n")], SCHEMA) == [
+            [SimpleLinePart(chars="text\n", column=0, color=None, style=None)],
+        ]
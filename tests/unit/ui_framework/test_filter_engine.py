@@ -0,0 +1,95 @@
+"""Tests for the menu filter engine."""
+
+from __future__ import annotations
+
+import re
+
+from typing import Any
+
+import pytest
+
+from ansible_navigator.ui_framework.filter_engine import FilterEngine
+from ansible_navigator.ui_framework.filter_engine import is_literal
+
+
+COLUMNS = ["__task", "__result"]
+
+
+def tasks() -> list[dict[str, Any]]:
+    """Build the task menu items.
+
+    Returns:
+        The menu items
+    """
+    return [
+        {"__task": "Gather facts", "__result": "Ok"},
+        {"__task": "Install packages", "__result": "Failed"},
+        {"__task": "Start the service", "__result": "Ok"},
+        {"__task": "Fail when missing", "__result": None},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    (("fail", True), ("Fail when", True), ("fa.l", False), ("^ok", False), ("a|b", False)),
+)
+def test_is_literal(pattern: str, expected: bool) -> None:
+    """Ensure filters without special characters are literal.
+
+    Args:
+        pattern: The filter
+        expected: Whether the filter is literal
+    """
+    assert is_literal(pattern) is expected
+
+
+def test_indices() -> None:
+    """Ensure the matching indices are found, converting values to strings."""
+    engine = FilterEngine()
+    items = tasks()
+    assert engine.indices(re.compile("Fail"), items, COLUMNS) == (1, 3)
+    assert engine.indices(re.compile("^(Ok|None)$"), items, COLUMNS) == (0, 2, 3)
+    assert engine.indices(re.compile("service"), items, ["__result"]) == ()
+
+
+def test_reuse_and_changes() -> None:
+    """Ensure a result is reused, only searching appended or changed items."""
+    engine = FilterEngine()
+    items = tasks()
+    regex = re.compile("Ok")
+    assert engine.indices(regex, items, COLUMNS) == (0, 2)
+    assert engine.searched == 4
+
+    assert engine.indices(regex, items, COLUMNS) == (0, 2)
+    assert engine.searched == 4
+
+    items[3]["__result"] = "Ok"
+    items.append({"__task": "Report", "__result": "Ok"})
+    assert engine.indices(regex, items, COLUMNS) == (0, 2, 3, 4)
+    assert engine.searched == 6
+
+
+def test_refine() -> None:
+    """Ensure an extended literal filter only searches the items the shorter one matched."""
+    engine = FilterEngine()
+    items = tasks()
+    assert engine.indices(re.compile("a"), items, COLUMNS) == (0, 1, 2, 3)
+    assert engine.indices(re.compile("Fa"), items, COLUMNS) == (1, 3)
+    searched = engine.searched
+    assert engine.indices(re.compile("Fai"), items, COLUMNS) == (1, 3)
+    assert engine.searched == searched + 2
+
+    # A regular expression is searched in full
+    assert engine.indices(re.compile("Fai|Ok"), items, COLUMNS) == (0, 1, 2, 3)
+    assert engine.searched == searched + 6
+
+
+def test_bounded() -> None:
+    """Ensure only the most recently used results are kept."""
+    engine = FilterEngine(size=2)
+    items = tasks()
+    for pattern in ("Gather", "Install", "Start"):
+        engine.indices(re.compile(pattern), items, COLUMNS)
+    assert len(engine._results) == 2
+    engine.clear()
+    assert not engine._results
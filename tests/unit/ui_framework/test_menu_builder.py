@@ -0,0 +1,102 @@
+"""Tests for the menu model and builder."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+from ansible_navigator.ui_framework.menu_builder import MenuBuilder
+from ansible_navigator.ui_framework.menu_builder import MenuModel
+
+
+COLUMNS = ["__task", "__progress"]
+
+
+def tasks() -> list[dict[str, Any]]:
+    """Build the task menu items.
+
+    Returns:
+        The menu items
+    """
+    return [
+        {"__task": "Gather facts", "__progress": "100%"},
+        {"__task": "Install", "__progress": "50%"},
+    ]
+
+
+def test_update_incremental() -> None:
+    """Ensure only appended or changed menu items are stringified."""
+    model = MenuModel()
+    items = tasks()
+    model.update(items, COLUMNS, 10, (0, 1))
+    assert model.stringified == 2
+    assert model.row(1) == (("Install", "▇▇▇▇▇     "), ("Install", "▇▇▇▇▇     "))
+    assert items[1]["___progress"] == "50%"
+
+    model.update(items, COLUMNS, 10, (0, 1))
+    assert model.stringified == 2
+
+    items.append({"__task": "Start", "__progress": "0%"})
+    items[1]["__progress"] = "100%"
+    model.update(items, COLUMNS, 10, (0, 1, 2))
+    assert model.stringified == 4
+    assert model.row(1)[1] == ("Install", " Complete ")
+
+
+def test_update_columns() -> None:
+    """Ensure the menu items are stringified again when the columns change."""
+    model = MenuModel()
+    items = tasks()
+    model.update(items, COLUMNS, 10, (0, 1))
+    model.update(items, COLUMNS[:1], 10, (0, 1))
+    assert model.stringified == 4
+    assert model.row(0) == (("Gather facts",), ("Gather facts",))
+
+
+def test_layout() -> None:
+    """Ensure the columns are laid out again only when their width or the screen changes."""
+    model = MenuModel()
+    items = tasks()
+    model.update(items, COLUMNS, 10, (0, 1))
+    assert model.layout(24) == ([0, 13, 24], [13, 11])
+    model.layout(24)
+    assert model.layouts == 1
+
+    items[0]["__task"] = "Gather"
+    model.update(items, COLUMNS, 10, (0, 1))
+    assert model.layout(24) == ([0, 10, 24], [10, 14])
+    model.layout(20)
+    assert model.layouts == 3
+
+
+def test_update_showing() -> None:
+    """Ensure only the showing menu items are stringified and set the column widths."""
+    model = MenuModel()
+    items = [{"__task": "Task " * (idx % 3 + 1), "__progress": "100%"} for idx in range(1000)]
+    model.update(items, COLUMNS, 10, (0, 3))
+    assert model.stringified == 2
+    assert model.layout(40) == ([0, 14, 40], [14, 26])
+
+    model.update(items, COLUMNS, 10, (2, 3))
+    assert model.stringified == 3
+    assert model.layout(40) == ([0, 24, 40], [24, 16])
+
+
+def test_build_shares_model() -> None:
+    """Ensure menus built with a shared model reuse its cells."""
+    model = MenuModel()
+    items = tasks()
+    with patch("curses.A_UNDERLINE", 0, create=True):
+        for _ in range(3):
+            builder = MenuBuilder(
+                progress_bar_width=10,
+                screen_width=80,
+                number_colors=8,
+                color_menu_item=lambda *_args: (0, 0),
+                ui_config=None,  # type: ignore[arg-type]
+                model=model,
+            )
+            heading, lines = builder.build(items, COLUMNS, (0, 1))
+    assert model.stringified == 2
+    assert [part.string for part in heading[0]] == ["Task", "Progress"]
+    assert [part.string for part in lines[1]] == ["Install", "▇▇▇▇▇     "]
@@ -0,0 +1,78 @@
+"""Tests for the cache of content rendered for the TUI."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ansible_navigator.content_defs import ContentFormat
+from ansible_navigator.content_defs import ContentView
+from ansible_navigator.ui_framework.curses_defs import CursesLines
+from ansible_navigator.ui_framework.render_cache import RenderCache
+from ansible_navigator.ui_framework.render_cache import RenderKey
+
+
+LINES = CursesLines(())
+
+
+def key(obj: Any, content_format: ContentFormat = ContentFormat.YAML) -> RenderKey:
+    """Build a render key for an object.
+
+    Args:
+        obj: The object
+        content_format: The content format
+
+    Returns:
+        The render key
+    """
+    return RenderKey(
+        obj_id=id(obj),
+        content_format=content_format,
+        content_view=ContentView.NORMAL,
+        width=80,
+        content_heading=print,
+        filter_content_keys=None,
+    )
+
+
+def test_hit_and_format() -> None:
+    """Ensure a rendered object is found again only for the same format."""
+    cache = RenderCache()
+    obj = {"task": "debug", "res": {"msg": "hello"}}
+    cache.put(key(obj), obj, None, LINES)
+
+    cached = cache.get(key(obj), obj)
+    assert cached is not None
+    assert cached.lines is LINES
+    assert cache.get(key(obj, ContentFormat.JSON), obj) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_changed_in_place() -> None:
+    """Ensure an object changed in place since it was rendered is not found."""
+    cache = RenderCache()
+    obj: dict[str, Any] = {"__result": "In progress"}
+    cache.put(key(obj), obj, None, LINES)
+    obj.update({"__result": "Ok", "res": {"changed": False}})
+    assert cache.get(key(obj), obj) is None
+    assert len(cache) == 0
+
+    items = ["one"]
+    cache.put(key(items), items, None, LINES)
+    items[0] = "two"
+    assert cache.get(key(items), items) is None
+
+
+def test_least_recently_used() -> None:
+    """Ensure the least recently used object is removed beyond the size."""
+    cache = RenderCache(size=2)
+    objs = [{"idx": idx} for idx in range(3)]
+    cache.put(key(objs[0]), objs[0], None, LINES)
+    cache.put(key(objs[1]), objs[1], None, LINES)
+    assert cache.get(key(objs[0]), objs[0]) is not None
+    cache.put(key(objs[2]), objs[2], None, LINES)
+
+    assert len(cache) == 2
+    assert cache.get(key(objs[1]), objs[1]) is None
+    assert cache.get(key(objs[0]), objs[0]) is not None
+    cache.clear()
+    assert len(cache) == 0
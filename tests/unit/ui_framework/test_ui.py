@@ -3,6 +3,10 @@
 # pylint: disable=redefined-outer-name
 from __future__ import annotations
 
+import logging
+import time
+
+from typing import Any
 from unittest.mock import MagicMock  # pylint: disable=W0407
 from unittest.mock import patch  # pylint: disable=W0407
 
@@ -11,6 +15,11 @@ import pytest
 from ansible_navigator.constants import GRAMMAR_DIR
 from ansible_navigator.constants import TERMINAL_COLORS_PATH
 from ansible_navigator.constants import THEME_PATH
+from ansible_navigator.content_defs import ContentFormat
+from ansible_navigator.ui_framework.curses_defs import CursesLine
+from ansible_navigator.ui_framework.curses_defs import CursesLinePart
+from ansible_navigator.ui_framework.curses_window import Frame
+from ansible_navigator.ui_framework.curses_window import FrameStats
 from ansible_navigator.ui_framework.ui import UserInterface
 from ansible_navigator.ui_framework.ui_config import UIConfig
 
@@ -26,6 +35,7 @@ def ui_config() -> UIConfig:
         color=False,
         colors_initialized=True,
         grammar_dir=GRAMMAR_DIR,
+        max_frame_rate=20,
         osc4=False,
         terminal_colors_path=TERMINAL_COLORS_PATH,
         theme_path=THEME_PATH,
@@ -280,3 +290,249 @@ class TestEnterKeySelection:
             entry = str(ui._menu_indices[ui._menu_cursor_pos])
 
         assert entry == "7"
+
+
+class TestShowObjFromList:
+    """Tests for showing content from a list of objects."""
+
+    def test_scroll_and_navigate(self, ui: UserInterface) -> None:
+        """Scrolling keeps the position, showing the next object renders it from the top.
+
+        Args:
+            ui: A UserInterface fixture.
+        """
+        objs = [{f"key_{idx:03}": idx for idx in range(100)}, {"other": 1}]
+        ui._content_heading = lambda obj, width: None
+        ui._filter_content_keys = lambda obj: obj
+        ui._menu_indices = (0, 1)
+        shown = []
+
+        def display(**kwargs: Any) -> str:
+            shown.append(kwargs)
+            if len(shown) == 1:
+                ui.scroll(40)
+                return "KEY_DOWN"
+            if len(shown) == 2:
+                return "+"
+            raise KeyboardInterrupt
+
+        with (
+            patch.object(ui, "_display", side_effect=display),
+            patch("curses.COLORS", 8, create=True),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            ui._show_obj_from_list(objs=objs, index=0, await_input=True)
+
+        assert shown[0]["count"] == 101
+        assert shown[0]["line_numbers"][0] == 0
+        assert shown[1]["line_numbers"][-1] == 39
+        assert shown[1]["lines"][-1][0].string == "key_038: 38"
+        assert shown[2]["count"] == 2
+        assert shown[2]["lines"][-1][0].string == "other: 1"
+
+    def test_rendered_content_cached(self, ui: UserInterface) -> None:
+        """Showing an object again reuses the rendered lines until it is changed.
+
+        Args:
+            ui: A UserInterface fixture.
+        """
+        task: dict[str, Any] = {"__result": "In progress"}
+        ui._content_heading = lambda obj, width: None
+        ui._filter_content_keys = lambda obj: obj
+
+        _heading, lines = ui._filter_and_serialize(task)
+        assert ui._filter_and_serialize(task)[1] is lines
+        ui.content_format(ContentFormat.JSON)
+        assert ui._filter_and_serialize(task)[1] is not lines
+        ui.content_format(ContentFormat.YAML)
+        assert ui._filter_and_serialize(task)[1] is lines
+
+        task.update({"__result": "Ok"})
+        updated = ui._filter_and_serialize(task)[1]
+        assert updated is not lines
+        with patch("curses.COLORS", 8, create=True):
+            assert updated[-1][0].string == "__result: Ok"
+
+    def test_rendered_content_filtered(self, ui: UserInterface) -> None:
+        """Showing an object with another key filter does not reuse the rendered lines.
+
+        Args:
+            ui: A UserInterface fixture.
+        """
+        task: dict[str, Any] = {"task": "debug", "__result": "Ok"}
+        ui._content_heading = lambda obj, width: None
+        ui._filter_content_keys = lambda obj: {"task": obj["task"]}
+        first = ui._filter_and_serialize(task)[1]
+
+        ui._filter_content_keys = lambda obj: {"result": obj["__result"]}
+        second = ui._filter_and_serialize(task)[1]
+        assert second is not first
+        with patch("curses.COLORS", 8, create=True):
+            assert first[-1][0].string == "task: debug"
+            assert second[-1][0].string == "result: Ok"
+
+
+class TestShowMenu:
+    """Tests for showing a menu."""
+
+    def test_filter_once(self, ui: UserInterface) -> None:
+        """The menu filter is applied once, not for every key pressed.
+
+        Args:
+            ui: A UserInterface fixture.
+        """
+        current = [{"name": f"item {idx}"} for idx in range(10)]
+        ui.menu_filter("item 1")
+        keys = ["KEY_DOWN", "KEY_DOWN", "KEY_UP"]
+
+        def display(**_kwargs: Any) -> str:
+            if keys:
+                return keys.pop(0)
+            raise KeyboardInterrupt
+
+        with (
+            patch.object(ui, "_display", side_effect=display),
+            patch.object(ui, "_get_heading_menu_items", return_value=((), ())),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            ui._show_menu(current=current, columns=["name"], await_input=True)
+
+        assert ui._menu_indices == (1,)
+        assert ui._filter_engine.searched == 10
+
+
+def frame_of(*rows: str) -> Frame:
+    """Build a frame with one line of text per row.
+
+    Args:
+        rows: The text of each row
+
+    Returns:
+        The frame
+    """
+    frame = Frame()
+    for lineno, text in enumerate(rows):
+        frame.add(lineno=lineno, line=CursesLine((CursesLinePart(0, text, 0, 0),)))
+    return frame
+
+
+class TestDrawFrame:
+    """Tests for drawing only the rows changed since the last frame."""
+
+    def test_changed_rows(self, ui: UserInterface) -> None:
+        """Ensure unchanged rows are not written and removed rows are cleared.
+
+        Args:
+            ui: A UserInterface fixture.
+        """
+        screen: Any = ui._screen
+        ui._draw_frame(screen, frame_of("heading", "one"))
+        assert ui.frame_stats == FrameStats(rows=2, text_bytes=10)
+        assert screen.erase.call_count == 1
+
+        screen.addstr.reset_mock()
+        ui._draw_frame(screen, frame_of("heading", "twö"))
+        assert ui.frame_stats == FrameStats(rows=1, text_bytes=4)
+        screen.addstr.assert_called_once_with(1, 0, "twö")
+
+        ui._draw_frame(screen, frame_of("heading"))
+        assert ui.frame_stats == FrameStats(rows=1, text_bytes=0)
+        screen.move.assert_called_with(1, 0)
+
+        ui._draw_frame(screen, frame_of("heading"))
+        assert ui.frame_stats == FrameStats(rows=0, text_bytes=0)
+
+    def test_frame_logged(self, ui: UserInterface, caplog: pytest.LogCaptureFixture) -> None:
+        """Ensure a frame is logged only when rows were written.
+
+        Args:
+            ui: A UserInterface fixture.
+            caplog: The log capture fixture
+        """
+        caplog.set_level(logging.DEBUG)
+        screen: Any = ui._screen
+        ui._draw_frame(screen, frame_of("heading", "one"))
+        assert "Frame drawn: FrameStats(rows=2, text_bytes=10)" in caplog.text
+
+        caplog.clear()
+        ui._draw_frame(screen, frame_of("heading", "one"))
+        assert "Frame drawn" not in caplog.text
+
+    def test_redrawn_in_full(self, ui: UserInterface) -> None:
+        """Ensure the frame is drawn in full after a resize or once forgotten.
+
+        Args:
+            ui: A UserInterface fixture.
+        """
+        screen: Any = ui._screen
+        ui._draw_frame(screen, frame_of("heading", "one"))
+        screen.getmaxyx.return_value = (30, 100)
+        ui._draw_frame(screen, frame_of("heading", "one"))
+        assert ui.frame_stats.rows == 2
+        ui._forget_frame()
+        ui._draw_frame(screen, frame_of("heading", "one"))
+        assert ui.frame_stats.rows == 2
+        assert screen.erase.call_count == 3
+
+
+class TestGetKey:
+    """Tests for waking the screen only when there is new content."""
+
+    def test_wait_until_woken(self, ui: UserInterface) -> None:
+        """Ensure timeouts without new content keep waiting for a key.
+
+        Args:
+            ui: A UserInterface fixture.
+        """
+        screen: Any = ui._screen
+        screen.getch.side_effect = [-1, -1, -1]
+        wake = MagicMock(side_effect=[False, False, True])
+        ui.wake_on(wake)
+        assert ui._get_key() == -1
+        assert screen.getch.call_count == 2
+
+    def test_key_pressed(self, ui: UserInterface) -> None:
+        """Ensure a key is returned while waiting for new content.
+
+        Args:
+            ui: A UserInterface fixture.
+        """
+        screen: Any = ui._screen
+        screen.getch.side_effect = [-1, 10]
+        ui.wake_on(lambda: False)
+        assert ui._get_key() == 10
+
+    def test_frame_rate(self, ui: UserInterface) -> None:
+        """Ensure new content does not refresh the screen faster than the frame rate.
+
+        Args:
+            ui: A UserInterface fixture.
+        """
+        screen: Any = ui._screen
+        screen.getch.return_value = -1
+        ui.wake_on(lambda: True)
+        ui._last_frame = time.monotonic()
+        assert ui._get_key() == -1
+        assert screen.getch.call_count == 1
+        assert screen.timeout.call_args_list[-1].args == (ui._refresh[-1],)
+        assert 0 < screen.timeout.call_args_list[-2].args[0] <= 1000 / ui._ui_config.max_frame_rate
+
+
+class TestFooter:
+    """Tests for the footer keys and status."""
+
+    def test_status_detail_not_overlapped(self, ui: UserInterface) -> None:
+        """Ensure the keys end before the status detail begins.
+
+        Args:
+            ui: A UserInterface fixture.
+        """
+        ui.update_status("running", 0, "Queue: 1500 Lag: 12.5s")
+        keys = {"^b/PgUp": "page up", "^f/PgDn": "page down", "↑↓": "scroll", "esc": "back"}
+        footer = ui._footer(keys)
+        detail = next(part for part in footer if part.string == "Queue: 1500 Lag: 12.5s")
+        status = footer[-2]
+        assert detail.column + len(detail.string) + 1 == status.column
+        assert all(
+            part.column + len(part.string) <= detail.column for part in footer[: len(keys) * 2]
+        )
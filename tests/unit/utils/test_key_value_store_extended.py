@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import sqlite3
+
 from typing import TYPE_CHECKING
 
 import pytest
@@ -172,3 +174,131 @@ def test_init_with_path_object(tmp_path: Path) -> None:
     kvs = KeyValueStore(tmp_path / "pathobj.db")
     kvs["test"] = "value"
     assert kvs["test"] == "value"
+
+
+def test_wal_journal_mode(kvs: KeyValueStore) -> None:
+    """Test the store uses write-ahead logging."""
+    assert kvs.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_update_many(kvs: KeyValueStore) -> None:
+    """Test many keys are set at once, from a mapping or pairs."""
+    kvs.update_many({"a": "1", "b": "2"})
+    kvs.update_many([("b", "3"), ("c", "4")])
+    assert dict(kvs.items()) == {"a": "1", "b": "3", "c": "4"}
+    assert not kvs.conn.in_transaction
+
+
+def test_get_many(kvs: KeyValueStore) -> None:
+    """Test many keys are read at once, missing keys are left out."""
+    kvs.update_many({f"key{idx}": f"value{idx}" for idx in range(1200)})
+    keys = [f"key{idx}" for idx in range(0, 1200, 2)] + ["missing"]
+    found = kvs.get_many(keys)
+    assert len(found) == 600
+    assert found["key1198"] == "value1198"
+    assert "missing" not in found
+
+
+def test_transaction_rollback(kvs: KeyValueStore) -> None:
+    """Test changes made in a failed transaction are rolled back."""
+    kvs["kept"] = "value"
+    with kvs.transaction():
+        kvs["committed"] = "value"
+
+    def fail() -> None:
+        with kvs.transaction():
+            kvs["discarded"] = "value"
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        fail()
+    assert sorted(kvs) == ["committed", "kept"]
+
+
+def test_compressed_values(tmp_path: Path) -> None:
+    """Test long values are compressed and read back transparently."""
+    db_path = tmp_path / "compressed.db"
+    kvs = KeyValueStore(db_path, compress=True)
+    long_value = '{"doc": "' + "text " * 200 + '"}'
+    kvs["long"] = long_value
+    kvs.update_many({"short": "value"})
+    assert kvs["long"] == long_value
+    assert kvs.get_many(["long", "short"]) == {"long": long_value, "short": "value"}
+    assert dict(kvs.items()) == {"long": long_value, "short": "value"}
+
+    usage = kvs.usage()
+    assert usage["entries"] == 2
+    assert usage["compressed_entries"] == 1
+    assert usage["stored_bytes"] < len(long_value)
+    kvs.close()
+
+    uncompressed = KeyValueStore(db_path)
+    assert uncompressed["long"] == long_value
+    uncompressed.close()
+
+
+def test_evict(tmp_path: Path) -> None:
+    """Test the least recently accessed entries are evicted first."""
+    kvs = KeyValueStore(tmp_path / "evict.db", track_access=True)
+    kvs.update_many({"version": "1", "old": "a" * 100, "used": "b" * 100, "new": "c" * 100})
+    kvs.conn.execute("UPDATE kv SET accessed = 1000")
+    kvs.conn.execute("UPDATE kv SET accessed = 2000 WHERE key = 'new'")
+    kvs.get_many(["used"])
+
+    assert kvs.evict(max_bytes=250, keep=("version",)) == 1
+    assert sorted(kvs) == ["new", "used", "version"]
+    assert kvs.evict(max_age=60, keep=("version",)) == 1
+    assert sorted(kvs) == ["used", "version"]
+    kvs.close()
+
+
+def test_usage_running_total(tmp_path: Path) -> None:
+    """Test the running usage matches the stored values after every kind of change."""
+    kvs = KeyValueStore(tmp_path / "usage.db", compress=True)
+    long_value = "text " * 200
+    kvs.update_many({"one": "a" * 10, "two": long_value, "three": "c"})
+    kvs["one"] = long_value
+    kvs.update_many({"three": "c" * 20})
+    del kvs["two"]
+    kvs.conn.execute("UPDATE kv SET value = 'changed' WHERE key = 'one'")
+
+    entries, compressed, stored = kvs.conn.execute(
+        "SELECT COUNT(*), COUNT(CASE WHEN typeof(value) = 'blob' THEN 1 END),"
+        " SUM(length(CAST(value AS BLOB))) FROM kv",
+    ).fetchone()
+    usage = kvs.usage()
+    assert (usage["entries"], usage["compressed_entries"], usage["stored_bytes"]) == (
+        entries,
+        compressed,
+        stored,
+    )
+    assert usage == {**usage, "entries": 2, "compressed_entries": 0, "stored_bytes": 27}
+    kvs.close()
+
+
+def test_evict_within_bounds(tmp_path: Path) -> None:
+    """Test nothing is scanned or vacuumed when the store is within its bounds."""
+    kvs = KeyValueStore(tmp_path / "bounded.db", track_access=True)
+    kvs.update_many({"one": "a" * 100, "two": "b" * 100})
+    statements: list[str] = []
+    kvs.conn.set_trace_callback(statements.append)
+    assert kvs.evict(max_bytes=200, max_age=60) == 0
+    assert not [statement for statement in statements if "ORDER BY" in statement]
+    assert not [statement for statement in statements if "VACUUM" in statement]
+    kvs.close()
+
+
+def test_accessed_column_added(tmp_path: Path) -> None:
+    """Test a store created without access times is upgraded."""
+    db_path = tmp_path / "upgrade.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE kv (key text unique, value text)")
+    conn.execute("INSERT INTO kv (key, value) VALUES ('key', 'value')")
+    conn.commit()
+    conn.close()
+
+    kvs = KeyValueStore(db_path)
+    assert kvs["key"] == "value"
+    assert kvs.usage()["stored_bytes"] == len("value")
+    assert kvs.evict(max_age=60) == 0
+    kvs.close()
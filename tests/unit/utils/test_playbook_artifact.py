@@ -0,0 +1,370 @@
+"""Tests for the streaming playbook artifact."""
+
+from __future__ import annotations
+
+import json
+
+from typing import TYPE_CHECKING
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from ansible_navigator.content_defs import ContentView
+from ansible_navigator.content_defs import SerializationFormat
+from ansible_navigator.utils.playbook_artifact import INCOMPLETE_STATUS
+from ansible_navigator.utils.playbook_artifact import TASK_CACHE_SIZE
+from ansible_navigator.utils.playbook_artifact import ArtifactWriter
+from ansible_navigator.utils.playbook_artifact import IndexedArtifact
+from ansible_navigator.utils.playbook_artifact import TaskRow
+from ansible_navigator.utils.playbook_artifact import TaskStore
+from ansible_navigator.utils.playbook_artifact import TaskSummaries
+from ansible_navigator.utils.playbook_artifact import full_tasks
+from ansible_navigator.utils.playbook_artifact import is_streaming_artifact
+from ansible_navigator.utils.playbook_artifact import load_streaming_artifact
+from ansible_navigator.utils.playbook_artifact import write_json_artifact
+from ansible_navigator.utils.serialize import serialize_write_file
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+PLAY = {"__play_name": "play", "name": "play", "uuid": "p1"}
+TRAILER = {"status": "successful", "status_color": 10, "settings_entries": {}}
+
+
+def task(number: int, host: str) -> dict[str, Any]:
+    """Build a task result.
+
+    Args:
+        number: The task number
+        host: The host
+
+    Returns:
+        The task result
+    """
+    return {"__host": host, "__number": number, "play_uuid": "p1", "task_uuid": f"t{number}"}
+
+
+def test_is_streaming_artifact() -> None:
+    """Ensure streaming artifacts are identified by their file extension."""
+    assert is_streaming_artifact("/tmp/site-artifact.jsonl")
+    assert not is_streaming_artifact("/tmp/site-artifact.json")
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    """Ensure records are loaded back into the JSON artifact structure.
+
+    Tasks are written as they finish and loaded back in the order they started.
+
+    Args:
+        tmp_path: A temporary directory
+    """
+    path = tmp_path / "artifact.jsonl"
+    writer = ArtifactWriter(path)
+    writer.stdout(["PLAY [play]"])
+    writer.play({**PLAY, "tasks": [task(0, "host1")]})
+    writer.task(task(1, "host2"))
+    writer.task(task(0, "host1"))
+    writer.stdout(["ok: [host2]", "ok: [host1]"])
+    writer.close(trailer=TRAILER)
+
+    artifact = load_streaming_artifact(path)
+    assert artifact["version"] == "2.0.0"
+    assert artifact["stdout"] == ["PLAY [play]", "ok: [host2]", "ok: [host1]"]
+    assert artifact["status"] == "successful"
+    assert artifact["status_color"] == 10
+    assert artifact["plays"] == [{**PLAY, "tasks": [task(0, "host1"), task(1, "host2")]}]
+
+    stdout_only = load_streaming_artifact(path, include_plays=False)
+    assert stdout_only["plays"] == []
+    assert stdout_only["stdout"] == artifact["stdout"]
+
+
+def test_interrupted(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Ensure an artifact from an interrupted run can be loaded.
+
+    Args:
+        tmp_path: A temporary directory
+        caplog: The log capture fixture
+    """
+    path = tmp_path / "artifact.jsonl"
+    writer = ArtifactWriter(path)
+    writer.play(PLAY)
+    writer.task(task(0, "host1"))
+    writer.flush()
+    with path.open(mode="a", encoding="utf-8") as fh:
+        fh.write('{"type": "task", "data": {"__ho')
+
+    artifact = load_streaming_artifact(path)
+    assert (artifact["status"], artifact["status_color"]) == INCOMPLETE_STATUS
+    assert artifact["plays"][0]["tasks"] == [task(0, "host1")]
+    assert "truncated record" in caplog.text
+    assert "has no trailer" in caplog.text
+
+
+def write_artifact(path: Path) -> None:
+    """Write an artifact with two plays, in the format matching the file extension.
+
+    Args:
+        path: The path to the artifact file
+    """
+    plays: list[dict[str, Any]] = [
+        {
+            **PLAY,
+            "tasks": [
+                {**task(0, "host1"), "task": "debug", "res": {"msg": [{"nested": True}]}},
+                {**task(1, "host2"), "task": "debug", "res": {}},
+            ],
+        },
+        {"__play_name": "empty", "name": "empty", "uuid": "p2", "tasks": []},
+    ]
+    stdout = ["PLAY [play]", "ok: [host1]"]
+    if path.suffix == ".jsonl":
+        writer = ArtifactWriter(path)
+        writer.write_all(plays, stdout)
+        writer.close(trailer=TRAILER)
+        return
+    serialize_write_file(
+        content={"version": "2.0.0", "plays": plays, "stdout": stdout, **TRAILER},
+        content_view=ContentView.NORMAL,
+        file_mode="w",
+        file=path,
+        serialization_format=SerializationFormat.JSON,
+    )
+
+
+@pytest.mark.parametrize("file_name", ("artifact.json", "artifact.jsonl"), ids=("json", "jsonl"))
+def test_indexed(tmp_path: Path, file_name: str) -> None:
+    """Ensure an indexed artifact provides task summaries and reads tasks on demand.
+
+    Args:
+        tmp_path: A temporary directory
+        file_name: The artifact file name
+    """
+    path = tmp_path / file_name
+    write_artifact(path)
+
+    artifact = IndexedArtifact(path)
+    assert artifact.index_path.exists()
+    assert artifact.version == "2.0.0"
+    assert artifact.status == ("successful", 10)
+    assert artifact.stdout() == ["PLAY [play]", "ok: [host1]"]
+
+    plays = artifact.plays()
+    assert [play["name"] for play in plays] == ["play", "empty"]
+    assert plays[1]["tasks"] == []
+    summaries = plays[0]["tasks"]
+    assert isinstance(summaries, TaskSummaries)
+    assert summaries == [
+        {**task(0, "host1"), "task": "debug"},
+        {**task(1, "host2"), "task": "debug"},
+    ]
+
+    results = summaries.results()
+    assert len(results) == 2
+    assert results[0]["res"] == {"msg": [{"nested": True}]}
+    assert results[-1]["__host"] == "host2"
+    assert results[0] is results[0]
+    artifact.close()
+
+    # The stored index is used the next time
+    index = json.loads(artifact.index_path.read_text(encoding="utf-8"))
+    index["stdout"] = []
+    artifact.index_path.write_text(json.dumps(index), encoding="utf-8")
+    reopened = IndexedArtifact(path)
+    assert reopened.stdout() == []
+    reopened.close()
+
+
+def test_indexed_stale(tmp_path: Path) -> None:
+    """Ensure the index is rebuilt when the artifact changes.
+
+    Args:
+        tmp_path: A temporary directory
+    """
+    path = tmp_path / "artifact.jsonl"
+    writer = ArtifactWriter(path)
+    writer.play(PLAY)
+    writer.flush()
+    artifact = IndexedArtifact(path)
+    assert artifact.status == INCOMPLETE_STATUS
+    assert artifact.plays()[0]["tasks"] == []
+    artifact.close()
+
+    writer.task(task(0, "host1"))
+    writer.close(trailer=TRAILER)
+    artifact = IndexedArtifact(path)
+    assert artifact.status == ("successful", 10)
+    assert artifact.plays()[0]["tasks"].results()[0] == task(0, "host1")
+    artifact.close()
+
+
+def test_indexed_unexpected_layout(tmp_path: Path) -> None:
+    """Ensure a JSON artifact without the indented layout is not indexed.
+
+    Args:
+        tmp_path: A temporary directory
+    """
+    path = tmp_path / "artifact.json"
+    path.write_text(json.dumps({"version": "2.0.0", "plays": [], "stdout": []}))
+    with pytest.raises(ValueError, match="expected layout"):
+        IndexedArtifact(path)
+
+
+def test_compressed(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Ensure a compressed streaming artifact is read, even when interrupted.
+
+    Args:
+        tmp_path: A temporary directory
+        caplog: The log capture fixture
+    """
+    path = tmp_path / "artifact.jsonl.gz"
+    assert is_streaming_artifact(path)
+    writer = ArtifactWriter(path)
+    writer.play(PLAY)
+    writer.task(task(0, "host1"))
+    writer.flush()
+    assert path.read_bytes().startswith(b"\x1f\x8b")
+
+    artifact = load_streaming_artifact(path)
+    assert (artifact["status"], artifact["status_color"]) == INCOMPLETE_STATUS
+    assert artifact["plays"][0]["tasks"] == [task(0, "host1")]
+    assert "is truncated" in caplog.text
+
+    writer.close(trailer=TRAILER)
+    renamed = path.rename(tmp_path / "artifact.jsonl")
+    assert load_streaming_artifact(renamed)["status"] == "successful"
+    with pytest.raises(ValueError, match="is compressed"):
+        IndexedArtifact(renamed)
+
+
+def test_task_row() -> None:
+    """Ensure a task row keeps the menu columns only and is updated in place."""
+    result = {**task(0, "host1"), "__result": "In progress", "res": {"changed": True}}
+    row = TaskRow(result)
+    assert row["__host"] == "host1"
+    assert row.get("__result") == "In progress"
+    assert "res" not in row
+    with pytest.raises(KeyError, match="res"):
+        row["res"]
+
+    row.update({"__result": "Ok", "res": {}})
+    assert row["__result"] == "Ok"
+    assert row["__number"] == 0
+
+
+def test_task_store() -> None:
+    """Ensure task results are read back from the task store, replaced and closed."""
+    store = TaskStore()
+    tasks: list[Any] = TaskSummaries(artifact=store, play_index=0)
+    for number in range(TASK_CACHE_SIZE + 2):
+        result = {**task(number, "host1"), "res": {"msg": "x" * number}}
+        assert store.add(0, result) == number
+        tasks.append(TaskRow(result))
+
+    assert store.task(0, 1)["res"] == {"msg": "x"}
+    replaced = {**task(1, "host1"), "__result": "Ok"}
+    store.replace(0, 1, replaced)
+    assert store.task(0, 1) is replaced
+
+    results = full_tasks(tasks)
+    assert len(results) == TASK_CACHE_SIZE + 2
+    assert results[1]["__result"] == "Ok"
+    assert results[-1]["res"] == {"msg": "x" * (TASK_CACHE_SIZE + 1)}
+    assert full_tasks([replaced]) == [replaced]
+    store.close()
+
+
+def test_task_store_written_once() -> None:
+    """Ensure a task is written when it finishes and a replaced result reuses its space."""
+    store = TaskStore()
+    result = {**task(0, "host1"), "__result": "In progress"}
+    store.add(0, result)
+    assert store._file is None
+    assert store.task(0, 0) is result
+
+    store.replace(0, 0, {**result, "__result": "Ok"})
+    assert store._file is not None
+    size = store._file.seek(0, 2)
+    for _ in range(10):
+        store.replace(0, 0, {**result, "__result": "Ok"})
+    assert store._file.seek(0, 2) == size
+    store.replace(0, 0, {**result, "__result": "Failed"})
+    assert store._file.seek(0, 2) == size * 2 + 4
+
+    store._tasks.clear()
+    assert store.task(0, 0)["__result"] == "Failed"
+    store.close()
+
+
+def test_task_results_consistent(tmp_path: Path) -> None:
+    """Ensure indexing, slicing and iteration all provide the full task results.
+
+    Args:
+        tmp_path: A temporary directory
+    """
+    path = tmp_path / "artifact.jsonl"
+    write_artifact(path)
+    artifact = IndexedArtifact(path)
+    results = artifact.plays()[0]["tasks"].results()
+
+    assert list(results) == [results[0], results[1]]
+    assert results[:] == list(results)
+    assert results[::-1][0] == results[-1]
+    assert all("res" in result for result in results)
+    assert json.loads(json.dumps(list(results))) == list(results)
+    with pytest.raises(IndexError):
+        results[2]
+    artifact.close()
+
+
+def test_write_json_artifact(tmp_path: Path) -> None:
+    """Ensure a JSON artifact is written a task at a time, in the layout of ``json.dump``.
+
+    Args:
+        tmp_path: A temporary directory
+    """
+    store = TaskStore()
+    tasks: list[Any] = TaskSummaries(artifact=store, play_index=0)
+    results = [{**task(number, "host1"), "res": {"msg": ["é", {}]}} for number in range(3)]
+    for result in results:
+        store.add(0, result)
+        tasks.append(TaskRow(result))
+    artifact = {
+        "version": "2.0.0",
+        "plays": [{**PLAY, "tasks": full_tasks(tasks)}, {**PLAY, "tasks": []}],
+        "stdout": ["PLAY [play]"],
+        **TRAILER,
+    }
+
+    path = tmp_path / "artifact.json"
+    with (
+        patch.object(store, "task", wraps=store.task) as read,
+        path.open("w", encoding="utf-8") as fh,
+    ):
+        write_json_artifact(fh, artifact)
+    assert read.call_count == len(results)
+    store.close()
+
+    expected = {**artifact, "plays": [{**PLAY, "tasks": results}, {**PLAY, "tasks": []}]}
+    written = path.read_text(encoding="utf-8")
+    assert written == json.dumps(expected, indent=4, sort_keys=True, ensure_ascii=False) + "\n"
+    indexed = IndexedArtifact(path)
+    assert len(indexed.plays()[0]["tasks"]) == len(results)
+    indexed.close()
+
+
+def test_write_json_artifact_keys(tmp_path: Path) -> None:
+    """Ensure keys are converted to strings as ``json.dump`` does.
+
+    Args:
+        tmp_path: A temporary directory
+    """
+    artifact = {"plays": [{"tasks": [], "hosts": {1: True, 2.5: None}}], "stdout": []}
+    path = tmp_path / "artifact.json"
+    with path.open("w", encoding="utf-8") as fh:
+        write_json_artifact(fh, artifact)
+    written = path.read_text(encoding="utf-8")
+    assert written == json.dumps(artifact, indent=4, sort_keys=True) + "\n"
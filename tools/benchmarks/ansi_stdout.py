@@ -0,0 +1,116 @@
+"""Benchmark converting ``:stdout`` playbook output into curses lines.
+
+Playbook output with ansible's colors is converted in full, line by line, with
+the previous regular expression based conversion and with the current parser.
+The output is then grown a few lines at a time, the way it is during a live run,
+and converted incrementally.
+
+Usage:
+    python tools/benchmarks/ansi_stdout.py [--lines 200000] [--append 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+
+from itertools import chain
+
+from ansible_navigator.ui_framework.colorize import CURSES_STYLES
+from ansible_navigator.ui_framework.colorize import IncrementalAnsiRender
+from ansible_navigator.ui_framework.colorize import ansi_to_curses
+from ansible_navigator.ui_framework.curses_defs import CursesLine
+from ansible_navigator.ui_framework.curses_defs import CursesLinePart
+
+
+def playbook_output(lines: int) -> list[str]:
+    """Build playbook output with ansible's colors.
+
+    Args:
+        lines: The number of lines
+
+    Returns:
+        The lines of output
+    """
+    templates = (
+        "TASK [Gather the package facts {idx}] " + "*" * 40,
+        "\x1b[0;32mok: [host-{idx}]\x1b[0m",
+        "\x1b[0;33mchanged: [host-{idx}] => (item=package-{idx})\x1b[0m",
+        "\x1b[0;36mskipping: [host-{idx}]\x1b[0m",
+        "",
+    )
+    return [templates[idx % len(templates)].format(idx=idx) for idx in range(lines)]
+
+
+def previous_ansi_to_curses(line: str) -> CursesLine:
+    """Convert a line the way it was done before, compiling and splitting each time.
+
+    Args:
+        line: A string with ansi colors
+
+    Returns:
+        A line ready for presentation in the TUI
+    """
+    if line == "":
+        return CursesLine((CursesLinePart(column=0, string="", color=0, decoration=0),))
+    printable = []
+    ansi_regex = re.compile(r"(\x1b\[[\d;]*m)")
+    color_regex = re.compile(
+        r"\x1b\[(?P<fg_action>(38;5|39);)?(?P<_bg_action>(48;5|49);)?(?P<one>\d+)(;(?P<two>\d+))?m",
+    )
+    parts = ansi_regex.split(line)
+    colno = color = style = 0
+    while parts:
+        part = parts.pop(0)
+        if not part:
+            continue
+        match = color_regex.match(part)
+        if match:
+            one, two = match["one"], match["two"]
+            ansi_16 = list(chain(range(30, 38), range(90, 98)))
+            if not match["fg_action"] and two is not None:
+                color = ansi_16.index(int(two)) if int(two) in ansi_16 else int(two)
+                style = CURSES_STYLES.get(int(one)) or 0
+            elif not match["fg_action"] and one != "0":
+                color = ansi_16.index(int(one)) if int(one) in ansi_16 else int(one)
+        else:
+            printable.append(CursesLinePart(colno, part, color, style))
+            colno += len(part)
+            color = style = 0
+    return CursesLine(tuple(printable))
+
+
+def main() -> None:
+    """Compare the conversions of playbook output."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=200_000, help="lines of output")
+    parser.add_argument("--append", type=int, default=20, help="lines appended at a time")
+    args = parser.parse_args()
+
+    lines = playbook_output(args.lines)
+    for name, convert in (("previous", previous_ansi_to_curses), ("current", ansi_to_curses)):
+        start = time.perf_counter()
+        converted = [convert(line) for line in lines]
+        elapsed = time.perf_counter() - start
+        print(f"{name:>16}: {len(lines) / elapsed:>12,.0f} lines/second {elapsed:>8.3f}s")
+        if name == "previous":
+            previous = converted
+        elif converted != previous:
+            msg = "The conversions disagree"
+            raise SystemExit(msg)
+
+    render = IncrementalAnsiRender()
+    render.render("\n".join(lines))
+    grown = list(lines)
+    refreshes = 50
+    start = time.perf_counter()
+    for _ in range(refreshes):
+        grown.extend(lines[: args.append])
+        render.render("\n".join(grown))
+    elapsed = (time.perf_counter() - start) / refreshes
+    print(f"{'incremental':>16}: {elapsed * 1000:>12,.1f} ms per {args.append} lines appended")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Benchmark rendering tokenized task results into colored line parts.
+
+A large task result, resembling package facts, is serialized to JSON and YAML
+and tokenized once. The previous renderer, building one part per character and
+merging them with ``list.pop(0)``, is then compared with the span based renderer
+over the same lines. The time to show the first screenful with a full render is
+then compared with an incremental render.
+
+Usage:
+    python tools/benchmarks/colorize.py [--packages 5000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from ansible_navigator.constants import GRAMMAR_DIR
+from ansible_navigator.constants import THEME_PATH
+from ansible_navigator.content_defs import ContentView
+from ansible_navigator.content_defs import SerializationFormat
+from ansible_navigator.tm_tokenize.tokenize import tokenize
+from ansible_navigator.ui_framework.colorize import Colorize
+from ansible_navigator.ui_framework.colorize import ColorSchema
+from ansible_navigator.ui_framework.colorize import columns_and_colors
+from ansible_navigator.ui_framework.curses_defs import SimpleLinePart
+from ansible_navigator.utils.serialize import serialize
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ansible_navigator.tm_tokenize.region import Regions
+
+
+SCREEN_LINES = 50
+"""The number of lines on the first screen."""
+
+
+def task_result(packages: int) -> dict[str, Any]:
+    """Build a task result with package facts.
+
+    Args:
+        packages: The number of packages in the result
+
+    Returns:
+        The task result
+    """
+    facts = {
+        f"package-{idx}": [
+            {
+                "arch": "x86_64",
+                "epoch": None,
+                "name": f"package-{idx}",
+                "release": "1.el9",
+                "source": "rpm",
+                "version": "1.0",
+            },
+        ]
+        for idx in range(packages)
+    }
+    return {"ansible_facts": {"packages": facts}, "changed": False, "failed": False}
+
+
+def per_character(
+    lines: list[tuple[Regions, str]],
+    schema: ColorSchema,
+) -> list[list[SimpleLinePart]]:
+    """Render lines the way it was done before, one part per character.
+
+    Args:
+        lines: Lines of text and their regions
+        schema: An instance of the ColorSchema
+
+    Returns:
+        Lines of text, each broken into sections
+    """
+    results = []
+    for regions, text in lines:
+        parts = [SimpleLinePart(chars=char, color=None, column=0, style=None) for char in text]
+        for region in regions:
+            color, style = schema.get_color_and_style(region.scope)
+            if color:
+                for idx in range(region.start, region.end):
+                    parts[idx].color = color
+            if style:
+                for idx in range(region.start, region.end):
+                    parts[idx].style = style
+        grouped = [parts.pop(0)]
+        while parts:
+            entry = parts.pop(0)
+            if entry.color == grouped[-1].color and entry.style == grouped[-1].style:
+                grouped[-1].chars += entry.chars
+            else:
+                grouped.append(entry)
+        results.append(grouped)
+    for result in results:
+        column = 0
+        for part in result:
+            part.column = column
+            column += len(part.chars)
+    return results
+
+
+def measure(
+    name: str,
+    renderer: Callable[[list[tuple[Regions, str]], ColorSchema], list[list[SimpleLinePart]]],
+    lines: list[tuple[Regions, str]],
+    schema: ColorSchema,
+    repeat: int,
+) -> list[list[SimpleLinePart]]:
+    """Render the lines and report the throughput.
+
+    Args:
+        name: The name of the renderer
+        renderer: The renderer
+        lines: Lines of text and their regions
+        schema: An instance of the ColorSchema
+        repeat: The number of times to render the lines
+
+    Returns:
+        The rendered lines
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        rendered = renderer(lines, schema)
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{name:>16}: {len(lines) / elapsed:>12,.0f} lines/second {elapsed:>8.3f}s")
+    return rendered
+
+
+def main() -> None:
+    """Compare the renderers over JSON and YAML task results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--packages", type=int, default=5_000, help="packages in the result")
+    parser.add_argument("--repeat", type=int, default=3, help="renders of each document")
+    args = parser.parse_args()
+
+    colorize = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH)
+    schema = colorize._schema  # noqa: SLF001
+    content = task_result(args.packages)
+
+    for serialization_format, scope in (
+        (SerializationFormat.JSON, "source.json"),
+        (SerializationFormat.YAML, "source.yaml"),
+    ):
+        doc = str(
+            serialize(
+                content=content,
+                content_view=ContentView.NORMAL,
+                serialization_format=serialization_format,
+            ),
+        )
+        compiler = colorize._grammars.compiler_for_scope(scope)  # noqa: SLF001
+        state = compiler.root_state
+        lines: list[tuple[Regions, str]] = []
+        for line_idx, line in enumerate(doc.splitlines()):
+            state, regions = tokenize(compiler, state, f"{line}\n", line_idx == 0)
+            lines.append((regions, f"{line}\n"))
+
+        print(f"{scope} ({len(lines):,} lines)")
+        before = measure("per character", per_character, lines, schema, args.repeat)
+        after = measure("spans", columns_and_colors, lines, schema, args.repeat)
+        if before != after:
+            msg = f"The renderers disagree for {scope}"
+            raise SystemExit(msg)
+
+        for name, render in (
+            ("full", colorize.render.__wrapped__),
+            ("incremental", Colorize.render_incremental),
+        ):
+            start = time.perf_counter()
+            render(colorize, doc, scope)[:SCREEN_LINES]
+            elapsed = time.perf_counter() - start
+            print(f"{name:>16}: {elapsed * 1000:>12,.1f} ms to the first screen")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark running commands with worker processes and with a thread pool.
+
+A number of short commands, standing in for container engine invocations, are
+run with the worker processes fed through manager queues and with the thread
+pool. The time for each includes starting and stopping the workers.
+
+Usage:
+    python tools/benchmarks/command_runner.py [--commands 6] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from ansible_navigator.command_runner import Command
+from ansible_navigator.command_runner import CommandRunner
+
+
+def post_process(command: Command) -> None:
+    """Keep the output of a command.
+
+    Args:
+        command: The command run
+    """
+    command.details = command.stdout_lines
+
+
+def main() -> None:
+    """Compare the command runner backends."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=6, help="commands run at once")
+    parser.add_argument("--repeat", type=int, default=5, help="runs of the commands")
+    args = parser.parse_args()
+
+    for name in ("run_multi_process", "run_multi_thread"):
+        durations: list[float] = []
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            commands = [
+                Command(identity=str(idx), command=f"echo {idx}", post_process=post_process)
+                for idx in range(args.commands)
+            ]
+            results = getattr(CommandRunner(), name)(commands)
+            durations.extend(result.duration for result in results)
+        elapsed = (time.perf_counter() - start) / args.repeat
+        command_time = sum(durations) / len(durations)
+        print(
+            f"{name:>18}: {elapsed * 1000:>8.1f} ms per run"
+            f" {command_time * 1000:>8.1f} ms per command",
+        )
+
+
+if __name__ == "__main__":
+    main()
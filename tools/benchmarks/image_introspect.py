@@ -0,0 +1,223 @@
+"""Benchmark parsing the package lists collected by image introspection.
+
+Output resembling ``rpm -qai`` and ``pip show`` for a large execution environment
+is parsed with the previous parsers, popping lines from the front of lists and
+grouping every package before splitting it, and with the current parsers, which
+read the lines once as they are split. Both must produce the same packages.
+
+Usage:
+    python tools/benchmarks/image_introspect.py [--rpms 3000] [--pips 600]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from ansible_navigator.data.image_introspect import CmdParser
+from ansible_navigator.data.image_introspect import Command
+from ansible_navigator.data.image_introspect import PythonPackages
+from ansible_navigator.data.image_introspect import SystemPackages
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def rpm_output(packages: int) -> str:
+    """Build the output of ``rpm -qai``.
+
+    Args:
+        packages: The number of packages
+
+    Returns:
+        The output
+    """
+    template = (
+        "Name        : package-{idx}\n"
+        "Version     : 1.{idx}\n"
+        "Release     : 1.el9\n"
+        "Architecture: x86_64\n"
+        "Install Date: Mon 01 Jan 2024 00:00:00 AM UTC\n"
+        "Group       : Unspecified\n"
+        "Size        : {idx}000\n"
+        "License     : MIT\n"
+        "Signature   : RSA/SHA256, Mon 01 Jan 2024, Key ID 199e2f91fd431d51\n"
+        "Source RPM  : package-{idx}-1.{idx}-1.el9.src.rpm\n"
+        "Build Date  : Mon 01 Jan 2024 00:00:00 AM UTC\n"
+        "Build Host  : builder.example.com\n"
+        "Packager    : Example <packager@example.com>\n"
+        "Vendor      : Example\n"
+        "URL         : https://example.com/package-{idx}\n"
+        "Summary     : The package number {idx}\n"
+        "Description :\n"
+        "The package number {idx} provides: a library,\n"
+        "the tools using it and their documentation.\n"
+    )
+    return "".join(template.format(idx=idx) for idx in range(packages))
+
+
+def pip_output(packages: int) -> str:
+    """Build the output of ``pip show``.
+
+    Args:
+        packages: The number of packages
+
+    Returns:
+        The output
+    """
+    template = (
+        "Name: package-{idx}\n"
+        "Version: 1.{idx}\n"
+        "Summary: The package number {idx}\n"
+        "Home-page: https://example.com/package-{idx}\n"
+        "Author: Example\n"
+        "Author-email: author@example.com\n"
+        "License: MIT\n"
+        "Location: /usr/lib/python3.11/site-packages\n"
+        "Requires: package-{next_idx}, six\n"
+        "Required-by: \n"
+    )
+    return "---\n".join(
+        template.format(idx=idx, next_idx=idx + 1) for idx in range(packages)
+    ).rstrip("\n")
+
+
+def previous_splitter(
+    lines: list[str],
+    line_split: str,
+    section_delim: str | None = None,
+) -> list[dict[str, Any]] | dict[str, Any]:
+    """Split lines the way it was done before, popping them from the front of the list.
+
+    Args:
+        lines: The lines to split
+        line_split: The delimiter use for splitting each line
+        section_delim: The separator between different packages
+
+    Returns:
+        All lines split on the delimiter
+    """
+    results: list[dict[str, Any]] = []
+    result: dict[str, Any] = {}
+    current_key = ""
+    while lines:
+        line = lines.pop(0)
+        separator_match = re.search(line_split, line)
+        if not separator_match or line.startswith(" "):
+            key, delim, content = "", "", line
+        else:
+            delim = separator_match.group(0)
+            key, content = re.split(delim, line, maxsplit=1)
+        content = CmdParser._strip(content)  # noqa: SLF001
+        if section_delim and line == section_delim:
+            results.append(result)
+            result = {}
+            continue
+        if not delim and current_key:
+            result[current_key] += f" {content}"
+            continue
+        current_key = key.lower().replace("_", "-").strip()
+        if current_key == "description":
+            description = []
+            while lines:
+                line = lines.pop(0)
+                if line == section_delim:
+                    break
+                description.append(line)
+            result[current_key] = " ".join(description) or "No description available"
+            results.append(result)
+            return result
+        result[current_key] = content
+    if result:
+        results.append(result)
+    return results
+
+
+def previous_rpm(output: str) -> list[Any]:
+    """Parse the output of ``rpm -qai`` the way it was done before.
+
+    Args:
+        output: The output
+
+    Returns:
+        The packages
+    """
+    packages = []
+    package: list[str] = []
+    for line in output.splitlines():
+        if re.match(r"^Name\s{2,}:", line) and package:
+            packages.append(package)
+            package = [line]
+        else:
+            package.append(line)
+    if package:
+        packages.append(package)
+    return [previous_splitter(package, line_split=":") for package in packages]
+
+
+def previous_pip(output: str) -> list[Any]:
+    """Parse the output of ``pip show`` the way it was done before.
+
+    Args:
+        output: The output
+
+    Returns:
+        The packages
+    """
+    parsed = previous_splitter(output.splitlines(), line_split=":", section_delim="---")
+    if isinstance(parsed, dict):
+        parsed = [parsed]
+    for pkg in parsed:
+        for entry in ["required-by", "requires"]:
+            pkg[entry] = [p.strip() for p in pkg[entry].split(",")] if pkg[entry] else []
+    return parsed
+
+
+def current(parse: Callable[[Command], None]) -> Callable[[str], Any]:
+    """Adapt a current parser to take the output.
+
+    Args:
+        parse: The parser
+
+    Returns:
+        A function parsing the output
+    """
+
+    def parse_output(output: str) -> Any:
+        command = Command(id_="benchmark", command="", parse=parse, stdout=output)
+        parse(command)
+        return command.details
+
+    return parse_output
+
+
+def main() -> None:
+    """Compare the previous and current parsers."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rpms", type=int, default=3_000, help="system packages")
+    parser.add_argument("--pips", type=int, default=600, help="python packages")
+    args = parser.parse_args()
+
+    for name, output, previous, parse in (
+        ("rpm -qai", rpm_output(args.rpms), previous_rpm, current(SystemPackages().parse)),
+        ("pip show", pip_output(args.pips), previous_pip, current(PythonPackages().parse)),
+    ):
+        print(f"{name} ({len(output.splitlines()):,} lines)")
+        results = []
+        for label, parse_output in (("previous", previous), ("current", parse)):
+            start = time.perf_counter()
+            results.append(parse_output(output))
+            elapsed = time.perf_counter() - start
+            print(f"{label:>16}: {elapsed * 1000:>10,.1f} ms")
+        if results[0] != results[1]:
+            msg = f"The parsers disagree for {name}"
+            raise SystemExit(msg)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark opening a playbook artifact for ``:replay``.
+
+Loading the whole artifact is compared with building the sidecar index on first
+open and reusing it afterwards. Task results carry a large ``res`` payload
+resembling package facts.
+
+Usage:
+    python tools/benchmarks/replay_artifact.py [--tasks 2000] [--packages 500] [--jsonl]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+
+from pathlib import Path
+from typing import Any
+
+from ansible_navigator.content_defs import ContentView
+from ansible_navigator.content_defs import SerializationFormat
+from ansible_navigator.utils.playbook_artifact import ArtifactWriter
+from ansible_navigator.utils.playbook_artifact import IndexedArtifact
+from ansible_navigator.utils.playbook_artifact import load_streaming_artifact
+from ansible_navigator.utils.serialize import serialize_write_file
+
+
+def build_plays(tasks: int, packages: int) -> list[dict[str, Any]]:
+    """Build a play with many large task results.
+
+    Args:
+        tasks: The number of task results
+        packages: The number of packages in each result
+
+    Returns:
+        The plays
+    """
+    facts = {f"package-{idx}": [{"release": "1.el9", "version": "1.0"}] for idx in range(packages)}
+    return [
+        {
+            "__play_name": "all",
+            "name": "all",
+            "uuid": "p1",
+            "tasks": [
+                {
+                    "__changed": False,
+                    "__host": f"host{number}",
+                    "__number": number,
+                    "__result": "Ok",
+                    "play_uuid": "p1",
+                    "res": {"ansible_facts": {"packages": facts}},
+                    "task": "Gather the package facts",
+                }
+                for number in range(tasks)
+            ],
+        },
+    ]
+
+
+def measure(name: str, open_artifact: Any) -> None:
+    """Open the artifact and report the time to the first screen.
+
+    Args:
+        name: The name of the path measured
+        open_artifact: Open the artifact, returning the plays
+    """
+    start = time.perf_counter()
+    plays = open_artifact()
+    elapsed = time.perf_counter() - start
+    print(f"{name:>16}: {elapsed:>8.3f} seconds, {len(plays[0]['tasks'])} tasks")
+
+
+def main() -> None:
+    """Compare the ways to open an artifact."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=2_000, help="task results in the artifact")
+    parser.add_argument("--packages", type=int, default=500, help="packages in each result")
+    parser.add_argument("--jsonl", action="store_true", help="use a streaming artifact")
+    args = parser.parse_args()
+
+    plays = build_plays(args.tasks, args.packages)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / ("artifact.jsonl" if args.jsonl else "artifact.json")
+        if args.jsonl:
+            writer = ArtifactWriter(path)
+            writer.write_all(plays, [])
+            writer.close(trailer={"status": "successful", "status_color": 10})
+        else:
+            serialize_write_file(
+                content={"version": "2.0.0", "plays": plays, "stdout": [], "status": "ok"},
+                content_view=ContentView.NORMAL,
+                file_mode="w",
+                file=path,
+                serialization_format=SerializationFormat.JSON,
+            )
+        print(f"artifact size: {path.stat().st_size / 2**20:,.1f} MiB")
+
+        def full_load() -> list[dict[str, Any]]:
+            if args.jsonl:
+                return load_streaming_artifact(path)["plays"]
+            with path.open(encoding="utf-8") as fh:
+                return json.load(fh)["plays"]
+
+        def indexed() -> list[dict[str, Any]]:
+            artifact = IndexedArtifact(path)
+            plays = artifact.plays()
+            artifact.close()
+            return plays
+
+        measure("full load", full_load)
+        measure("index build", indexed)
+        measure("index reuse", indexed)
+
+
+if __name__ == "__main__":
+    main()
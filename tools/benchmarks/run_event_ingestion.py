@@ -0,0 +1,121 @@
+"""Benchmark the ingestion of runner events by the ``:run`` action.
+
+The event stream is either replayed from a recording or generated. A recording
+is an ansible-runner ``job_events`` directory or a JSON Lines file with one
+runner event per line.
+
+Usage:
+    python tools/benchmarks/run_event_ingestion.py [--events 1000000] [--hosts 2000]
+    python tools/benchmarks/run_event_ingestion.py --recording <artifact_dir>/job_events
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+
+from copy import deepcopy
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from ansible_navigator.actions.run import Action
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def recorded_events(path: Path) -> Iterator[dict[str, Any]]:
+    """Load a recorded event stream.
+
+    Args:
+        path: A job_events directory or a JSON Lines file
+
+    Yields:
+        The recorded runner events, in order
+    """
+    if path.is_dir():
+        files = sorted(path.glob("*.json"), key=lambda f: int(f.name.split("-", 1)[0]))
+        for file in files:
+            yield json.loads(file.read_text(encoding="utf-8"))
+        return
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
+
+def generated_events(count: int, hosts: int) -> Iterator[dict[str, Any]]:
+    """Generate an event stream resembling a many host playbook.
+
+    Each task emits a start and an ok event for every host.
+
+    Args:
+        count: The number of events to generate
+        hosts: The number of hosts targeted by each task
+
+    Yields:
+        Runner events
+    """
+    produced = 0
+    play_uuid = "play-0"
+    yield {"event": "playbook_on_play_start", "event_data": {"name": "play", "uuid": play_uuid}}
+    task_number = 0
+    while produced < count:
+        task_uuid = f"task-{task_number}"
+        yield {
+            "event": "playbook_on_task_start",
+            "event_data": {"task": f"task {task_number}", "task_uuid": task_uuid},
+        }
+        for runner_event in ("start", "ok"):
+            for host in range(hosts):
+                yield {
+                    "event": f"runner_on_{runner_event}",
+                    "event_data": {
+                        "duration": 0.1,
+                        "host": f"host{host}",
+                        "ignore_errors": False,
+                        "play_uuid": play_uuid,
+                        "res": {"changed": False},
+                        "task": f"task {task_number}",
+                        "task_action": "ansible.builtin.debug",
+                        "task_uuid": task_uuid,
+                    },
+                }
+                produced += 1
+                if produced >= count:
+                    return
+        task_number += 1
+
+
+def main() -> None:
+    """Replay the event stream and report the events per second."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=1_000_000, help="events to generate")
+    parser.add_argument("--hosts", type=int, default=2_000, help="hosts per generated task")
+    parser.add_argument("--recording", type=Path, help="a recorded event stream to replay")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    if args.recording:
+        events = list(recorded_events(args.recording))
+    else:
+        events = list(generated_events(args.events, args.hosts))
+
+    action = Action(args=deepcopy(NavigatorConfiguration))
+    start = time.perf_counter()
+    for event in events:
+        action._handle_message(event)  # noqa: SLF001
+    elapsed = time.perf_counter() - start
+
+    print(f"events: {len(events)}")
+    print(f"elapsed: {elapsed:.2f}s")
+    print(f"events/second: {len(events) / elapsed:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
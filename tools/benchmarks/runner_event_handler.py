@@ -0,0 +1,112 @@
+"""Benchmark the ansible-runner event handler used by ``:run``.
+
+The previous deep copy of every event is compared with the ownership transfer
+path, used when job events are not written, and the shallow copy path, used
+when they are. Events carry a large ``res`` payload resembling package facts.
+
+Usage:
+    python tools/benchmarks/runner_event_handler.py [--events 20000] [--packages 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+
+from copy import deepcopy
+from queue import Queue
+from typing import TYPE_CHECKING
+from typing import Any
+
+from ansible_navigator.runner.command_async import CommandAsync
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def large_event(packages: int) -> dict[str, Any]:
+    """Build an event with a package facts result.
+
+    Args:
+        packages: The number of packages in the result
+
+    Returns:
+        The event
+    """
+    facts = {
+        f"package-{idx}": [
+            {
+                "arch": "x86_64",
+                "epoch": None,
+                "release": "1.el9",
+                "source": "rpm",
+                "version": "1.0",
+            },
+        ]
+        for idx in range(packages)
+    }
+    return {
+        "event": "runner_on_ok",
+        "event_data": {
+            "host": "localhost",
+            "res": {"ansible_facts": {"packages": facts}, "changed": False},
+            "task": "Gather the package facts",
+        },
+        "uuid": "4d9e62b2-8b5b-4b4e-9f1a-6c7e6e3e1a2b",
+    }
+
+
+def measure(
+    name: str, handler: Callable[[dict[str, Any]], Any], event_count: int, event: Any
+) -> None:
+    """Run the handler for each event and report the throughput.
+
+    Args:
+        name: The name of the path measured
+        handler: The event handler
+        event_count: The number of events to handle
+        event: The event to handle
+    """
+    start = time.perf_counter()
+    for _ in range(event_count):
+        handler(event.copy())
+    elapsed = time.perf_counter() - start
+    print(f"{name:>16}: {event_count / elapsed:>12,.0f} events/second")
+
+
+def main() -> None:
+    """Compare the event handler paths."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20_000, help="events to handle")
+    parser.add_argument("--packages", type=int, default=2_000, help="packages in each result")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    event = large_event(args.packages)
+
+    queue: Queue[Any] = Queue()
+
+    def deepcopy_handler(event: dict[str, Any]) -> None:
+        queue.put(deepcopy(event))
+        queue.get_nowait()
+
+    measure("deepcopy", deepcopy_handler, max(args.events // 100, 1), event)
+
+    for write_job_events, name in ((False, "transfer"), (True, "shallow copy")):
+        command = CommandAsync(
+            executable_cmd="ansible-playbook",
+            queue=queue,
+            write_job_events=write_job_events,
+        )
+
+        def handler(event: dict[str, Any], command: CommandAsync = command) -> None:
+            command._event_handler(event)  # noqa: SLF001
+            queue.get_nowait()
+
+        measure(name, handler, args.events, event)
+
+
+if __name__ == "__main__":
+    main()